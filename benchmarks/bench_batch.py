@@ -0,0 +1,70 @@
+"""
+Compare constructing many objects one at a time with the batch APIs.
+
+Each object resolves 5 arguments from a config file, env variables and args. The
+time to create all objects is reported for:
+
++ loop: ClassArgInit in __init__, constructing objects one at a time.
++ construct_batch: The same class, constructed within a Batch.
++ resolve_batch: Resolving the arguments of a plain class, then constructing it.
+
+Usage:
+    python benchmarks/bench_batch.py [--rows N]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from arg_init import ClassArgInit, construct_batch, resolve_batch
+
+
+class Target:
+    def __init__(self, arg1=None, arg2=None, arg3=None, arg4=None, arg5=None):
+        ClassArgInit(env_prefix="bench")
+
+
+class Plain:
+    def __init__(self, arg1=None, arg2=None, arg3=None, arg4=None, arg5=None):
+        self.arg1, self.arg2, self.arg3, self.arg4, self.arg5 = arg1, arg2, arg3, arg4, arg5
+
+
+def best_time(func, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=10000)
+    options = parser.parse_args()
+
+    Path("config.yaml").write_text(
+        "Target:\n  arg1: config1\n  arg2: config2\nPlain:\n  arg1: config1\n  arg2: config2\n"
+    )
+    os.environ["BENCH_ARG3"] = "env3"
+    rows = [(None, None, None, index) for index in range(options.rows)]
+
+    results = {
+        "loop": best_time(lambda: [Target(*row) for row in rows]),
+        "construct_batch": best_time(lambda: construct_batch(Target, rows)),
+        "resolve_batch": best_time(
+            lambda: [Plain(**values) for values in resolve_batch(Plain, rows, env_prefix="bench")]
+        ),
+    }
+    loop = results["loop"]
+    print(f"{options.rows} objects")
+    for name, elapsed in results.items():
+        print(f"{name:<16} {elapsed * 1000:8.1f}ms {options.rows / elapsed:>12,.0f}/s {loop / elapsed:6.1f}x")
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        main()
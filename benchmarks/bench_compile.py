@@ -0,0 +1,97 @@
+"""
+Compare resolving arguments using a compiled resolver with the generic path.
+
+For functions with 5, 20 and 100 arguments, each resolved from a config file, env
+variables, argument values or defaults, the time per call is reported for:
+
++ generic: @arg_init, creating an Arg for each argument.
++ compiled: @arg_init(compiled=True).
+
+The time to resolve only, excluding reading the config and binding arguments, is
+also reported for the generic _make_args loop and for the compiled resolver.
+
+Usage:
+    python benchmarks/bench_compile.py [--args 5 20 100] [--calls N]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from arg_init import CONFIG_PRIORITY, FunctionArgInit, arg_init
+from arg_init._compile import compile_resolver
+
+
+def make_function(count):
+    names = [f"arg{index}" for index in range(count)]
+    source = f"def target({', '.join(f'{name}=None' for name in names)}):\n    return {', '.join(names)},\n"
+    namespace = {}
+    exec(source, namespace)
+    return namespace["target"], names
+
+
+def best_time(func, calls, repeat=5):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        times.append(time.perf_counter() - start)
+    return min(times) / calls
+
+
+def resolve_only(names, calls):
+    """Return the time to resolve, with the plan and config section already available."""
+    plan = FunctionArgInit._build_plan(tuple(names), "bench", None)
+    resolver = FunctionArgInit.__new__(FunctionArgInit)
+    resolver._init_resolver(CONFIG_PRIORITY, "bench", env_snapshot=False, result_type="namespace")
+    config = resolver._read_config("config", "target", CONFIG_PRIORITY)
+    arg_values = [None] * len(names)
+
+    def generic():
+        resolver._args = resolver._create_args(plan, {})
+        resolver._make_args(plan, arg_values, config)
+
+    compiled_resolver = compile_resolver(plan, CONFIG_PRIORITY)
+
+    def compiled():
+        compiled_resolver(arg_values, config, os.environ.get)
+
+    return best_time(generic, calls), best_time(compiled, calls)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--args", type=int, nargs="+", default=[5, 20, 100])
+    parser.add_argument("--calls", type=int, default=2000)
+    options = parser.parse_args()
+
+    print(
+        f"{'args':>5} {'generic':>10} {'compiled':>10} {'speedup':>8} {'resolve':>10} {'compiled':>10} {'speedup':>8}"
+    )
+    for count in options.args:
+        target, names = make_function(count)
+        # A quarter of the arguments are set in the config file and a quarter in env variables
+        config_names = names[: count // 4]
+        Path("config.yaml").write_text("target:\n" + "".join(f"  {name}: config\n" for name in config_names))
+        for name in names[count // 4 : count // 2]:
+            os.environ[f"BENCH_{name.upper()}"] = "env"
+        generic = arg_init(env_prefix="bench")(target)
+        compiled = arg_init(env_prefix="bench", compiled=True)(target)
+        assert generic() == compiled()
+        generic_time = best_time(generic, options.calls)
+        compiled_time = best_time(compiled, options.calls)
+        resolve_time, compiled_resolve_time = resolve_only(names, options.calls)
+        print(
+            f"{count:>5} {generic_time * 1e6:>8.1f}us {compiled_time * 1e6:>8.1f}us {generic_time / compiled_time:>7.1f}x"
+            f" {resolve_time * 1e6:>8.1f}us {compiled_resolve_time * 1e6:>8.1f}us"
+            f" {resolve_time / compiled_resolve_time:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        main()
@@ -0,0 +1,68 @@
+"""
+Measure resolving arguments from a conf.d directory of many component config files.
+
+A directory holding one YAML file per component is generated. Reported are the
+time to resolve the arguments of one component from a newly indexed directory,
+from the cached index, and, for comparison, to parse every file in the directory.
+
+Usage:
+    python benchmarks/bench_config_dir.py [--files N]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+from arg_init import FunctionArgInit, clear_config_cache
+
+CONF_D = Path("conf.d")
+
+
+def component0(arg0=None, arg1=None, arg2=None):
+    return FunctionArgInit(config_name=CONF_D).args
+
+
+def best_time(func, repeat=5):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def first_use():
+    clear_config_cache()
+    component0()
+
+
+def parse_all():
+    for path in CONF_D.iterdir():
+        yaml.load(path.read_bytes(), Loader=yaml.CSafeLoader)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--files", type=int, default=500)
+    options = parser.parse_args()
+
+    CONF_D.mkdir()
+    for index in range(options.files):
+        data = {f"component{index}": {f"arg{arg}": f"value{index}_{arg}" for arg in range(20)}}
+        (CONF_D / f"{index:04}-component{index}.yaml").write_text(yaml.safe_dump(data))
+    assert component0().arg0 == "value0_0"
+
+    print(f"{options.files} files")
+    print(f"first use (index):   {best_time(first_use) * 1000:8.2f}ms")
+    print(f"cached index:        {best_time(component0) * 1000:8.3f}ms")
+    print(f"parse all files:     {best_time(parse_all) * 1000:8.2f}ms")
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        main()
@@ -0,0 +1,54 @@
+"""
+Compare reading a config file by parsing it with reading it from the disk cache.
+
+A YAML config file of about 1 MB is generated. The in memory cache is cleared
+before each read, as for a newly started process.
+
+Usage:
+    python benchmarks/bench_disk_cache.py
+"""
+
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+from arg_init import clear_config_cache, set_config_disk_cache
+from arg_init._config import read_config
+
+SECTIONS = 5000
+ARGS_PER_SECTION = 10
+
+
+def best_time(repeat=3):
+    times = []
+    for _ in range(repeat):
+        clear_config_cache()
+        start = time.perf_counter()
+        read_config("config")
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    data = {
+        f"section{section}": {f"arg{arg}": f"value{section}_{arg}" for arg in range(ARGS_PER_SECTION)}
+        for section in range(SECTIONS)
+    }
+    Path("config.yaml").write_text(yaml.safe_dump(data))
+    parse = best_time()
+    set_config_disk_cache(True)
+    read_config("config", use_cache=False)  # Write the cache file
+    cached = best_time()
+    size = Path("__pycache__/config.yaml.arg_init.pickle").stat().st_size
+    print(f"config.yaml: {Path('config.yaml').stat().st_size / 1e6:.1f}MB, cache file: {size / 1e6:.1f}MB")
+    print(f"parse:      {parse * 1000:8.1f}ms")
+    print(f"disk cache: {cached * 1000:8.1f}ms ({parse / cached:.0f}x faster)")
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        main()
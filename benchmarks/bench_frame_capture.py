@@ -0,0 +1,65 @@
+"""
+Benchmark the cost of capturing the calling frame as the call stack grows.
+
+Compares the previous inspect.stack() based capture with capture_frame(), and
+reports the cost of a complete FunctionArgInit construction at each depth.
+Each measurement runs its loop at the bottom of a stack of the given depth.
+
+Usage:
+    python benchmarks/bench_frame_capture.py
+"""
+
+import inspect
+import os
+import tempfile
+import time
+
+from arg_init import FunctionArgInit
+from arg_init._frame import capture_frame
+
+DEPTHS = (1, 10, 50, 100, 200)
+NUMBER = 5000
+REPEAT = 5
+
+
+def stack_capture():
+    return inspect.stack()[1]
+
+
+def frame_capture():
+    return capture_frame(1)
+
+
+def construct(arg1=None, arg2=None, arg3=None):
+    return FunctionArgInit()
+
+
+def at_depth(depth, fn, number):
+    """Call fn number times with depth additional frames on the stack."""
+    if depth:
+        return at_depth(depth - 1, fn, number)
+    start = time.perf_counter()
+    for _ in range(number):
+        fn()
+    return time.perf_counter() - start
+
+
+def measure(depth, fn, number):
+    """Return the cost of a single call to fn in microseconds."""
+    return min(at_depth(depth, fn, number) for _ in range(REPEAT)) / number * 1e6
+
+
+def main():
+    print(f"{'depth':>6} {'inspect.stack (us)':>20} {'capture_frame (us)':>20} {'FunctionArgInit (us)':>22}")
+    for depth in DEPTHS:
+        old = measure(depth, stack_capture, NUMBER // 50)
+        new = measure(depth, frame_capture, NUMBER)
+        full = measure(depth, construct, NUMBER)
+        print(f"{depth:>6} {old:>20.2f} {new:>20.2f} {full:>22.2f}")
+
+
+if __name__ == "__main__":
+    # Run from an empty directory so no config file is discovered
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        main()
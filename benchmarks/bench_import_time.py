@@ -0,0 +1,82 @@
+"""
+Measure the time taken by "import arg_init" using python -X importtime.
+
+Each statement is run in a new interpreter, several times, and the median of the
+total import time reported by -X importtime, for the top level modules imported by
+the statement, is reported. The slowest modules imported are listed for the first statement.
+
+The exit status is 1 if the time to import arg_init exceeds --max-ms, so this can be
+used to prevent regressions.
+
+Usage:
+    python benchmarks/bench_import_time.py [--runs N] [--max-ms MS]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = {
+    "import arg_init": "import arg_init",
+    "first FunctionArgInit": "import arg_init; (lambda arg1=None: arg_init.FunctionArgInit())()",
+    "import decorators": "from arg_init import arg_init",
+}
+
+
+def import_times(statement):
+    """
+    Return the cumulative import time, in microseconds, of each module imported by statement.
+
+    Module names are indented by -X importtime to show the nesting of imports, this is retained.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name[1:].rstrip()] = int(cumulative)
+    return times
+
+
+def top_level_time(times, startup):
+    """Return the total time of modules imported at the top level, excluding those imported at startup."""
+    return sum(time for name, time in times.items() if name.lstrip() == name and name not in startup)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10, help="number of interpreters started for each statement")
+    parser.add_argument("--max-ms", type=float, help="fail if importing arg_init takes longer than this")
+    options = parser.parse_args()
+
+    startup = {name.strip() for name in import_times("pass")}
+    results = {}
+    for label, statement in STATEMENTS.items():
+        runs = [import_times(statement) for _ in range(options.runs)]
+        results[label] = statistics.median(top_level_time(times, startup) for times in runs)
+        print(f"{label:<24} {results[label] / 1000:>8.2f} ms")
+
+    times = import_times(STATEMENTS["import arg_init"])
+    print("\nSlowest modules imported by 'import arg_init' (cumulative):")
+    for name, time in sorted(times.items(), key=lambda item: item[1], reverse=True)[:10]:
+        print(f"  {name.strip():<32} {time / 1000:>8.2f} ms")
+
+    arg_init_ms = (
+        statistics.median(import_times(STATEMENTS["import arg_init"]).get("arg_init", 0) for _ in range(options.runs))
+        / 1000
+    )
+    print(f"\narg_init: {arg_init_ms:.2f} ms")
+    if options.max_ms is not None and arg_init_ms > options.max_ms:
+        print(f"FAIL: import arg_init took longer than {options.max_ms} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Compare the time to parse a large config file with each available parser backend.
+
+A config file of about 1 MB, with many sections, is generated for each format and
+parsed by the default loader, as selected by arg_init, and by the pure Python parser.
+
+Usage:
+    python benchmarks/bench_loaders.py
+"""
+
+import io
+import json
+import time
+import tomllib
+from pathlib import Path
+
+import yaml
+
+from arg_init import _config
+
+SECTIONS = 5000
+ARGS_PER_SECTION = 10
+
+
+def make_data():
+    return {
+        f"section{section}": {f"arg{arg}": f"value{section}_{arg}" for arg in range(ARGS_PER_SECTION)}
+        for section in range(SECTIONS)
+    }
+
+
+def to_toml(data):
+    return "".join(
+        f"[{section}]\n" + "".join(f'{key} = "{value}"\n' for key, value in values.items())
+        for section, values in data.items()
+    )
+
+
+def best_time(loader, contents, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        loader(io.BytesIO(contents))
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    data = make_data()
+    files = {
+        "yaml": yaml.safe_dump(data).encode(),
+        "json": json.dumps(data).encode(),
+        "toml": to_toml(data).encode(),
+    }
+    pure_python = {"yaml": yaml.safe_load, "json": json.load, "toml": tomllib.load}
+    print(f"{'format':<8} {'size':>8} {'pure python':>12} {'default':>12} {'speedup':>8}  default loader")
+    for config_format, contents in files.items():
+        loader = _config._get_loader(Path(f"config.{config_format}"))  # noqa: SLF001
+        pure = best_time(pure_python[config_format], contents)
+        default = best_time(loader, contents)
+        print(
+            f"{config_format:<8} {len(contents) / 1e6:>6.1f}MB {pure * 1000:>10.0f}ms {default * 1000:>10.0f}ms"
+            f" {pure / default:>7.1f}x  {loader.__module__}.{loader.__qualname__}"
+        )
+
+
+if __name__ == "__main__":
+    main()
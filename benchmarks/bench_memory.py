@@ -0,0 +1,77 @@
+"""
+Measure the memory retained by ArgInit instances using tracemalloc.
+
+Reports the bytes retained per ArgInit instance for a function with no arguments,
+and the additional bytes retained per resolved argument, for each result type.
+Argument values are shared objects, so only memory allocated by arg_init is counted.
+
+Usage:
+    python benchmarks/bench_memory.py
+"""
+
+import os
+import tempfile
+import tracemalloc
+
+from arg_init import FunctionArgInit
+
+INSTANCES = 2000
+ARG_COUNT = 20
+RESULT_TYPES = ("box", "namespace")
+
+
+def no_args(result_type):
+    return FunctionArgInit(result_type=result_type)
+
+
+def many_args(  # noqa: PLR0913
+    result_type,
+    a0=0,
+    a1=1,
+    a2=2,
+    a3=3,
+    a4=4,
+    a5=5,
+    a6=6,
+    a7=7,
+    a8=8,
+    a9=9,
+    a10=10,
+    a11=11,
+    a12=12,
+    a13=13,
+    a14=14,
+    a15=15,
+    a16=16,
+    a17=17,
+    a18=18,
+    a19=19,
+):
+    return FunctionArgInit(result_type=result_type)
+
+
+def retained(fn, result_type):
+    """Return the bytes retained per instance created by fn."""
+    fn(result_type)  # Populate the plan cache, so only per instance memory is counted
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [fn(result_type) for _ in range(INSTANCES)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del instances
+    return (after - before) / INSTANCES
+
+
+def main():
+    print(f"{'result_type':>12} {'bytes/instance':>15} {'bytes/argument':>15}")
+    for result_type in RESULT_TYPES:
+        base = retained(no_args, result_type)
+        full = retained(many_args, result_type)
+        print(f"{result_type:>12} {base:>15.0f} {(full - base) / ARG_COUNT:>15.0f}")
+
+
+if __name__ == "__main__":
+    # Run from an empty directory so no config file is discovered
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        main()
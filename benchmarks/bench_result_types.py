@@ -0,0 +1,71 @@
+"""
+Compare the Box and namespace result types.
+
+Reports the latency of attribute and item access, the memory used by each
+result object (excluding the Arg objects it holds, which are the same for both
+result types) and the cost of constructing a FunctionArgInit.
+
+Usage:
+    python benchmarks/bench_result_types.py
+"""
+
+import os
+import tempfile
+import timeit
+import tracemalloc
+
+from box import Box
+
+from arg_init import FunctionArgInit
+
+RESULT_TYPES = ("box", "namespace")
+NUMBER = 200_000
+INSTANCES = 1000
+
+
+def make_args(result_type, arg1=1, arg2=2, arg3=3, arg4=4, arg5=5, arg6=6, arg7=7, arg8=8, arg9=9, arg10=10):
+    return FunctionArgInit(result_type=result_type).args
+
+
+def access_latency(args):
+    """Return the cost of a single attribute and item access in nanoseconds."""
+    attr = min(timeit.repeat(lambda: args.arg5, number=NUMBER, repeat=5)) / NUMBER * 1e9
+    item = min(timeit.repeat(lambda: args["arg5"], number=NUMBER, repeat=5)) / NUMBER * 1e9
+    return attr, item
+
+
+def result_size(result_type):
+    """Return the bytes allocated per result object, excluding the Arg objects."""
+    template = make_args(result_type)
+    factory = Box if result_type == "box" else type(template)
+    items = list(template.items())
+    tracemalloc.start()
+    results = []
+    for _ in range(INSTANCES):
+        result = factory()
+        for name, arg in items:
+            result[name] = arg
+        results.append(result)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size / INSTANCES
+
+
+def construction(result_type):
+    """Return the cost of constructing a FunctionArgInit in microseconds."""
+    return min(timeit.repeat(lambda: make_args(result_type), number=2000, repeat=5)) / 2000 * 1e6
+
+
+def main():
+    print(f"{'result_type':>12} {'attr (ns)':>10} {'item (ns)':>10} {'bytes/result':>13} {'construct (us)':>15}")
+    for result_type in RESULT_TYPES:
+        attr, item = access_latency(make_args(result_type))
+        size = result_size(result_type)
+        print(f"{result_type:>12} {attr:>10.1f} {item:>10.1f} {size:>13.0f} {construction(result_type):>15.2f}")
+
+
+if __name__ == "__main__":
+    # Run from an empty directory so no config file is discovered
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        main()
@@ -0,0 +1,83 @@
+"""
+Compare loading a whole config file with section-selective loading.
+
+A config file with many sections is generated for each format. For each loading
+mode, the time to resolve the arguments of one function from a newly read file,
+and the memory retained by the cached config, is reported.
+
+Usage:
+    python benchmarks/bench_sections.py
+"""
+
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import yaml
+
+from arg_init import FunctionArgInit, clear_config_cache, set_section_loading
+
+SECTIONS = 2000
+ARGS_PER_SECTION = 10
+
+
+def target(arg0=None):
+    return FunctionArgInit().args
+
+
+def write_config(config_format):
+    data = {
+        f"section{section}": {f"arg{arg}": f"value{section}_{arg}" for arg in range(ARGS_PER_SECTION)}
+        for section in range(SECTIONS)
+    }
+    data["target"] = {"arg0": "value"}
+    for path in Path().glob("config.*"):
+        path.unlink()
+    path = Path(f"config.{config_format}")
+    if config_format == "yaml":
+        path.write_text(yaml.safe_dump(data))
+    elif config_format == "json":
+        path.write_text(json.dumps(data))
+    else:
+        path.write_text(
+            "".join(
+                f"[{section}]\n" + "".join(f'{key} = "{value}"\n' for key, value in values.items())
+                for section, values in data.items()
+            )
+        )
+    return path.stat().st_size
+
+
+def measure():
+    """Return the time to resolve the arguments from a newly read file, and the memory retained."""
+    clear_config_cache()
+    start = time.perf_counter()
+    assert target().arg0 == "value"
+    elapsed = time.perf_counter() - start
+    clear_config_cache()
+    tracemalloc.start()
+    target()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return elapsed, retained
+
+
+def main():
+    print(f"{'format':<8} {'size':>8} {'mode':<10} {'time':>10} {'retained':>10}")
+    for config_format in ("yaml", "toml", "json"):
+        size = write_config(config_format)
+        for mode in ("whole", "sections"):
+            set_section_loading(mode == "sections")
+            elapsed, retained = measure()
+            print(
+                f"{config_format:<8} {size / 1e3:>6.0f}KB {mode:<10} {elapsed * 1000:>8.1f}ms {retained / 1e3:>8.0f}KB"
+            )
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        main()
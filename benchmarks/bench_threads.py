@@ -0,0 +1,79 @@
+"""
+Measure constructions per second of a ClassArgInit based class from 1 to N threads.
+
+Each thread constructs objects that resolve their arguments from a config file,
+env variables and args, as thread pool workers would. With the GIL, throughput is
+expected to stay level as threads are added. On a free-threaded build it should
+increase with the number of threads, up to the number of cores, if no lock in
+arg_init serialises the threads.
+
+Usage:
+    python benchmarks/bench_threads.py [--max-threads N] [--duration SECONDS]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from arg_init import ClassArgInit, invalidate_env_snapshots
+
+
+class Worker:
+    def __init__(self, arg1=None, arg2=None, arg3=None, arg4=None, arg5=None):
+        ClassArgInit(env_prefix="bench", env_snapshot=True)
+
+
+def run(threads, duration):
+    """Return the number of constructions per second made by all threads."""
+    counts = [0] * threads
+    start = threading.Barrier(threads + 1)
+    stop = threading.Event()
+
+    def work(index):
+        start.wait()
+        count = 0
+        while not stop.is_set():
+            for _ in range(100):
+                Worker(arg3=index)
+            count += 100
+        counts[index] = count
+
+    pool = [threading.Thread(target=work, args=(index,)) for index in range(threads)]
+    for thread in pool:
+        thread.start()
+    start.wait()
+    began = time.perf_counter()
+    time.sleep(duration)
+    stop.set()
+    for thread in pool:
+        thread.join()
+    return sum(counts) / (time.perf_counter() - began)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--max-threads", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--duration", type=float, default=1.0, help="seconds to run each thread count")
+    options = parser.parse_args()
+
+    Path("config.yaml").write_text("Worker:\n  arg1: config1\n  arg2: config2\n")
+    os.environ["BENCH_ARG4"] = "env4"
+    invalidate_env_snapshots()
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}, {os.cpu_count()} CPUs")
+    print(f"{'threads':>8} {'per second':>12} {'scaling':>8}")
+    single = None
+    for threads in range(1, options.max_threads + 1):
+        rate = run(threads, options.duration)
+        single = single or rate
+        print(f"{threads:>8} {rate:>12,.0f} {rate / single:>7.2f}x")
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        main()
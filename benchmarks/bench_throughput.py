@@ -0,0 +1,256 @@
+"""
+Throughput benchmark suite for FunctionArgInit and ClassArgInit.
+
+Measures the construction rate (constructions per second) while varying one
+dimension at a time from a common baseline:
+
+- number of arguments
+- stack depth
+- use_kwargs on/off
+- each predefined priority sequence
+- config file format (YAML/TOML/JSON)
+- config file size (number of sections)
+- environment size (number of environment variables)
+- config cache enabled/disabled
+
+Results are written as JSON, so runs on different commits can be compared.
+
+Usage:
+    python benchmarks/bench_throughput.py --output results.json
+    python benchmarks/bench_throughput.py --compare baseline.json
+    python benchmarks/bench_throughput.py --quick --filter format
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from arg_init import (
+    ARG_PRIORITY,
+    CONFIG_PRIORITY,
+    ENV_PRIORITY,
+    ClassArgInit,
+    FunctionArgInit,
+    clear_config_cache,
+    set_config_cache_size,
+)
+from arg_init._config import CONFIG_CACHE_SIZE
+
+PRIORITIES = {"config": CONFIG_PRIORITY, "env": ENV_PRIORITY, "arg": ARG_PRIORITY}
+
+BASELINE = {
+    "target": "function",
+    "args": 5,
+    "depth": 0,
+    "use_kwargs": False,
+    "priority": "config",
+    "format": "yaml",
+    "sections": 1,
+    "env_size": 0,
+    "config_cache": True,
+}
+
+DIMENSIONS = {
+    "target": ["function", "class"],
+    "args": [1, 5, 20, 50],
+    "depth": [0, 50, 200],
+    "use_kwargs": [False, True],
+    "priority": list(PRIORITIES),
+    "format": ["none", "yaml", "toml", "json"],
+    "sections": [1, 100, 1000],
+    "env_size": [0, 100, 1000],
+    "config_cache": [True, False],
+}
+
+
+def make_target(kind, arg_count, use_kwargs, priorities):
+    """Return a callable that performs one construction with arg_count arguments."""
+    params = ", ".join(f"arg{index}=None" for index in range(arg_count))
+    kwargs = ", **kwargs" if use_kwargs else ""
+    namespace = {"FunctionArgInit": FunctionArgInit, "ClassArgInit": ClassArgInit, "priorities": priorities}
+    if kind == "function":
+        source = (
+            f"def target({params}{kwargs}):\n"
+            f"    return FunctionArgInit(priorities=priorities, use_kwargs={use_kwargs})\n"
+        )
+        exec(source, namespace)  # noqa: S102
+        return namespace["target"]
+    source = (
+        "class Target:\n"
+        f"    def __init__(self, {params}{kwargs}):\n"
+        f"        ClassArgInit(priorities=priorities, use_kwargs={use_kwargs})\n"
+    )
+    exec(source, namespace)  # noqa: S102
+    return namespace["Target"]
+
+
+def write_config(directory, config_format, section_name, arg_count, sections):
+    """Write a config file containing the target section and sections - 1 other sections."""
+    for path in Path(directory).glob("config.*"):
+        path.unlink()
+    if config_format == "none":
+        return
+    data = {
+        f"section{index}": {f"arg{arg}": f"value{arg}" for arg in range(arg_count)} for index in range(sections - 1)
+    }
+    data[section_name] = {f"arg{arg}": f"value{arg}" for arg in range(arg_count)}
+    path = Path(directory) / f"config.{config_format}"
+    if config_format == "json":
+        path.write_text(json.dumps(data))
+    elif config_format == "yaml":
+        path.write_text(
+            "".join(
+                f"{section}:\n" + "".join(f"  {key}: {value}\n" for key, value in values.items())
+                for section, values in data.items()
+            )
+        )
+    else:
+        path.write_text(
+            "".join(
+                f"[{section}]\n" + "".join(f"{key} = '{value}'\n" for key, value in values.items())
+                for section, values in data.items()
+            )
+        )
+
+
+@contextmanager
+def environment(size):
+    """Add size unrelated environment variables for the duration of the context."""
+    names = [f"ARG_INIT_BENCH_{index}" for index in range(size)]
+    for name in names:
+        os.environ[name] = "value"
+    try:
+        yield
+    finally:
+        for name in names:
+            del os.environ[name]
+
+
+@contextmanager
+def config_cache(enabled):
+    clear_config_cache()
+    set_config_cache_size(CONFIG_CACHE_SIZE if enabled else 0)
+    try:
+        yield
+    finally:
+        set_config_cache_size(CONFIG_CACHE_SIZE)
+
+
+def at_depth(depth, fn):
+    """Call fn with depth additional frames on the stack."""
+    if depth:
+        return at_depth(depth - 1, fn)
+    return fn()
+
+
+def measure(target, depth, duration):
+    """Return the number of constructions per second, best of 3 runs."""
+
+    def run(number):
+        def loop():
+            start = time.perf_counter()
+            for _ in range(number):
+                target()
+            return time.perf_counter() - start
+
+        return at_depth(depth, loop)
+
+    number = 1
+    while run(number) < duration / 10:
+        number *= 2
+    return max(number / run(number) for _ in range(3))
+
+
+def run_case(directory, params, duration):
+    target = make_target(params["target"], params["args"], params["use_kwargs"], PRIORITIES[params["priority"]])
+    section_name = "Target" if params["target"] == "class" else "target"
+    write_config(directory, params["format"], section_name, params["args"], params["sections"])
+    with environment(params["env_size"]), config_cache(params["config_cache"]):
+        return measure(target, params["depth"], duration)
+
+
+def cases(filters):
+    """Yield (case id, params) for each benchmark case."""
+    seen = set()
+    for dimension, values in DIMENSIONS.items():
+        if filters and dimension not in filters:
+            continue
+        for value in values:
+            params = {**BASELINE, dimension: value}
+            case_id = ",".join(f"{key}={params[key]}" for key in BASELINE)
+            if case_id not in seen:
+                seen.add(case_id)
+                yield dimension, case_id, params
+
+
+def metadata():
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],  # noqa: S607
+            capture_output=True,
+            text=True,
+            check=False,
+        ).stdout.strip()
+    except OSError:
+        commit = ""
+    return {
+        "commit": commit,
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def compare(results, baseline_file):
+    baseline = {
+        result["id"]: result["ops_per_sec"] for result in json.loads(Path(baseline_file).read_text())["results"]
+    }
+    print(f"\n{'case':<40} {'baseline':>12} {'current':>12} {'ratio':>7}")
+    for result in results:
+        previous = baseline.get(result["id"])
+        if previous:
+            changed = {key: value for key, value in result["params"].items() if value != BASELINE[key]}
+            label = ", ".join(f"{key}={value}" for key, value in changed.items()) or "baseline"
+            print(
+                f"{label:<40} {previous:>12.0f} {result['ops_per_sec']:>12.0f} {result['ops_per_sec'] / previous:>7.2f}"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--compare", help="compare results with a previous JSON results file")
+    parser.add_argument("--filter", nargs="*", choices=list(DIMENSIONS), help="only vary these dimensions")
+    parser.add_argument("--quick", action="store_true", help="shorter measurements, less accurate")
+    options = parser.parse_args()
+    duration = 0.05 if options.quick else 0.5
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 2000))
+
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        cwd = Path.cwd()
+        os.chdir(directory)
+        try:
+            for dimension, case_id, params in cases(options.filter):
+                ops = run_case(directory, params, duration)
+                results.append({"id": case_id, "dimension": dimension, "params": params, "ops_per_sec": ops})
+                print(f"{dimension:>12} = {params[dimension]!s:<8} {ops:>12.0f} ops/s")
+        finally:
+            os.chdir(cwd)
+
+    if options.output:
+        Path(options.output).write_text(json.dumps({"metadata": metadata(), "results": results}, indent=2))
+    if options.compare:
+        compare(results, options.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,39 @@
 #  pylint: disable=missing-module-docstring
 
+from typing import TYPE_CHECKING, Any
+
 from ._arg_defaults import ArgDefaults
+from ._batch import Batch
 from ._class_arg_init import ClassArgInit
-from ._exceptions import UnsupportedFileFormatError
+from ._config import (
+    clear_config_cache,
+    config_cache_info,
+    invalidate_config_cache,
+    register_loader,
+    set_config_cache_size,
+    set_section_loading,
+    unregister_loader,
+)
+from ._discovery import SearchLocation, config_search_path, set_config_search_path, set_config_ttl
+from ._disk_cache import set_config_disk_cache
+from ._env import EnvSnapshot, get_env_snapshot, invalidate_env_snapshots
+from ._exceptions import ArgConversionError, UnsupportedFileFormatError
 from ._function_arg_init import FunctionArgInit
+from ._lazy_args import LazyArgs
+from ._namespace import ArgsNamespace
+from ._plan import cached_plans, clear_plan_cache, plan_cache_info
 from ._priority import (
     ARG_PRIORITY,
     CONFIG_PRIORITY,
     ENV_PRIORITY,
     Priority,
 )
+from ._timing import Timings, set_timing_hook
+from ._watcher import ConfigWatcher
+
+if TYPE_CHECKING:
+    from ._batch_resolve import construct_batch, resolve_batch
+    from ._decorators import arg_init, class_arg_init
 
 # External API
 __all__ = [
@@ -21,4 +45,51 @@ __all__ = [
     "ENV_PRIORITY",
     "ARG_PRIORITY",
     "UnsupportedFileFormatError",
+    "ArgConversionError",
+    "clear_config_cache",
+    "config_cache_info",
+    "invalidate_config_cache",
+    "set_config_cache_size",
+    "cached_plans",
+    "clear_plan_cache",
+    "plan_cache_info",
+    "EnvSnapshot",
+    "get_env_snapshot",
+    "invalidate_env_snapshots",
+    "arg_init",
+    "class_arg_init",
+    "LazyArgs",
+    "ArgsNamespace",
+    "Timings",
+    "set_timing_hook",
+    "register_loader",
+    "unregister_loader",
+    "SearchLocation",
+    "config_search_path",
+    "set_config_search_path",
+    "set_config_ttl",
+    "set_section_loading",
+    "set_config_disk_cache",
+    "ConfigWatcher",
+    "Batch",
+    "resolve_batch",
+    "construct_batch",
 ]
+
+# Public names defined in modules that are only imported on first use
+_LAZY_MODULES = {
+    "arg_init": "_decorators",
+    "class_arg_init": "_decorators",
+    "resolve_batch": "_batch_resolve",
+    "construct_batch": "_batch_resolve",
+}
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Import the decorators and batch functions on first use."""
+    if name in _LAZY_MODULES:
+        from importlib import import_module  # noqa: PLC0415
+
+        return getattr(import_module(f".{_LAZY_MODULES[name]}", __name__), name)
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
@@ -1,12 +1,15 @@
 """mypy type aliases."""
 
-from collections.abc import Callable
-from typing import Any
+from collections.abc import Callable, Mapping
+from pathlib import Path
+from typing import Any, Literal
 
 from ._arg_defaults import ArgDefaults
 from ._priority import Priority
 
 ClassCallback = Callable[[Any], None]
-Defaults = list[ArgDefaults] | None
+ConfigName = str | Path | list[str | Path] | tuple[str | Path, ...]
+Defaults = list[ArgDefaults] | Mapping[str, ArgDefaults] | None
 LoaderCallback = Callable[[Any], dict[Any, Any]]
 Priorities = tuple[Priority, Priority, Priority, Priority]
+ResultType = Literal["box", "namespace"]
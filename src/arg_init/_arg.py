@@ -1,9 +1,11 @@
 """Class to represent an Argument."""
 
 import logging
-from typing import Any
+from collections.abc import Callable
+from typing import Any, ClassVar, Self
 
 from ._aliases import Priorities
+from ._convert import convert_value
 from ._priority import Priority
 from ._values import Values
 
@@ -11,26 +13,47 @@ logger = logging.getLogger(__name__)
 
 
 class Arg:
-    """Class to represent argument attributes."""
+    """
+    Class to represent argument attributes.
 
-    _mapping = {  # noqa: RUF012
-        Priority.CONFIG: "config",
-        Priority.ENV: "env",
-        Priority.ARG: "arg",
-        Priority.DEFAULT: "default",
+    The values used to resolve the argument may be passed as a Values object or
+    individually, as keywords. They are stored directly in slots, so no Values
+    object is held for each argument.
+    """
+
+    __slots__ = ("_arg", "_config", "_config_name", "_default", "_env", "_env_name", "_name", "_value")
+
+    _mapping: ClassVar[dict[Priority, str]] = {
+        Priority.CONFIG: "_config",
+        Priority.ENV: "_env",
+        Priority.ARG: "_arg",
+        Priority.DEFAULT: "_default",
     }
 
-    def __init__(
+    # Values from these sources are converted to the type of the argument annotation
+    _converted: ClassVar[frozenset[Priority]] = frozenset((Priority.CONFIG, Priority.ENV))
+
+    def __init__(  # noqa: PLR0913
         self,
         name: str,
         env_name: str | None = None,
         config_name: str | None = None,
         values: Values | None = None,
+        *,
+        arg: Any = None,  # noqa: ANN401
+        env: str | None = None,
+        config: Any = None,  # noqa: ANN401
+        default: Any = None,  # noqa: ANN401
     ) -> None:
         self._name = name
         self._env_name = env_name
         self._config_name = config_name
-        self._values = values
+        if values:
+            arg, env, config, default = values.arg, values.env, values.config, values.default
+        self._arg = arg
+        self._env = env
+        self._config = config
+        self._default = default
         self._value = None
 
     def __eq__(self, other: object) -> bool:
@@ -73,21 +96,36 @@ class Arg:
         return self._config_name
 
     @property
-    def values(self) -> Values | None:
+    def values(self) -> Values:
         """Values to use when resolving Arg."""
-        return self._values
+        return Values(arg=self._arg, env=self._env, config=self._config, default=self._default)
 
-    def resolve(self, name: str, priority_order: Priorities) -> object | None:
-        """Resolve the value Arg using the selected priority system."""
-        logger.debug("Resolving value for %s", repr(self))
+    def resolve(
+        self,
+        name: str,
+        priority_order: Priorities,
+        convert: Callable[[Any], Any] | None = None,
+    ) -> Self:
+        """
+        Resolve the value Arg using the selected priority system.
+
+        If a converter is passed, a value resolved from config or env is converted by it.
+        This is called for every argument, so logging is checked once, up front,
+        to avoid any formatting cost when debug logging is disabled.
+        """
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Resolving value for %r", self)
         for priority in priority_order:
-            logger.debug("Checking %s value", priority)
             value = self._get_value(priority)
             if value is not None:
-                logger.debug("Resolved %s = %s from %s", name, value, priority)
+                if convert is not None and priority in self._converted:
+                    value = convert_value(convert, name, value, priority.name.lower())
+                if debug:
+                    logger.debug("Resolved %s = %s from %s", name, value, priority)
                 self._value = value
                 break
         return self
 
     def _get_value(self, priority: Priority) -> Any | None:  # noqa: ANN401
-        return getattr(self._values, self._mapping[priority])
+        return getattr(self, self._mapping[priority])
@@ -1,10 +1,10 @@
-"""Dataclass torepresent argument defaults that may be overridden on a per argument basis."""
+"""Dataclass to represent argument defaults that may be overridden on a per argument basis."""
 
 from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class ArgDefaults:
     """Dataclass to represent argument defaults that may be overridden on a per argument basis."""
 
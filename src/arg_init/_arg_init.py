@@ -5,22 +5,37 @@ processed attribute values.
 import logging
 from abc import ABC, abstractmethod
 from collections.abc import Mapping
-from inspect import ArgInfo, FrameInfo, stack
+from inspect import CO_VARARGS, CO_VARKEYWORDS
 from os import environ
 from pathlib import Path
-from typing import Any
+from time import perf_counter_ns
+from types import CodeType, FrameType
+from typing import TYPE_CHECKING, Any, Self
 
-from box import Box
-
-from ._aliases import Defaults, Priorities
+from ._aliases import ConfigName, Defaults, Priorities, ResultType
 from ._arg import Arg
 from ._arg_defaults import ArgDefaults
-from ._config import read_config
+from ._batch import BatchEnv, current_batch
+from ._compile import Resolver
+from ._config import copy_section, find_config, read_config, read_config_file, read_layered_config
+from ._convert import Converter, make_converters
 from ._enums import UseKWArgs
+from ._env import EnvSnapshot, get_env_snapshot
+from ._frame import capture_frame
+from ._lazy_args import LazyArgs
+from ._namespace import ArgsNamespace, namespace_class
+from ._plan import ResolutionPlan, cache_plan, get_frame_hints, index_defaults, lookup_plan
 from ._priority import DEFAULT_PRIORITY, Priority
-from ._values import Values
+from ._timing import Timings, new_timings, report_timings
+from ._watcher import watched_config
+
+if TYPE_CHECKING:
+    from box import Box
+
+    Args = Box | LazyArgs | ArgsNamespace
 
 logger = logging.getLogger(__name__)
+RESULT_TYPES = ("box", "namespace")
 
 
 class ArgInit(ABC):
@@ -29,6 +44,8 @@ class ArgInit(ABC):
     environment variables or default values.
     """
 
+    __slots__ = ("_args", "_env_prefix", "_env_snapshot", "_lazy", "_priorities", "_result_type", "_timings")
+
     STACK_LEVEL_OFFSET = 0  # Overridden by concrete class
 
     def __init__(  # noqa: PLR0913
@@ -37,38 +54,162 @@ class ArgInit(ABC):
         env_prefix: str | None = None,
         use_kwargs: UseKWArgs = UseKWArgs.FALSE,
         defaults: Defaults = None,
-        config_name: str | Path = "config",
+        config_name: ConfigName = "config",
+        *,
+        frame: FrameType | None = None,
+        stacklevel: int = 1,
+        env_snapshot: bool = False,
+        lazy: bool = False,
+        result_type: ResultType = "box",
         **kwargs: Any,  # noqa: ANN401 ARG002
     ) -> None:
+        self._init_resolver(priorities, env_prefix, env_snapshot=env_snapshot, lazy=lazy, result_type=result_type)
+        timings = self._timings
+        if timings:
+            start = perf_counter_ns()
+        if frame is None:
+            frame = capture_frame(self.STACK_LEVEL_OFFSET + stacklevel - 1)
+        if timings:
+            timings.frame_capture = perf_counter_ns() - start
+        name = self._get_name(frame)
+        config_data = self._read_config(config_name, name, priorities)
+        self._init_args(name, frame, use_kwargs, defaults, config_data)
+        if timings:
+            start = perf_counter_ns()
+            self._post_init(frame)
+            timings.attribute_setting = perf_counter_ns() - start
+            report_timings(timings, name)
+        else:
+            self._post_init(frame)
+
+    @classmethod
+    async def create_async(cls, *args: Any, stacklevel: int = 1, **kwargs: Any) -> Self:  # noqa: ANN401
+        """
+        Create an instance, without blocking the event loop.
+
+        The frame of the calling coroutine is captured, then config discovery, parsing
+        and resolution are performed in the default executor. The arguments are those
+        of the class. This must be awaited directly by the function, or method, whose
+        arguments are resolved.
+        """
+        import asyncio  # noqa: PLC0415
+
+        frame = capture_frame(stacklevel)
+        return await asyncio.to_thread(cls, *args, frame=frame, **kwargs)
+
+    @classmethod
+    def _from_plan(  # noqa: PLR0913
+        cls,
+        name: str,
+        plan: ResolutionPlan,
+        arg_values: list[Any],
+        kwargs: dict[str, Any],
+        *,
+        priorities: Priorities,
+        env_prefix: str | None,
+        defaults: Defaults,
+        config_name: ConfigName,
+        env_snapshot: bool,
+        result_type: ResultType = "box",
+    ) -> Self:
+        """
+        Create an instance from argument values that have already been captured.
+
+        No frame inspection is performed. This is used by the decorators, which
+        build the plan when the function is decorated.
+        """
+        self = cls.__new__(cls)
+        self._init_resolver(priorities, env_prefix, env_snapshot=env_snapshot, result_type=result_type)
+        config = self._read_config(config_name, name, priorities)
+        logger.debug("Creating arguments for: %s", name)
+        self._args = self._create_args(plan, kwargs)
+        self._make_args(plan, arg_values, config)
+        if kwargs:
+            self._make_args(self._build_plan(tuple(kwargs), env_prefix, defaults), list(kwargs.values()), config)
+        if self._timings:
+            report_timings(self._timings, name)
+        return self
+
+    @classmethod
+    def _resolve_compiled(  # noqa: PLR0913
+        cls,
+        name: str,
+        resolver: Resolver,
+        arg_values: list[Any],
+        *,
+        priorities: Priorities,
+        env_prefix: str | None,
+        config_name: ConfigName,
+        env_snapshot: bool,
+    ) -> tuple[Any, ...]:
+        """
+        Return the resolved values of arguments, using a resolver compiled from the plan.
+
+        As _from_plan, but only the values are returned, no Arg objects are created.
+        """
+        self = cls.__new__(cls)
+        self._init_resolver(priorities, env_prefix, env_snapshot=env_snapshot)
+        config = self._read_config(config_name, name, priorities)
+        env_get = self._env_snapshot.get if self._env_snapshot else environ.get
+        timings = self._timings
+        if timings is None:
+            return resolver(arg_values, config, env_get)
+        start = perf_counter_ns()
+        values = resolver(arg_values, config, env_get)
+        timings.resolution = perf_counter_ns() - start
+        report_timings(timings, name)
+        return values
+
+    def _init_resolver(
+        self,
+        priorities: Priorities,
+        env_prefix: str | None,
+        *,
+        env_snapshot: bool,
+        lazy: bool = False,
+        result_type: ResultType = "box",
+    ) -> None:
+        if result_type not in RESULT_TYPES:
+            msg = f"Unsupported result_type: {result_type}"
+            raise ValueError(msg)
         self._env_prefix = env_prefix
         self._priorities = priorities
-        self._args = Box()
-        calling_stack = stack()[self.STACK_LEVEL_OFFSET]
-        name = self._get_name(calling_stack)
-        config_data = self._read_config(config_name, name, priorities)
-        self._init_args(name, calling_stack, use_kwargs, defaults, config_data)
-        self._post_init(calling_stack)
+        batch = current_batch()
+        if batch:
+            self._env_snapshot: EnvSnapshot | BatchEnv | None = batch.env
+        else:
+            self._env_snapshot = get_env_snapshot(env_prefix) if env_snapshot else None
+        self._lazy = lazy
+        self._result_type = result_type
+        self._timings = new_timings()
+
+    def _create_args(self, plan: ResolutionPlan, kwargs: dict[str, Any]) -> "Args":
+        """Return the object used to hold the resolved arguments."""
+        if self._lazy:
+            return LazyArgs(self._make_arg)
+        if self._result_type == "namespace":
+            return namespace_class(plan.names + tuple(kwargs) if kwargs else plan.names)()
+        from box import Box  # noqa: PLC0415
+
+        return Box()
 
     @property
-    def args(self) -> Box:
+    def args(self) -> "Args":
         """Return the processed arguments."""
         return self._args
 
     @abstractmethod
-    def _get_arguments(self, frame: object, use_kwargs: UseKWArgs) -> dict[str, object]:
-        """
-        Return a dictionary containing key value pairs of all
-        named arguments and their values associated with the frame.
-        """
+    def _get_argument_names(self, code: CodeType) -> tuple[str, ...]:
+        """Return the names of all named arguments of the code object."""
         raise RuntimeError  # pragma no cover
 
     @abstractmethod
-    def _get_name(self, calling_stack: FrameInfo) -> str:
+    def _get_name(self, frame: FrameType) -> str:
         """Return the name of the item having arguments initialised."""
         raise RuntimeError  # pragma no cover
 
     @abstractmethod
-    def _post_init(self, calling_stack: FrameInfo) -> None:
+    def _post_init(self, frame: FrameType) -> None:
         """
         Class specific post initialisation actions.
 
@@ -78,49 +219,139 @@ class ArgInit(ABC):
     def _init_args(  # noqa: PLR0913
         self,
         name: str,
-        calling_stack: FrameInfo,
+        frame: FrameType,
         use_kwargs: UseKWArgs,
         defaults: Defaults,
         config: dict[Any, Any],
     ) -> None:
         """Resolve argument values."""
         logger.debug("Creating arguments for: %s", name)
-        arguments = self._get_arguments(calling_stack.frame, use_kwargs)
-        self._make_args(arguments, defaults, config)
+        plan = self._get_plan(frame, defaults)
+        kwargs = self._get_kwargs(frame, use_kwargs)
+        self._args = self._create_args(plan, kwargs)
+        arguments = frame.f_locals
+        self._make_args(plan, [arguments.get(arg_name) for arg_name in plan.names], config)
+        if kwargs:
+            self._make_args(self._build_plan(tuple(kwargs), self._env_prefix, defaults), list(kwargs.values()), config)
 
-    def _get_kwargs(self, arginfo: ArgInfo, use_kwargs: UseKWArgs) -> dict[Any, Any]:
+    def _get_kwargs(self, frame: FrameType, use_kwargs: UseKWArgs) -> dict[Any, Any]:
         """
         Return a dictionary containing kwargs to be resolved.
 
         Returns an empty dictionary if use_kwargs=False
         """
-        if use_kwargs and arginfo.keywords:
-            keywords = arginfo.keywords
-            logger.debug("Adding kwargs: %s", arginfo.locals[keywords])
-            return dict(arginfo.locals[keywords].items())
+        code = frame.f_code
+        if use_kwargs and code.co_flags & CO_VARKEYWORDS:
+            index = code.co_argcount + code.co_kwonlyargcount + bool(code.co_flags & CO_VARARGS)
+            kwargs = frame.f_locals[code.co_varnames[index]]
+            logger.debug("Adding kwargs: %s", kwargs)
+            return dict(kwargs.items())
         return {}
 
-    def _make_args(self, arguments: dict[Any, Any], defaults: Defaults, config: Mapping[Any, Any]) -> None:
-        for name, value in arguments.items():
-            arg_defaults = self._get_arg_defaults(name, defaults)
-            config_name = self._get_config_name(name, arg_defaults)
-            env_name = self._get_env_name(self._env_prefix, name, arg_defaults)
-            default_value = self._get_default_value(arg_defaults)
-            values = Values(
-                arg=value,
-                env=self._get_env_value(env_name),
-                config=self._get_config_value(config, config_name),
-                default=default_value,
-            )
-            self._args[name] = Arg(name, env_name, config_name, values).resolve(name, self._priorities)
-
-    def _get_arg_defaults(self, name: str, defaults: Defaults) -> ArgDefaults | None:
-        """Check if any defaults exist for the named arg."""
-        if defaults:
-            for arg_defaults in defaults:
-                if arg_defaults.name == name:
-                    return arg_defaults
-        return None
+    def _get_plan(self, frame: FrameType, defaults: Defaults) -> ResolutionPlan:
+        """Return the resolution plan for the call site, building it on first use."""
+        code = frame.f_code
+        key, plan = lookup_plan(type(self), code, self._env_prefix, defaults, self._priorities)
+        if plan is None:
+            hints = get_frame_hints(frame)
+            plan = self._build_plan(self._get_argument_names(code), self._env_prefix, defaults, hints)
+            cache_plan(key, defaults, plan)
+        return plan
+
+    @classmethod
+    def _build_plan(
+        cls,
+        names: tuple[str, ...],
+        env_prefix: str | None,
+        defaults: Defaults,
+        hints: Mapping[str, Any] | None = None,
+    ) -> ResolutionPlan:
+        """
+        Build the resolution plan for the named arguments.
+
+        hints are the annotations of the arguments, used to build the converter of
+        each argument.
+        """
+        index = index_defaults(defaults)
+        all_arg_defaults = [index.get(name) for name in names]
+        return ResolutionPlan(
+            names=names,
+            env_names=tuple(
+                cls._get_env_name(env_prefix, name, arg_defaults)
+                for name, arg_defaults in zip(names, all_arg_defaults, strict=True)
+            ),
+            config_names=tuple(
+                cls._get_config_name(name, arg_defaults)
+                for name, arg_defaults in zip(names, all_arg_defaults, strict=True)
+            ),
+            default_values=tuple(cls._get_default_value(arg_defaults) for arg_defaults in all_arg_defaults),
+            converters=make_converters(names, hints),
+        )
+
+    def _make_args(self, plan: ResolutionPlan, arg_values: list[Any], config: Mapping[Any, Any]) -> None:
+        if isinstance(self._args, LazyArgs):
+            self._args.add(plan, arg_values, config)
+            return
+        make_arg = self._make_timed_arg if self._timings else self._make_arg
+        for name, env_name, config_name, default_value, value, convert in zip(
+            plan.names,
+            plan.env_names,
+            plan.config_names,
+            plan.default_values,
+            arg_values,
+            plan.converters,
+            strict=True,
+        ):
+            self._args[name] = make_arg(name, env_name, config_name, default_value, value, config, convert)
+
+    def _make_arg(  # noqa: PLR0913
+        self,
+        name: str,
+        env_name: str,
+        config_name: str,
+        default_value: Any,  # noqa: ANN401
+        value: Any,  # noqa: ANN401
+        config: Mapping[Any, Any],
+        convert: Converter | None = None,
+    ) -> Arg:
+        return Arg(
+            name,
+            env_name,
+            config_name,
+            arg=value,
+            env=self._get_env_value(env_name),
+            config=self._get_config_value(config, config_name),
+            default=default_value,
+        ).resolve(name, self._priorities, convert)
+
+    def _make_timed_arg(  # noqa: PLR0913
+        self,
+        name: str,
+        env_name: str,
+        config_name: str,
+        default_value: Any,  # noqa: ANN401
+        value: Any,  # noqa: ANN401
+        config: Mapping[Any, Any],
+        convert: Converter | None = None,
+    ) -> Arg:
+        """Make the Arg, as _make_arg, recording the time spent in each phase."""
+        timings: Timings = self._timings  # type: ignore[assignment]
+        start = perf_counter_ns()
+        env = self._get_env_value(env_name)
+        resolve_start = perf_counter_ns()
+        arg = Arg(
+            name,
+            env_name,
+            config_name,
+            arg=value,
+            env=env,
+            config=self._get_config_value(config, config_name),
+            default=default_value,
+        ).resolve(name, self._priorities, convert)
+        end = perf_counter_ns()
+        timings.env_lookup += resolve_start - start
+        timings.resolution += end - resolve_start
+        return arg
 
     @staticmethod
     def _get_alt_name(arg_defaults: ArgDefaults | None) -> str | None:
@@ -148,23 +379,22 @@ class ArgInit(ABC):
 
     @staticmethod
     def _get_value(name: str, dictionary: Mapping[Any, Any]) -> str | None:
-        """Read the env value."""
-        if name in dictionary:
-            value = dictionary[name]
-            logger.debug("Not found: %s=%s", name, value)
-            return value
-        logger.debug("%s not set", name)
-        return None
+        """
+        Read the value from dictionary, or None if not present.
+
+        This is called for every argument, so nothing is logged here. The values
+        found are logged, if enabled, by Arg.resolve().
+        """
+        return dictionary.get(name)
 
     @classmethod
     def _get_config_value(cls, config: Mapping[Any, Any], name: str) -> object:
-        logger.debug("Searching config for: %s", name)
         return cls._get_value(name, config)
 
-    @classmethod
-    def _get_env_value(cls, name: str) -> str | None:
-        logger.debug("Searching environment for: %s", name)
-        return cls._get_value(name, environ)
+    def _get_env_value(self, name: str) -> str | None:
+        if self._env_snapshot:
+            return self._env_snapshot.get(name)
+        return self._get_value(name, environ)
 
     @staticmethod
     def _get_default_value(arg_defaults: ArgDefaults | None) -> object:
@@ -174,17 +404,52 @@ class ArgInit(ABC):
 
     def _read_config(
         self,
-        config_name: str | Path,
+        config_name: ConfigName,
         section_name: str,
         priorities: Priorities,
     ) -> dict[Any, Any]:
+        """
+        Return the section of the config used by this instance.
+
+        Config files are cached and shared, so the section is copied.
+        """
         if Priority.CONFIG in priorities:
-            config = read_config(config_name)
+            if isinstance(config_name, list | tuple):
+                config = read_layered_config(config_name, self._get_config)
+            else:
+                config = self._get_config(config_name)
             logger.debug("Checking for section '%s' in config file", section_name)
-            if config and section_name in config:
-                logger.debug("config=%s", config[section_name])
-                return config[section_name]
+            # get, rather than checking for the section first, as a section can be removed
+            # if the file is modified after it was indexed. A file or section that is not a
+            # mapping, e.g. a YAML list, has no sections or values.
+            section = config.get(section_name) if isinstance(config, Mapping) else None
+            if isinstance(section, Mapping):
+                section = copy_section(section)
+                logger.debug("config=%s", section)
+                return section
             logger.debug("No section '%s' data found", section_name)
             return {}
         logger.debug("skipping file based config based on priorities")
         return {}
+
+    def _get_config(self, config_name: str | Path) -> Mapping[Any, Any] | None:
+        """Return the data of a config file, from a ConfigWatcher, the current Batch or the config cache."""
+        config = watched_config(config_name)
+        if config is None:
+            batch = current_batch()
+            config = batch.config(config_name, self._load_config) if batch else self._load_config(config_name)
+        return config
+
+    def _load_config(self, config_name: str | Path) -> Mapping[Any, Any] | None:
+        timings = self._timings
+        if timings is None:
+            return read_config(config_name)
+        start = perf_counter_ns()
+        path = find_config(config_name)
+        timings.config_discovery += perf_counter_ns() - start
+        if path is None:
+            return None
+        start = perf_counter_ns()
+        config = read_config_file(path)
+        timings.config_parse += perf_counter_ns() - start
+        return config
@@ -0,0 +1,75 @@
+"""
+Batches, within which config files and environment variables are read once.
+
+Within a batch, ClassArgInit/FunctionArgInit and decorated functions share the config
+data, and the values of environment variables, read by the first to use them. Creating
+many objects then only resolves the argument values of each, without checking the
+config file for changes, or reading os.environ, each time.
+
+The config files and environment are assumed not to change during a batch. A batch
+is held in a context variable, so applies only to the thread, or asyncio task, that
+entered it.
+"""
+
+from collections.abc import Callable, Mapping
+from contextvars import ContextVar, Token
+from os import environ
+from pathlib import Path
+from typing import Any, Self
+
+
+class BatchEnv:
+    """Environment variables, each read from os.environ when first used in the batch."""
+
+    __slots__ = ("_values",)
+
+    def __init__(self) -> None:
+        self._values: dict[str, str | None] = {}
+
+    def get(self, name: str) -> str | None:
+        """Return the value of the environment variable, or None if not set."""
+        try:
+            return self._values[name]
+        except KeyError:
+            value = self._values[name] = environ.get(name)
+            return value
+
+
+class Batch:
+    """
+    Context manager sharing config data and environment variables between all arguments resolved within it.
+
+    A batch may be entered more than once, including by nested with statements.
+    """
+
+    __slots__ = ("_configs", "_tokens", "env")
+
+    def __init__(self) -> None:
+        self._configs: dict[str | Path, Mapping[Any, Any] | None] = {}
+        self._tokens: list[Token[Batch | None]] = []
+        self.env = BatchEnv()
+
+    def config(
+        self, config_name: str | Path, load: Callable[[str | Path], Mapping[Any, Any] | None]
+    ) -> Mapping[Any, Any] | None:
+        """Return the config data for config_name, loading it using load() on first use."""
+        try:
+            return self._configs[config_name]
+        except KeyError:
+            config = self._configs[config_name] = load(config_name)
+            return config
+
+    def __enter__(self) -> Self:
+        self._tokens.append(_current.set(self))
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        _current.reset(self._tokens.pop())
+
+
+_current: ContextVar[Batch | None] = ContextVar("arg_init_batch", default=None)
+
+
+def current_batch() -> Batch | None:
+    """Return the batch entered by the current context, if any."""
+    return _current.get()
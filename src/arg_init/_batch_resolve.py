@@ -0,0 +1,152 @@
+"""
+Resolve the arguments of many calls of a function, or of a class, in one pass.
+
+The work that does not depend on the argument values of a call is done once per
+batch: the config section is read, and the config, env and default values of each
+argument are looked up, once. Each argument is then reduced to either a fixed value,
+if a priority before Priority.ARG has a value, or to a fallback used when the
+argument value of a call is None. Resolving each row is then a single pass over its
+argument values.
+"""
+
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from copy import deepcopy
+from inspect import Parameter, signature
+from typing import Any, NamedTuple
+
+from ._aliases import ConfigName, Defaults, Priorities
+from ._arg_init import ArgInit
+from ._batch import Batch
+from ._config import MUTABLE_TYPES
+from ._convert import convert_value, get_hints
+from ._function_arg_init import FunctionArgInit
+from ._priority import DEFAULT_PRIORITY, Priority
+
+Row = Sequence[Any] | Mapping[str, Any]
+
+_VARIADIC = (Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD)
+_POSITIONAL = (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD)
+
+
+class _ArgResolver(NamedTuple):
+    """How to resolve an argument from its value in a row."""
+
+    name: str
+    uses_arg: bool  # False if the value is fixed, regardless of the argument value
+    value: Any  # The fixed value, or the fallback used if the argument value is None
+    copy: bool  # True if the value is mutable, so each row is given its own copy
+
+
+def _get_parameters(target: Callable[..., Any]) -> tuple[str, list[Parameter], dict[str, Any]]:
+    """
+    Return the config section name, the named parameters and the annotations of a
+    function, or of the __init__ of a class.
+    """
+    if isinstance(target, type):
+        init = target.__init__  # type: ignore[misc]
+        return target.__name__, list(signature(init).parameters.values())[1:], get_hints(init)
+    return target.__name__, list(signature(target).parameters.values()), get_hints(target)
+
+
+def _make_resolvers(  # noqa: PLR0913
+    resolver: ArgInit,
+    names: tuple[str, ...],
+    priorities: Priorities,
+    config: Mapping[Any, Any],
+    defaults: Defaults,
+    hints: Mapping[str, Any],
+) -> list[_ArgResolver]:
+    plan = resolver._build_plan(names, resolver._env_prefix, defaults, hints)  # noqa: SLF001
+    resolvers = []
+    for name, env_name, config_name, default_value, convert in zip(
+        plan.names, plan.env_names, plan.config_names, plan.default_values, plan.converters, strict=True
+    ):
+        uses_arg = False
+        value = None
+        for priority in priorities:
+            if priority == Priority.ARG:
+                uses_arg = True
+                continue
+            if priority == Priority.CONFIG:
+                value = resolver._get_config_value(config, config_name)  # noqa: SLF001
+            elif priority == Priority.ENV:
+                value = resolver._get_env_value(env_name)  # noqa: SLF001
+            else:
+                value = default_value
+            if value is not None:
+                if convert is not None and priority in (Priority.CONFIG, Priority.ENV):
+                    value = convert_value(convert, name, value, priority.name.lower())
+                break
+        resolvers.append(_ArgResolver(name, uses_arg, value, isinstance(value, MUTABLE_TYPES)))
+    return resolvers
+
+
+def resolve_batch(  # noqa: PLR0913
+    target: Callable[..., Any],
+    rows: Iterable[Row],
+    *,
+    priorities: Priorities = DEFAULT_PRIORITY,
+    env_prefix: str | None = None,
+    defaults: Defaults = None,
+    config_name: ConfigName = "config",
+    env_snapshot: bool = False,
+) -> list[dict[str, Any]]:
+    """
+    Resolve the named arguments of target for each row of argument values.
+
+    target is a function, or a class whose __init__ arguments are resolved. Each row
+    is a sequence of positional argument values or a mapping of argument name to
+    value. Arguments not in a row take their default value from the signature, as
+    they would when calling target. Returns a dict of resolved values for each row.
+    """
+    section_name, params, hints = _get_parameters(target)
+    params = [param for param in params if param.kind not in _VARIADIC]
+    names = tuple(param.name for param in params)
+    name_set = set(names)
+    max_positional = sum(param.kind in _POSITIONAL for param in params)
+    param_defaults = [param.default for param in params]
+    required = any(default is Parameter.empty for default in param_defaults)
+
+    resolver = FunctionArgInit.__new__(FunctionArgInit)
+    resolver._init_resolver(priorities, env_prefix, env_snapshot=env_snapshot)  # noqa: SLF001
+    config = resolver._read_config(config_name, section_name, priorities)  # noqa: SLF001
+    resolvers = _make_resolvers(resolver, names, priorities, config, defaults, hints)
+
+    results = []
+    for row in rows:
+        if isinstance(row, Mapping):
+            unknown = row.keys() - name_set
+            if unknown:
+                msg = f"{section_name}() got unexpected arguments: {', '.join(sorted(unknown))}"
+                raise TypeError(msg)
+            values = [row.get(name, default) for name, default in zip(names, param_defaults, strict=True)]
+        else:
+            if len(row) > max_positional:
+                msg = f"{section_name}() takes {max_positional} positional arguments but {len(row)} were given"
+                raise TypeError(msg)
+            values = [*row, *param_defaults[len(row) :]]
+        if required:
+            missing = [name for name, value in zip(names, values, strict=True) if value is Parameter.empty]
+            if missing:
+                msg = f"{section_name}() missing required arguments: {', '.join(missing)}"
+                raise TypeError(msg)
+        resolved = {}
+        for arg, value in zip(resolvers, values, strict=True):
+            if value is None or not arg.uses_arg:
+                value = deepcopy(arg.value) if arg.copy else arg.value  # noqa: PLW2901
+            resolved[arg.name] = value
+        results.append(resolved)
+    return results
+
+
+def construct_batch(target: Callable[..., Any], rows: Iterable[Row]) -> list[Any]:
+    """
+    Call target with each row of argument values, within a Batch.
+
+    target is a function, or a class, that resolves its own arguments, using
+    ClassArgInit/FunctionArgInit or a decorator. Each row is a sequence of positional
+    argument values or a mapping of keyword argument values. Returns the result of
+    each call, e.g. the instances of a class.
+    """
+    with Batch():
+        return [target(**row) if isinstance(row, Mapping) else target(*row) for row in rows]
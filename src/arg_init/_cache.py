@@ -0,0 +1,101 @@
+"""
+Bounded least recently used cache shared by the arg_init caches.
+
+The caches are shared by all threads. Reads are lock-free: a lookup is a single
+dict read, and the entry is only moved to the end of the LRU order if the lock is
+not held by another thread, so a reader never waits. Writes, including eviction,
+are serialised using a lock. The hit and miss counts are not synchronised and are
+approximate while threads are using the cache.
+"""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Generic, NamedTuple, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class CacheInfo(NamedTuple):
+    """Statistics for a cache."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache(Generic[K, V]):
+    """
+    A mapping of a bounded size that evicts the least recently used entry.
+
+    A maxsize of 0 disables the cache, nothing is stored.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self._data: OrderedDict[K, V] = OrderedDict()
+        self._lock = Lock()
+        self._maxsize = maxsize
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        """Maximum number of entries held in the cache."""
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize: int) -> None:
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    def get(self, key: K) -> V | None:
+        """Return the entry for key, or None if not cached."""
+        value = self._data.get(key)
+        if value is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        if self._lock.acquire(blocking=False):
+            try:
+                # The entry may have been evicted since it was read
+                if key in self._data:
+                    self._data.move_to_end(key)
+            finally:
+                self._lock.release()
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        """Add or replace the entry for key."""
+        if self._maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self._evict()
+
+    def values(self) -> list[V]:
+        """Return a list of all cached entries, least recently used first."""
+        with self._lock:
+            return list(self._data.values())
+
+    def pop(self, key: K) -> V | None:
+        """Remove and return the entry for key, if it exists."""
+        with self._lock:
+            return self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._data.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def info(self) -> CacheInfo:
+        """Return the cache statistics."""
+        return CacheInfo(self._hits, self._misses, self._maxsize, len(self._data))
+
+    def _evict(self) -> None:
+        while len(self._data) > max(self._maxsize, 0):
+            self._data.popitem(last=False)
@@ -1,11 +1,10 @@
 """Class to initialise Argument Values for a Class Method."""
 
 import logging
-from inspect import FrameInfo, getargvalues
-from pathlib import Path
+from types import CodeType, FrameType
 from typing import Any
 
-from ._aliases import ClassCallback, Defaults, Priorities
+from ._aliases import ClassCallback, ConfigName, Defaults, Priorities, ResultType
 from ._arg_init import ArgInit
 from ._enums import ProtectAttrs, SetAttrs, UseKWArgs
 from ._priority import DEFAULT_PRIORITY
@@ -21,6 +20,8 @@ class ClassArgInit(ArgInit):
     i.e. an argument named "self"
     """
 
+    __slots__ = ("_protect_attrs", "_set_attrs")
+
     STACK_LEVEL_OFFSET = 2  # The calling frame is 2 layers up
 
     def __init__(  # noqa: PLR0913
@@ -30,31 +31,45 @@ class ClassArgInit(ArgInit):
         env_prefix: str | None = None,
         use_kwargs: UseKWArgs = UseKWArgs.FALSE,
         defaults: Defaults = None,
-        config_name: str | Path = "config",
+        config_name: ConfigName = "config",
         set_attrs: SetAttrs = SetAttrs.TRUE,
         protect_attrs: ProtectAttrs = ProtectAttrs.TRUE,
+        *,
+        frame: FrameType | None = None,
+        stacklevel: int = 1,
+        env_snapshot: bool = False,
+        lazy: bool = False,
+        result_type: ResultType = "box",
         **kwargs: dict[Any, Any],  # pylint: disable=unused-argument
     ) -> None:
         self._set_attrs = set_attrs
         self._protect_attrs = protect_attrs
-        super().__init__(priorities, env_prefix, use_kwargs, defaults, config_name, **kwargs)
+        super().__init__(
+            priorities,
+            env_prefix,
+            use_kwargs,
+            defaults,
+            config_name,
+            frame=frame,
+            stacklevel=stacklevel,
+            env_snapshot=env_snapshot,
+            lazy=lazy,
+            result_type=result_type,
+            **kwargs,
+        )
 
-    def _post_init(self, calling_stack: FrameInfo) -> None:
+    def _post_init(self, frame: FrameType) -> None:
         """Class specific post init behaviour."""
-        class_instance = self._get_class_instance(calling_stack.frame)
+        class_instance = self._get_class_instance(frame)
         self._set_class_arg_attrs(class_instance)
 
-    def _get_arguments(self, frame: Any, use_kwargs: UseKWArgs) -> dict[Any, Any]:  # noqa: ANN401
+    def _get_argument_names(self, code: CodeType) -> tuple[str, ...]:
         """
-        Return a dictionary containing key value pairs of all
-        named arguments for the specified frame. The first
-        argument is skipped as this is a reference to the class
-        instance.
+        Return the names of all named arguments of the code object.
+        The first argument is skipped as this is a reference to the
+        class instance.
         """
-        arginfo = getargvalues(frame)
-        args = {arg: arginfo.locals.get(arg) for count, arg in enumerate(arginfo.args) if count > 0}
-        args.update(self._get_kwargs(arginfo, use_kwargs))
-        return args
+        return code.co_varnames[1 : code.co_argcount + code.co_kwonlyargcount]
 
     def _set_class_arg_attrs(self, class_ref: ClassCallback) -> None:
         """Set attributes for the class object."""
@@ -64,7 +79,11 @@ class ClassArgInit(ArgInit):
                 self._set_attr(class_ref, arg.name, arg.value)
 
     def _get_attr_name(self, name: str) -> str:
-        if self._protect_attrs:
+        return self._make_attr_name(name, self._protect_attrs)
+
+    @staticmethod
+    def _make_attr_name(name: str, protect_attrs: ProtectAttrs) -> str:
+        if protect_attrs:
             return name if name.startswith("_") else "_" + name
         return name
 
@@ -76,15 +95,13 @@ class ClassArgInit(ArgInit):
         setattr(class_instance, name, value)
 
     @staticmethod
-    def _get_class_instance(frame: Any) -> ClassCallback:  # noqa: ANN401
+    def _get_class_instance(frame: FrameType) -> ClassCallback:
         """
         Return the value of the 1st argument from the calling function.
         This should be the class instance.
         """
-        arginfo = getargvalues(frame)
-        first_arg = arginfo.args[0]
-        return arginfo.locals[first_arg]
+        return frame.f_locals[frame.f_code.co_varnames[0]]
 
-    def _get_name(self, calling_stack: FrameInfo) -> str:
+    def _get_name(self, frame: FrameType) -> str:
         """Return the name of the current class instance."""
-        return calling_stack.frame.f_locals["self"].__class__.__name__
+        return frame.f_locals["self"].__class__.__name__
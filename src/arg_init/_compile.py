@@ -0,0 +1,103 @@
+"""
+Compile a resolver specialised for a resolution plan and priority sequence.
+
+In the same way as dataclasses generates __init__, the source of a function that
+resolves every argument of a plan is generated and exec'd once. The function has
+no loops over the arguments or priorities, no lookup of the attribute holding the
+value of each priority, and creates no Arg or Values objects. For each argument,
+the value of each priority is checked, in order, by a chain of if/elif statements,
+with the env and config names, default values and converters inlined as constants.
+
+For example, with the default priorities, an argument named "port", annotated as
+an int and with a default value, is resolved by:
+
+    if (_v0 := config_get('port')) is not None:
+        _v0 = _convert(_c0, 'port', _v0, 'config')
+    elif (_v0 := env_get('PORT')) is not None:
+        _v0 = _convert(_c0, 'port', _v0, 'env')
+    elif (_v0 := _a0) is not None:
+        pass
+    else:
+        _v0 = _d0
+
+The resolved values are returned as a tuple, in the order of the plan.
+"""
+
+import logging
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any
+
+from ._aliases import Priorities
+from ._convert import convert_value
+from ._plan import ResolutionPlan
+from ._priority import Priority
+
+logger = logging.getLogger(__name__)
+
+Resolver = Callable[[Sequence[Any], Mapping[Any, Any], Callable[[str], str | None]], tuple[Any, ...]]
+
+_CONVERTED = (Priority.CONFIG, Priority.ENV)
+
+
+def compile_resolver(plan: ResolutionPlan, priorities: Priorities, name: str = "resolve") -> Resolver:
+    """
+    Return a function resolving the arguments of plan, checking values in the order of priorities.
+
+    The function is called with the argument values, the config section and a
+    function returning the value of an env variable, or None if it is not set.
+    """
+    namespace: dict[str, Any] = {"_convert": convert_value}
+    body = ["config_get = config.get"]
+    if plan.names:
+        body.append(f"{''.join(f'_a{index}, ' for index in range(len(plan.names)))}= arg_values")
+    for index, (arg_name, env_name, config_name, default_value, convert) in enumerate(
+        zip(plan.names, plan.env_names, plan.config_names, plan.default_values, plan.converters, strict=True)
+    ):
+        if convert is not None:
+            namespace[f"_c{index}"] = convert
+        sources = []
+        for priority in priorities:
+            match priority:
+                case Priority.CONFIG:
+                    expression = f"config_get({config_name!r})"
+                case Priority.ENV:
+                    expression = f"env_get({env_name!r})"
+                case Priority.ARG:
+                    expression = f"_a{index}"
+                case Priority.DEFAULT:
+                    if default_value is None:
+                        continue
+                    namespace[f"_d{index}"] = default_value
+                    expression = f"_d{index}"
+            conversion = (
+                f"_v{index} = _convert(_c{index}, {arg_name!r}, _v{index}, {priority.name.lower()!r})"
+                if convert is not None and priority in _CONVERTED
+                else None
+            )
+            sources.append((expression, conversion))
+        body += _resolve_lines(f"_v{index}", sources)
+    body.append(f"return ({''.join(f'_v{index}, ' for index in range(len(plan.names)))})")
+    source = f"def {name}(arg_values, config, env_get):\n" + "".join(f"    {line}\n" for line in body)
+    logger.debug("Generated resolver %s:\n%s", name, source)
+    exec(source, namespace)  # noqa: S102
+    return namespace[name]
+
+
+def _resolve_lines(variable: str, sources: list[tuple[str, str | None]]) -> list[str]:
+    """Return the lines assigning variable the first value, of the sources, that is not None."""
+    if not sources:
+        return [f"{variable} = None"]
+    lines = []
+    *checked, (last_expression, last_conversion) = sources
+    for position, (expression, conversion) in enumerate(checked):
+        lines.append(f"{'elif' if position else 'if'} ({variable} := {expression}) is not None:")
+        lines.append(f"    {conversion or 'pass'}")
+    indent = ""
+    if checked:
+        lines.append("else:")
+        indent = "    "
+    lines.append(f"{indent}{variable} = {last_expression}")
+    if last_conversion:
+        lines.append(f"{indent}if {variable} is not None:")
+        lines.append(f"{indent}    {last_conversion}")
+    return lines
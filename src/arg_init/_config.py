@@ -5,68 +5,550 @@ Supported formats are:
 - JSON
 - TOML
 - YAML
+
+Parsed config files are held in a process wide cache, keyed by the resolved path
+of the file. A cached entry is revalidated using only a stat() of the file, so a
+file is parsed once per change rather than once per ArgInit instance. If a TTL is
+set, using set_config_ttl(), the stat() is performed at most once per TTL.
+
+Loaders for further formats, or to replace the parser used for a built in format,
+may be registered using register_loader(). By default the fastest parser installed
+is used: the libyaml based CSafeLoader for YAML, orjson for JSON and rtoml for TOML,
+falling back to the pure Python parsers.
+
+A config file may also be a directory of config files, e.g. a conf.d directory,
+which is read as a ConfigDirectory.
+
+The parser for each format is imported only when a file of that format is first
+read, so processes that never read a config file do not pay to import them.
+
+The cache may be read by any number of threads without locking. Each file is parsed
+by one thread at a time, so threads that find a file missing from the cache at the
+same time wait for the first to parse it, rather than each parsing it. A fixed number
+of locks is shared by all files, selected by the hash of the path, so the locks do
+not grow with the number of files read.
 """
 
 import logging
-from json import load as json_load
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from copy import deepcopy
+from io import BytesIO
+from os import fstat, scandir, stat_result
 from pathlib import Path
-from tomllib import load as toml_load
-from typing import Any
-
-from yaml import safe_load as yaml_safe_load
+from stat import S_ISDIR
+from threading import Lock
+from time import monotonic
+from typing import Any, BinaryIO, NamedTuple
 
 from ._aliases import LoaderCallback
+from ._cache import CacheInfo, LRUCache
+from ._discovery import clear_discovery_cache, config_ttl, discover_config, within_ttl
+from ._disk_cache import disk_cache_enabled, read_cached, write_cached
 from ._exceptions import UnsupportedFileFormatError
+from ._sections import INDEXERS, Spans
 
 logger = logging.getLogger(__name__)
-FORMATS = ["yaml", "toml", "json"]
+FORMATS = ["yaml", "toml", "json"]  # Extended by register_loader()
+CONFIG_CACHE_SIZE = 32
+PARSE_LOCK_COUNT = 16
+MUTABLE_TYPES = (dict, list, set, bytearray)
+
+
+class _Signature(NamedTuple):
+    """Attributes of a file that change when the file is modified."""
+
+    mtime_ns: int
+    size: int
+    inode: int
+
+
+class _CachedConfig(NamedTuple):
+    signature: _Signature
+    data: Mapping[Any, Any] | None
+    checked: float
+
+
+class _CachedMerge(NamedTuple):
+    # The data of each layer is held, so it can be compared by identity
+    layers: tuple[Mapping[Any, Any] | None, ...]
+    data: Mapping[Any, Any] | None
+
+
+_config_cache: LRUCache[Path, _CachedConfig] = LRUCache(CONFIG_CACHE_SIZE)
+_merge_cache: LRUCache[tuple[str | Path, ...], _CachedMerge] = LRUCache(CONFIG_CACHE_SIZE)
+_parse_locks = [Lock() for _ in range(PARSE_LOCK_COUNT)]
+_section_loading = False
 
 
 def _yaml_loader() -> LoaderCallback:
-    return yaml_safe_load
+    """Use the libyaml based loader if PyYAML was built with it."""
+    import yaml  # noqa: PLC0415
+
+    loader_class = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+    def load(f: BinaryIO) -> dict[Any, Any]:
+        return yaml.load(f, Loader=loader_class)  # noqa: S506
+
+    return load
 
 
 def _json_loader() -> LoaderCallback:
-    return json_load
+    """Use orjson if installed, falling back to json for any file orjson rejects, e.g. NaN values."""
+    import json  # noqa: PLC0415
+
+    try:
+        import orjson  # noqa: PLC0415
+    except ImportError:
+        return json.load
+
+    def load(f: BinaryIO) -> dict[Any, Any]:
+        data = f.read()
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return json.loads(data)
+
+    return load
 
 
 def _toml_loader() -> LoaderCallback:
-    return toml_load
+    """Use rtoml if installed."""
+    try:
+        import rtoml  # type: ignore[import-not-found] # noqa: PLC0415
+    except ImportError:
+        from tomllib import load  # noqa: PLC0415
+
+        return load
+
+    def rtoml_load(f: BinaryIO) -> dict[Any, Any]:
+        return rtoml.loads(f.read().decode())
+
+    return rtoml_load
+
+
+# Built in formats, in the order config files are searched for.
+# Each loader is created, importing its parser, when a file of that format is first read.
+_LOADER_FACTORIES: dict[str, Callable[[], LoaderCallback]] = {
+    "yaml": _yaml_loader,
+    "toml": _toml_loader,
+    "json": _json_loader,
+}
+_loaders: dict[str, LoaderCallback] = {}
+
+
+def register_loader(config_format: str, loader: LoaderCallback) -> None:
+    """
+    Register the loader used to read config files with the suffix ".<config_format>".
+
+    The loader is called with the file opened in binary mode and must return the
+    parsed data. A loader registered for a built in format replaces the default.
+    New formats are searched for after the built in formats, in the order registered.
+    """
+    _loaders[config_format] = loader
+    if config_format not in FORMATS:
+        FORMATS.append(config_format)
+    clear_config_cache()
+
+
+def unregister_loader(config_format: str) -> None:
+    """Remove a registered loader. Built in formats revert to their default loader."""
+    del _loaders[config_format]
+    if config_format not in _LOADER_FACTORIES:
+        FORMATS.remove(config_format)
+    clear_config_cache()
 
 
 def _get_loader(path: Path) -> LoaderCallback:
-    match path.suffix:
-        case ".json":
-            return _json_loader()
-        case ".yaml":
-            return _yaml_loader()
-        case ".toml":
-            return _toml_loader()
-        case _:
+    config_format = path.suffix[1:]
+    loader = _loaders.get(config_format)
+    if loader is None:
+        factory = _LOADER_FACTORIES.get(config_format)
+        if factory is None:
             raise UnsupportedFileFormatError(path.suffix)
+        loader = _loaders[config_format] = factory()
+    return loader
 
 
-def _find_config(file: str | Path) -> Path | None:
-    if isinstance(file, Path):
-        file.resolve()
-        logger.debug("Using named config file: %s", file.resolve())
-        return file
-    for ext in FORMATS:
-        path = Path(f"{file}.{ext}").resolve()
-        logger.debug("Searching for config: %s", path)
-        if path.exists():
-            logger.debug("config found: %s", path)
-            return path
-    logger.debug("No supported config files found")
-    return None
+def find_config(file: str | Path) -> Path | None:
+    """Return the resolved path of the config file, or None if not found."""
+    return discover_config(file, FORMATS)
+
+
+def _signature(stat: stat_result) -> _Signature:
+    return _Signature(stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+def _load_config(path: Path, signature: _Signature | None = None) -> dict[Any, Any] | None:
+    loader = _get_loader(path)
+    if disk_cache_enabled():
+        signature = signature or _signature(path.stat())
+        found, data = read_cached(path, signature.mtime_ns, signature.size, loader)
+        if found:
+            return data
+    with Path.open(path, "rb") as f:
+        data = loader(f)
+    if signature and disk_cache_enabled():
+        write_cached(path, signature.mtime_ns, signature.size, loader, data)
+    return data
+
+
+class SectionedConfig(Mapping[str, Any]):
+    """
+    A config file, with each top level section parsed when it is first accessed.
+
+    Only the index of sections is held. The spans of a section are read from the
+    file when the section is first accessed, and if the file has been modified
+    since it was indexed, the whole file is parsed instead.
+
+    Threads accessing a section that has not been parsed at the same time may each
+    parse it. Each stores the same data, so this only duplicates work.
+    """
+
+    __slots__ = ("_data", "_join", "_loader", "_path", "_sections", "_signature", "_spans")
+
+    def __init__(self, path: Path, signature: _Signature, spans: Spans) -> None:
+        self._path = path
+        self._signature = signature
+        self._spans = spans
+        self._loader = _get_loader(path)
+        self._join = INDEXERS[path.suffix[1:]][1]
+        self._sections: dict[str, Any] = {}
+        self._data: dict[Any, Any] | None = None
+
+    def __getitem__(self, name: str) -> Any:  # noqa: ANN401
+        if name in self._sections:
+            return self._sections[name]
+        if self._data is not None:
+            return self._data[name]
+        section = self._load_section(name, self._spans[name])
+        if self._data is None:
+            self._sections[name] = section
+        return section
+
+    def _load_section(self, name: str, spans: list[tuple[int, int]]) -> Any:  # noqa: ANN401
+        """
+        Return a section, parsing the whole file if the section can not be parsed alone.
+
+        The whole file is then used for all sections, and KeyError is raised if the
+        section was removed since the file was indexed.
+        """
+        with Path.open(self._path, "rb") as f:
+            chunks = []
+            if _signature(fstat(f.fileno())) == self._signature:
+                for start, end in spans:
+                    f.seek(start)
+                    chunks.append(f.read(end - start))
+        try:
+            data = self._loader(BytesIO(self._join(chunks))) if chunks else None
+        except Exception:  # noqa: BLE001 Any error is re-raised by parsing the whole file
+            data = None
+        if isinstance(data, dict) and name in data:
+            return data[name]
+        logger.debug("Unable to parse section '%s' alone, parsing: %s", name, self._path)
+        self._data = _load_config(self._path) or {}
+        return self._data[name]
+
+    def __contains__(self, name: object) -> bool:
+        if self._data is not None:
+            return name in self._data
+        return name in self._spans
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data if self._data is not None else self._spans)
+
+    def __len__(self) -> int:
+        return len(self._data if self._data is not None else self._spans)
+
+
+class _DirEntry(NamedTuple):
+    signature: _Signature
+    sections: tuple[str, ...]
+
+
+def _scan_sections(path: Path) -> tuple[str, ...]:
+    """Return the top level sections of a config file, without parsing it if the format supports it."""
+    data = path.read_bytes()
+    indexer = INDEXERS.get(path.suffix[1:])
+    spans = indexer[0](data) if indexer else None
+    if spans is None:
+        return tuple(_get_loader(path)(BytesIO(data)) or ())
+    return tuple(spans)
 
 
-def read_config(file: str | Path) -> dict[Any, Any] | None:
-    """Read a config file."""
+class ConfigDirectory(Mapping[str, Any]):
+    """
+    The config files in a directory, e.g. a conf.d directory, read as a single config.
+
+    The directory is indexed by the top level sections of each file, which are found
+    without parsing the file where the format supports it. A file is parsed, using the
+    config cache, when one of its sections is accessed. If a section is defined by
+    several files, they are deep merged, files later in name order taking priority.
+    """
+
+    __slots__ = ("_entries", "_index")
+
+    def __init__(self, entries: dict[Path, _DirEntry]) -> None:
+        self._entries = entries
+        self._index: dict[str, list[Path]] = {}
+        for path, entry in entries.items():
+            for section in entry.sections:
+                self._index.setdefault(section, []).append(path)
+
+    def __getitem__(self, name: str) -> Any:  # noqa: ANN401
+        sections = []
+        for path in self._index[name]:
+            data = read_config_file(path)
+            # A file modified since it was indexed may no longer define the section
+            if data and name in data:
+                sections.append(data[name])
+        if len(sections) == 1:
+            return sections[0]
+        return _deep_merge([{name: section} for section in sections]).get(name, {})
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
+def _load_directory(path: Path, previous: Mapping[Any, Any] | None = None) -> ConfigDirectory:
+    """
+    Index the config files in a directory.
+
+    Files that are unchanged since the previous index was built are not scanned again.
+    """
+    logger.debug("Indexing config directory: %s", path)
+    previous_entries = previous._entries if isinstance(previous, ConfigDirectory) else {}  # noqa: SLF001
+    entries = {}
+    with scandir(path) as dir_entries:
+        files = sorted(
+            (dir_entry for dir_entry in dir_entries if dir_entry.is_file() and not dir_entry.name.startswith(".")),
+            key=lambda dir_entry: dir_entry.name,
+        )
+    for dir_entry in files:
+        file = path / dir_entry.name
+        if file.suffix[1:] not in FORMATS:
+            continue
+        signature = _signature(dir_entry.stat())
+        entry = previous_entries.get(file)
+        if entry is None or entry.signature != signature:
+            entry = _DirEntry(signature, _scan_sections(file))
+        entries[file] = entry
+    return ConfigDirectory(entries)
+
+
+def _load_sections(path: Path, signature: _Signature) -> Mapping[Any, Any] | None:
+    """Index the sections of the config file, if the format supports it, else parse it."""
+    indexer = INDEXERS.get(path.suffix[1:])
+    if indexer is None:
+        return _load_config(path)
+    data = path.read_bytes()
+    spans = indexer[0](data)
+    if spans is None:
+        logger.debug("Unable to index sections, parsing: %s", path)
+        return _get_loader(path)(BytesIO(data))
+    return SectionedConfig(path, signature, spans)
+
+
+def set_section_loading(enabled: bool) -> None:  # noqa: FBT001
+    """
+    Set whether each section of a config file is parsed only when it is first used.
+
+    When enabled, the top level sections of a YAML, TOML or JSON config file are
+    indexed when it is first read, and each section is parsed when first used.
+    """
+    global _section_loading  # noqa: PLW0603
+    _section_loading = enabled
+    _config_cache.clear()
+
+
+def _parse_lock(path: Path) -> Lock:
+    """Return the lock held while parsing a file. Files may share a lock."""
+    return _parse_locks[hash(path) % PARSE_LOCK_COUNT]
+
+
+def _read_cached_config(path: Path) -> Mapping[Any, Any] | None:
+    cached = _config_cache.get(path)
+    if cached and within_ttl(cached.checked):
+        return cached.data
+    stat = path.stat()
+    signature = _signature(stat)
+    if cached and cached.signature == signature:
+        logger.debug("Using cached config: %s", path)
+        if config_ttl() is not None:
+            # Replacing the entry takes the cache lock, so is only done when the time checked is used
+            _config_cache.set(path, cached._replace(checked=monotonic()))
+        return cached.data
+    lock = _parse_lock(path)
+    if not lock.acquire(blocking=False):
+        # Another thread is parsing the file, wait to use its result
+        with lock:
+            cached = _config_cache.get(path)
+        if cached and cached.signature == signature:
+            return cached.data
+        lock.acquire()
+    try:
+        if S_ISDIR(stat.st_mode):
+            # The mtime of a directory changes when a file is added, removed or replaced
+            data: Mapping[Any, Any] | None = _load_directory(path, cached.data if cached else None)
+        elif _section_loading:
+            data = _load_sections(path, signature)
+        else:
+            data = _load_config(path, signature)
+        _config_cache.set(path, _CachedConfig(signature, data, monotonic()))
+    finally:
+        lock.release()
+    return data
+
+
+def read_config(file: str | Path, *, use_cache: bool = True) -> Mapping[Any, Any] | None:
+    """
+    Read a config file.
+
+    The parsed data is shared between all callers when use_cache is True
+    and must not be modified.
+    """
     logger.debug("Reading config file")
-    path = _find_config(file)
+    path = find_config(file)
     if path:
-        loader = _get_loader(path)
-        with Path.open(path, "rb") as f:
-            return loader(f)
+        return read_config_file(path, use_cache=use_cache)
     return None
+
+
+def read_config_file(path: Path, *, use_cache: bool = True) -> Mapping[Any, Any] | None:
+    """Read the config file, or directory, at path, as returned by find_config()."""
+    if use_cache and _config_cache.maxsize:
+        return _read_cached_config(path)
+    if path.is_dir():
+        return _load_directory(path)
+    return _load_config(path)
+
+
+def _deep_merge(layers: list[Mapping[Any, Any]]) -> dict[Any, Any]:
+    """Merge mappings, later mappings taking priority. Nested mappings are merged, other values replaced."""
+    merged: dict[Any, Any] = {}
+    for layer in layers:
+        for key, value in layer.items():
+            existing = merged.get(key)
+            if isinstance(value, Mapping) and isinstance(existing, Mapping):
+                merged[key] = _deep_merge([existing, value])
+            else:
+                merged[key] = value
+    return merged
+
+
+class LayeredConfig(Mapping[Any, Any]):
+    """
+    Config files read as a single config, later files taking priority.
+
+    Each top level section is deep merged when it is first accessed, so sections of
+    a SectionedConfig or ConfigDirectory layer that are not used are never parsed.
+
+    A merged section is cached, unless a layer is a ConfigDirectory. A file in the
+    directory may be modified without the directory, and so the ConfigDirectory,
+    changing, so its sections are read, and merged, on every access.
+    """
+
+    __slots__ = ("_layers", "_sections")
+
+    def __init__(self, layers: list[Mapping[Any, Any]]) -> None:
+        self._layers = layers
+        self._sections: dict[Any, Any] | None = (
+            None if any(isinstance(layer, ConfigDirectory) for layer in layers) else {}
+        )
+
+    def __getitem__(self, name: Any) -> Any:  # noqa: ANN401
+        if self._sections is not None and name in self._sections:
+            return self._sections[name]
+        sections = []
+        for layer in self._layers:
+            try:
+                sections.append(layer[name])
+            except KeyError:
+                continue
+        if not sections:
+            raise KeyError(name)
+        section = sections[0] if len(sections) == 1 else _deep_merge([{name: value} for value in sections])[name]
+        if self._sections is not None:
+            self._sections[name] = section
+        return section
+
+    def __contains__(self, name: object) -> bool:
+        return any(name in layer for layer in self._layers)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(dict.fromkeys(name for layer in self._layers for name in layer))
+
+    def __len__(self) -> int:
+        return len(dict.fromkeys(name for layer in self._layers for name in layer))
+
+
+def read_layered_config(
+    files: Iterable[str | Path],
+    read: Callable[[str | Path], Mapping[Any, Any] | None] = read_config,
+) -> Mapping[Any, Any] | None:
+    """
+    Read each config file, using read(), and return them as a LayeredConfig.
+
+    Later files take priority. Files that are not found, or are not a mapping, are
+    skipped. The LayeredConfig, which holds each merged section, is cached, and
+    reused while read() returns the same data for every file, so a section is merged
+    again only when a file changes.
+    """
+    key = tuple(files)
+    layers = tuple(read(file) for file in key)
+    cached = _merge_cache.get(key)
+    if cached and all(layer is cached_layer for layer, cached_layer in zip(layers, cached.layers, strict=True)):
+        return cached.data
+    logger.debug("Merging config files: %s", key)
+    found = [layer for layer in layers if isinstance(layer, Mapping)]
+    data = LayeredConfig(found) if found else None
+    _merge_cache.set(key, _CachedMerge(layers, data))
+    return data
+
+
+def copy_section(section: Mapping[Any, Any]) -> dict[Any, Any]:
+    """
+    Return a copy of a config section, for use by a single ArgInit instance.
+
+    Parsed config files are shared by all instances, so each mutable value is deep
+    copied. A value modified by one instance, e.g. a list set as an attribute by
+    ClassArgInit, is then not seen by any other instance.
+    """
+    return {key: deepcopy(value) if isinstance(value, MUTABLE_TYPES) else value for key, value in section.items()}
+
+
+def clear_config_cache() -> None:
+    """Remove all parsed config files, and the results of all config file searches, from the cache."""
+    _config_cache.clear()
+    _merge_cache.clear()
+    clear_discovery_cache()
+
+
+def invalidate_config_cache(file: str | Path) -> None:
+    """
+    Remove the parsed config file at the specified path from the cache.
+
+    The results of all config file searches are also removed, as they may refer to the file.
+    """
+    _config_cache.pop(Path(file).resolve())
+    clear_discovery_cache()
+
+
+def set_config_cache_size(maxsize: int) -> None:
+    """
+    Set the maximum number of parsed config files held in the cache.
+
+    A maxsize of 0 disables caching, config files are parsed on every read.
+    """
+    _config_cache.maxsize = maxsize
+    _merge_cache.maxsize = maxsize
+
+
+def config_cache_info() -> CacheInfo:
+    """Return hit/miss statistics for the parsed config cache."""
+    return _config_cache.info()
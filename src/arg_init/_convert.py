@@ -0,0 +1,229 @@
+"""
+Convert env and config values to the type given by the annotation of an argument.
+
+Env values are always strings, and config values are limited to the types supported
+by the file format. A converter is built for each supported annotation, once per
+call site, when the resolution plan is built, so converting a value is a single
+function call. Converters are cached by annotation.
+
+Supported annotations are bool, int, float, complex, str, Path (and other PurePath
+classes), enums, list, tuple, set, frozenset and dict, optionally parameterised,
+Optional and Union. No converter is built for any other annotation, and values
+are then used as found.
+"""
+
+from collections.abc import Callable, Mapping
+from enum import Enum
+from pathlib import PurePath
+from types import NoneType, UnionType
+from typing import Annotated, Any, Union, get_args, get_origin, get_type_hints
+
+from ._exceptions import ArgConversionError
+
+Converter = Callable[[Any], Any]
+
+_TRUE = frozenset(("1", "true", "yes", "on"))
+_FALSE = frozenset(("0", "false", "no", "off", ""))
+_SCALARS = (int, float, complex, str)
+_COLLECTIONS = (list, tuple, set, frozenset)
+
+_converters: dict[Any, Converter | None] = {}
+
+
+def get_hints(func: Callable[..., Any] | None) -> dict[str, Any]:
+    """
+    Return the evaluated annotations of func.
+
+    If a string annotation can not be evaluated, the annotations that are not
+    strings are returned.
+    """
+    if func is None:
+        return {}
+    try:
+        return get_type_hints(func)
+    except (NameError, TypeError, AttributeError):
+        annotations = getattr(func, "__annotations__", {})
+        return {name: hint for name, hint in annotations.items() if not isinstance(hint, str)}
+
+
+def make_converters(names: tuple[str, ...], hints: Mapping[str, Any] | None) -> tuple[Converter | None, ...]:
+    """Return the converter for each argument, or None if the argument is not converted."""
+    if not hints:
+        return (None,) * len(names)
+    return tuple(get_converter(hints[name]) if name in hints else None for name in names)
+
+
+def get_converter(annotation: Any) -> Converter | None:  # noqa: ANN401
+    """Return the converter for an annotation, or None if the annotation is not supported."""
+    try:
+        return _converters[annotation]
+    except KeyError:
+        converter = _converters[annotation] = _make_converter(annotation)
+        return converter
+    except TypeError:  # Unhashable annotation
+        return _make_converter(annotation)
+
+
+def convert_value(convert: Converter, name: str, value: Any, source: str) -> Any:  # noqa: ANN401
+    """Convert the value of an argument, raising ArgConversionError if it is invalid."""
+    try:
+        return convert(value)
+    except (ValueError, TypeError, KeyError) as e:
+        raise ArgConversionError(name, value, source, e) from e
+
+
+def _make_converter(annotation: Any) -> Converter | None:  # noqa: ANN401, PLR0911
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return get_converter(get_args(annotation)[0])
+    if origin is Union or origin is UnionType:
+        return _make_union_converter(get_args(annotation))
+    if origin in _COLLECTIONS or annotation in _COLLECTIONS:
+        return _make_collection_converter(origin or annotation, get_args(annotation))
+    if origin is dict or annotation is dict:
+        return _make_dict_converter(get_args(annotation))
+    if annotation is bool:
+        return _to_bool
+    if annotation in _SCALARS:
+        return _make_scalar_converter(annotation)
+    if isinstance(annotation, type) and issubclass(annotation, PurePath):
+        return _make_scalar_converter(annotation)
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        return _make_enum_converter(annotation)
+    return None
+
+
+def _to_bool(value: Any) -> bool:  # noqa: ANN401
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in _TRUE:
+            return True
+        if lowered in _FALSE:
+            return False
+    elif isinstance(value, int) and value in (0, 1):
+        return bool(value)
+    msg = f"{value!r} is not a valid bool"
+    raise ValueError(msg)
+
+
+def _make_scalar_converter(cls: type) -> Converter:
+    def convert(value: Any) -> Any:  # noqa: ANN401
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, float) and cls is int and not value.is_integer():
+            msg = f"{value!r} is not a valid int"
+            raise ValueError(msg)
+        return cls(value)
+
+    return convert
+
+
+def _make_enum_converter(cls: type[Enum]) -> Converter:
+    by_name = cls.__members__
+    by_str_value = {str(member.value): member for member in cls}
+
+    def convert(value: Any) -> Enum:  # noqa: ANN401
+        if isinstance(value, cls):
+            return value
+        try:
+            return cls(value)
+        except ValueError:
+            if not isinstance(value, str):
+                raise
+        if value in by_name:
+            return by_name[value]
+        return by_str_value[value]
+
+    return convert
+
+
+def _split(value: str) -> Any:  # noqa: ANN401
+    """Split a string of comma separated items, or a JSON array, into a list."""
+    value = value.strip()
+    if value.startswith("["):
+        import json  # noqa: PLC0415
+
+        return json.loads(value)
+    return [item.strip() for item in value.split(",")] if value else []
+
+
+def _make_collection_converter(cls: type, args: tuple[Any, ...]) -> Converter:
+    if cls is tuple and args and args[-1] is not Ellipsis:
+        # Fixed length tuple e.g. tuple[int, str]
+        item_converters = [get_converter(arg) for arg in args]
+
+        def convert_fixed(value: Any) -> tuple[Any, ...]:  # noqa: ANN401
+            items = _split(value) if isinstance(value, str) else list(value)
+            if len(items) != len(item_converters):
+                msg = f"{value!r} does not have {len(item_converters)} items"
+                raise ValueError(msg)
+            return tuple(
+                item if converter is None else converter(item)
+                for converter, item in zip(item_converters, items, strict=True)
+            )
+
+        return convert_fixed
+
+    item_converter = get_converter(args[0]) if args else None
+
+    def convert(value: Any) -> Any:  # noqa: ANN401
+        items = _split(value) if isinstance(value, str) else value
+        if item_converter is None:
+            return items if type(items) is cls else cls(items)
+        return cls(item_converter(item) for item in items)
+
+    return convert
+
+
+def _make_dict_converter(args: tuple[Any, ...]) -> Converter:
+    key_converter, value_converter = (get_converter(args[0]), get_converter(args[1])) if args else (None, None)
+
+    def convert(value: Any) -> dict[Any, Any]:  # noqa: ANN401
+        if isinstance(value, str):
+            import json  # noqa: PLC0415
+
+            value = json.loads(value)
+        if not isinstance(value, Mapping):
+            msg = f"{value!r} is not a valid dict"
+            raise TypeError(msg)
+        if key_converter is None and value_converter is None:
+            return dict(value)
+        return {
+            (key if key_converter is None else key_converter(key)): (
+                item if value_converter is None else value_converter(item)
+            )
+            for key, item in value.items()
+        }
+
+    return convert
+
+
+def _make_union_converter(args: tuple[Any, ...]) -> Converter | None:
+    members = [arg for arg in args if arg is not NoneType]
+    if len(members) == 1:
+        return get_converter(members[0])
+    converters = [converter for converter in (get_converter(member) for member in members) if converter]
+    if not converters:
+        return None
+    member_types = tuple(_runtime_type(member) for member in members)
+
+    def convert(value: Any) -> Any:  # noqa: ANN401
+        if isinstance(value, member_types):
+            return value
+        errors = []
+        for converter in converters:
+            try:
+                return converter(value)
+            except (ValueError, TypeError, KeyError) as e:
+                errors.append(str(e))
+        raise ValueError("; ".join(errors))
+
+    return convert
+
+
+def _runtime_type(annotation: Any) -> type:  # noqa: ANN401
+    """Return the class used to check if a value is an instance of an annotation."""
+    runtime_type = get_origin(annotation) or annotation
+    return runtime_type if isinstance(runtime_type, type) else NoneType
@@ -0,0 +1,336 @@
+"""
+Decorators to resolve arguments without frame inspection.
+
+The signature of the decorated function is processed once, when it is decorated,
+and the resolution plan is built at the same time. When called, the arguments are
+bound to the signature and resolved, with no introspection of the call stack.
+
+The class decorator goes further and, in the same way as dataclasses, generates
+an __init__ method specialised for the signature of the original __init__.
+"""
+
+import functools
+import logging
+from collections.abc import Callable, Sequence
+from inspect import BoundArguments, Parameter, getattr_static, iscoroutinefunction, signature
+from types import MemberDescriptorType
+from typing import Any, TypeVar, overload
+
+from ._aliases import ConfigName, Defaults, Priorities
+from ._class_arg_init import ClassArgInit
+from ._compile import compile_resolver
+from ._convert import get_hints
+from ._enums import ProtectAttrs, SetAttrs, UseKWArgs
+from ._function_arg_init import FunctionArgInit
+from ._priority import DEFAULT_PRIORITY
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+C = TypeVar("C", bound=type)
+
+_VARIADIC = (Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD)
+
+
+@overload
+def arg_init(func: F) -> F: ...
+
+
+@overload
+def arg_init(
+    func: None = None,
+    *,
+    priorities: Priorities = DEFAULT_PRIORITY,
+    env_prefix: str | None = None,
+    use_kwargs: UseKWArgs = UseKWArgs.FALSE,
+    defaults: Defaults = None,
+    config_name: ConfigName = "config",
+    env_snapshot: bool = False,
+    compiled: bool = False,
+) -> Callable[[F], F]: ...
+
+
+def arg_init(  # noqa: PLR0913
+    func: F | None = None,
+    *,
+    priorities: Priorities = DEFAULT_PRIORITY,
+    env_prefix: str | None = None,
+    use_kwargs: UseKWArgs = UseKWArgs.FALSE,
+    defaults: Defaults = None,
+    config_name: ConfigName = "config",
+    env_snapshot: bool = False,
+    compiled: bool = False,
+) -> F | Callable[[F], F]:
+    """
+    Resolve the arguments of a function each time it is called.
+
+    The function is called with each named argument, and each keyword argument if
+    use_kwargs is set, replaced by its resolved value. Arguments are resolved as
+    they would be by calling FunctionArgInit from within the function.
+
+    If the function is a coroutine function, the arguments are resolved in the
+    default executor, so reading the config file does not block the event loop.
+
+    If compiled is set, a resolver specialised for the plan is generated when the
+    function is decorated, and the resolved values are returned without creating
+    an Arg for each argument. Keyword arguments resolved using use_kwargs are
+    resolved as when compiled is not set.
+    """
+
+    def decorate(func: F) -> F:
+        sig = signature(func)
+        names = tuple(name for name, param in sig.parameters.items() if param.kind not in _VARIADIC)
+        var_keyword = next(
+            (name for name, param in sig.parameters.items() if param.kind == Parameter.VAR_KEYWORD),
+            None,
+        )
+        plan = FunctionArgInit._build_plan(names, env_prefix, defaults, get_hints(func))  # noqa: SLF001
+        name = func.__name__
+        resolver = compile_resolver(plan, priorities, f"resolve_{name}") if compiled else None
+        logger.debug("Created resolution plan for: %s", name)
+
+        def resolve(args: tuple[Any, ...], kwargs: dict[str, Any]) -> BoundArguments:
+            bound = sig.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = bound.arguments
+            extra_kwargs = arguments[var_keyword] if use_kwargs and var_keyword else {}
+            arg_values = [arguments[arg_name] for arg_name in names]
+            if resolver and not extra_kwargs:
+                values = FunctionArgInit._resolve_compiled(  # noqa: SLF001
+                    name,
+                    resolver,
+                    arg_values,
+                    priorities=priorities,
+                    env_prefix=env_prefix,
+                    config_name=config_name,
+                    env_snapshot=env_snapshot,
+                )
+                arguments.update(zip(names, values, strict=True))
+                return bound
+            resolved = FunctionArgInit._from_plan(  # noqa: SLF001
+                name,
+                plan,
+                arg_values,
+                extra_kwargs,
+                priorities=priorities,
+                env_prefix=env_prefix,
+                defaults=defaults,
+                config_name=config_name,
+                env_snapshot=env_snapshot,
+                result_type="namespace",
+            ).args
+            for arg_name in names:
+                arguments[arg_name] = resolved[arg_name].value
+            if extra_kwargs:
+                arguments[var_keyword] = {key: resolved[key].value for key in extra_kwargs}  # type: ignore[index]
+            return bound
+
+        if iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+                import asyncio  # noqa: PLC0415
+
+                bound = await asyncio.to_thread(resolve, args, kwargs)
+                return await func(*bound.args, **bound.kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+            bound = resolve(args, kwargs)
+            return func(*bound.args, **bound.kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    if func is None:
+        return decorate
+    return decorate(func)
+
+
+@overload
+def class_arg_init(cls: C) -> C: ...
+
+
+@overload
+def class_arg_init(
+    cls: None = None,
+    *,
+    priorities: Priorities = DEFAULT_PRIORITY,
+    env_prefix: str | None = None,
+    use_kwargs: UseKWArgs = UseKWArgs.FALSE,
+    defaults: Defaults = None,
+    config_name: ConfigName = "config",
+    set_attrs: SetAttrs = SetAttrs.TRUE,
+    protect_attrs: ProtectAttrs = ProtectAttrs.TRUE,
+    env_snapshot: bool = False,
+    compiled: bool = False,
+) -> Callable[[C], C]: ...
+
+
+def class_arg_init(  # noqa: PLR0913
+    cls: C | None = None,
+    *,
+    priorities: Priorities = DEFAULT_PRIORITY,
+    env_prefix: str | None = None,
+    use_kwargs: UseKWArgs = UseKWArgs.FALSE,
+    defaults: Defaults = None,
+    config_name: ConfigName = "config",
+    set_attrs: SetAttrs = SetAttrs.TRUE,
+    protect_attrs: ProtectAttrs = ProtectAttrs.TRUE,
+    env_snapshot: bool = False,
+    compiled: bool = False,
+) -> C | Callable[[C], C]:
+    """
+    Replace the __init__ method of a class with one that resolves its arguments.
+
+    The generated __init__ resolves the arguments, sets them as class attributes,
+    as ClassArgInit does, and then calls the original __init__ with each argument
+    replaced by its resolved value.
+
+    If compiled is set, a resolver specialised for the plan is also generated, as
+    for arg_init.
+    """
+
+    def decorate(cls: C) -> C:
+        init = cls.__init__  # type: ignore[misc]
+        params = list(signature(init).parameters.values())[1:]
+        names = tuple(param.name for param in params if param.kind not in _VARIADIC)
+        var_keyword = next((param.name for param in params if param.kind == Parameter.VAR_KEYWORD), None)
+        resolve_kwargs = bool(use_kwargs and var_keyword)
+        plan = ClassArgInit._build_plan(names, env_prefix, defaults, get_hints(init))  # noqa: SLF001
+        resolver = compile_resolver(plan, priorities, f"resolve_{cls.__name__}") if compiled else None
+        attr_names = tuple(ClassArgInit._make_attr_name(name, protect_attrs) for name in names)  # noqa: SLF001
+        if set_attrs:
+            _check_class_attrs(cls, attr_names)
+
+        def resolve(instance: object, arg_values: tuple[Any, ...], kwargs: dict[str, Any]) -> Sequence[Any]:
+            if resolver and not (resolve_kwargs and kwargs):
+                resolved = ClassArgInit._resolve_compiled(  # noqa: SLF001
+                    type(instance).__name__,
+                    resolver,
+                    list(arg_values),
+                    priorities=priorities,
+                    env_prefix=env_prefix,
+                    config_name=config_name,
+                    env_snapshot=env_snapshot,
+                )
+                return [*resolved, {}] if resolve_kwargs else resolved
+            arg_init = ClassArgInit._from_plan(  # noqa: SLF001
+                type(instance).__name__,
+                plan,
+                list(arg_values),
+                kwargs if resolve_kwargs else {},
+                priorities=priorities,
+                env_prefix=env_prefix,
+                defaults=defaults,
+                config_name=config_name,
+                env_snapshot=env_snapshot,
+                result_type="namespace",
+            )
+            args = arg_init.args
+            values = [args[name].value for name in names]
+            if resolve_kwargs:
+                resolved_kwargs = {name: args[name].value for name in kwargs}
+                if set_attrs:
+                    _set_kwarg_attrs(instance, resolved_kwargs, protect_attrs)
+                return [*values, resolved_kwargs]
+            return values
+
+        cls.__init__ = _make_init(  # type: ignore[misc]
+            cls,
+            init,
+            params,
+            attr_names if set_attrs else (),
+            resolve,
+            resolve_kwargs=resolve_kwargs,
+        )
+        logger.debug("Created __init__ for: %s", cls.__name__)
+        return cls
+
+    if cls is None:
+        return decorate
+    return decorate(cls)
+
+
+def _check_class_attrs(cls: type, attr_names: tuple[str, ...]) -> None:
+    """
+    Raise an AttributeError if an attribute to be set is already defined by the class.
+
+    Slots are permitted, these are the expected way to store the attributes of a
+    class using __slots__.
+    """
+    for attr_name in attr_names:
+        if hasattr(cls, attr_name) and not isinstance(getattr_static(cls, attr_name), MemberDescriptorType):
+            raise AttributeError(name=attr_name, obj=cls)
+
+
+def _set_kwarg_attrs(instance: object, kwargs: dict[str, Any], protect_attrs: ProtectAttrs) -> None:
+    for name, value in kwargs.items():
+        attr_name = ClassArgInit._make_attr_name(name, protect_attrs)  # noqa: SLF001
+        if hasattr(instance, attr_name):
+            raise AttributeError(name=attr_name, obj=instance)
+        setattr(instance, attr_name, value)
+
+
+def _last_positional_only(params: list[Parameter]) -> Parameter | None:
+    positional_only = [param for param in params if param.kind == Parameter.POSITIONAL_ONLY]
+    return positional_only[-1] if positional_only else None
+
+
+def _make_init(  # noqa: PLR0913
+    cls: type,
+    init: Callable[..., None],
+    params: list[Parameter],
+    attr_names: tuple[str, ...],
+    resolve: Callable[[object, tuple[Any, ...], dict[str, Any]], Sequence[Any]],
+    *,
+    resolve_kwargs: bool,
+) -> Callable[..., None]:
+    """
+    Generate an __init__ method with the same signature as init.
+
+    The generated method is straight line code: resolve the named arguments, set
+    each attribute and then call the original __init__.
+    """
+    namespace: dict[str, Any] = {"__arg_init_resolve": resolve, "__arg_init_init": init}
+    signature_parts = ["self"]
+    call_parts = ["self"]
+    var_keyword = "{}"
+    for param in params:
+        part = param.name
+        if param.default is not Parameter.empty:
+            namespace[f"__arg_init_default_{param.name}"] = param.default
+            part += f"=__arg_init_default_{param.name}"
+        match param.kind:
+            case Parameter.POSITIONAL_ONLY | Parameter.POSITIONAL_OR_KEYWORD:
+                call_parts.append(param.name)
+            case Parameter.VAR_POSITIONAL:
+                part = f"*{param.name}"
+                call_parts.append(part)
+            case Parameter.KEYWORD_ONLY:
+                if not any(other.kind == Parameter.VAR_POSITIONAL for other in params) and "*" not in signature_parts:
+                    signature_parts.append("*")
+                call_parts.append(f"{param.name}={param.name}")
+            case Parameter.VAR_KEYWORD:
+                var_keyword = param.name
+                part = f"**{param.name}"
+                call_parts.append(part)
+        signature_parts.append(part)
+        if param.kind == Parameter.POSITIONAL_ONLY and param is _last_positional_only(params):
+            signature_parts.append("/")
+
+    names = [param.name for param in params if param.kind not in _VARIADIC]
+    body = [f"__arg_init_values = __arg_init_resolve(self, ({''.join(name + ', ' for name in names)}), {var_keyword})"]
+    body += [f"{name} = __arg_init_values[{index}]" for index, name in enumerate(names)]
+    if resolve_kwargs:
+        body.append(f"{var_keyword} = __arg_init_values[{len(names)}]")
+    body += [f"self.{attr_name} = {name}" for attr_name, name in zip(attr_names, names, strict=False)]
+    body.append(f"__arg_init_init({', '.join(call_parts)})")
+    source = f"def __init__({', '.join(signature_parts)}):\n" + "".join(f"    {line}\n" for line in body)
+    logger.debug("Generated __init__ for %s:\n%s", cls.__name__, source)
+    exec(source, namespace)  # noqa: S102
+    new_init = namespace["__init__"]
+    functools.update_wrapper(new_init, init)
+    new_init.__qualname__ = f"{cls.__qualname__}.__init__"
+    return new_init
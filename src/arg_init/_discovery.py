@@ -0,0 +1,184 @@
+"""
+Discovery of config files on a configurable search path.
+
+By default a config file is searched for in the current working directory only.
+set_config_search_path() may be used to also search the parent directories of the
+current working directory, the XDG config directory and explicit directories.
+
+The result of each search, including that no file was found, is cached per config
+name and current working directory. A cached result is revalidated using the
+modification time of each directory that would contain the config file, which
+changes when a file is added to or removed from the directory. If the config name
+has directory parts, e.g. "sub/config", this is the sub-directory of each directory
+searched. If a TTL is set, using set_config_ttl(), cached
+results are used for up to ttl seconds without checking the filesystem.
+"""
+
+import logging
+from collections.abc import Iterable
+from enum import Enum
+from os import environ, getcwd
+from pathlib import Path
+from time import monotonic, time_ns
+from typing import NamedTuple
+
+from ._cache import LRUCache
+
+logger = logging.getLogger(__name__)
+DISCOVERY_CACHE_SIZE = 128
+
+# A directory modified within this time of a search may be modified again without
+# its mtime changing, due to the granularity of filesystem timestamps.
+_RACY_NS = 100_000_000
+
+
+class SearchLocation(Enum):
+    """Locations, relative to the environment, that may be included in the search path."""
+
+    CWD = "cwd"
+    PARENTS = "parents"
+    XDG = "xdg"
+
+
+SearchPath = Iterable[SearchLocation | str | Path]
+
+
+class _DirState(NamedTuple):
+    path: Path
+    mtime_ns: int | None
+
+
+class _CachedDiscovery(NamedTuple):
+    path: Path | None
+    dirs: tuple[_DirState, ...]
+    racy: bool
+    checked: float
+
+
+_search_path: tuple[SearchLocation | Path, ...] = (SearchLocation.CWD,)
+_ttl: float | None = None
+_discovery_cache: LRUCache[tuple[str | Path, str], _CachedDiscovery] = LRUCache(DISCOVERY_CACHE_SIZE)
+
+
+def set_config_search_path(search_path: SearchPath) -> None:
+    """
+    Set the directories searched for config files, in order.
+
+    Each entry is a SearchLocation or a directory. Relative directories are relative
+    to the current working directory when the search is performed.
+    """
+    global _search_path  # noqa: PLW0603
+    _search_path = tuple(
+        location if isinstance(location, SearchLocation) else Path(location) for location in search_path
+    )
+    _discovery_cache.clear()
+
+
+def config_search_path() -> tuple[SearchLocation | Path, ...]:
+    """Return the directories searched for config files."""
+    return _search_path
+
+
+def set_config_ttl(ttl: float | None) -> None:
+    """
+    Set the time, in seconds, that cached config files are used without checking the filesystem.
+
+    If ttl is None, the default, cached config files are checked on every use.
+    """
+    global _ttl  # noqa: PLW0603
+    _ttl = ttl
+
+
+def config_ttl() -> float | None:
+    """Return the time, in seconds, that cached config files are used without checking the filesystem."""
+    return _ttl
+
+
+def within_ttl(checked: float) -> bool:
+    """Return True if a TTL is set and it has not expired since checked."""
+    return _ttl is not None and monotonic() - checked < _ttl
+
+
+def clear_discovery_cache() -> None:
+    """Remove the results of all config file searches from the cache."""
+    _discovery_cache.clear()
+
+
+def _search_dirs(cwd: Path) -> list[Path]:
+    """Return the directories on the search path, without duplicates."""
+    dirs: list[Path] = []
+    for location in _search_path:
+        match location:
+            case SearchLocation.CWD:
+                candidates = [cwd]
+            case SearchLocation.PARENTS:
+                candidates = list(cwd.parents)
+            case SearchLocation.XDG:
+                candidates = [Path(environ.get("XDG_CONFIG_HOME") or Path.home() / ".config")]
+            case _:
+                candidates = [cwd / location]
+        dirs.extend(candidate for candidate in candidates if candidate not in dirs)
+    return dirs
+
+
+def _mtime_ns(directory: Path) -> int | None:
+    try:
+        return directory.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _search(name: str, formats: list[str], cwd: Path) -> _CachedDiscovery:
+    """Search for the config file, recording the state of each directory that would contain it."""
+    now = time_ns()
+    dir_states = []
+    path = None
+    for directory in _search_dirs(cwd):
+        # The directory containing the candidates, which differs from directory if name has directory parts
+        parent = (directory / name).parent
+        dir_states.append(_DirState(parent, _mtime_ns(parent)))
+        for ext in formats:
+            candidate = directory / f"{name}.{ext}"
+            logger.debug("Searching for config: %s", candidate)
+            if candidate.exists():
+                logger.debug("config found: %s", candidate)
+                path = candidate.resolve()
+                break
+        if path:
+            break
+    else:
+        logger.debug("No supported config files found")
+    racy = any(state.mtime_ns is not None and now - state.mtime_ns < _RACY_NS for state in dir_states)
+    return _CachedDiscovery(path, tuple(dir_states), racy, monotonic())
+
+
+def _unchanged(cached: _CachedDiscovery) -> bool:
+    """Return True if no directory searched has been modified since the search."""
+    return not cached.racy and all(_mtime_ns(state.path) == state.mtime_ns for state in cached.dirs)
+
+
+def discover_config(file: str | Path, formats: list[str]) -> Path | None:
+    """
+    Return the resolved path of the config file, or None if not found.
+
+    A Path is used as is, only a config name is searched for.
+    """
+    cwd = getcwd()  # noqa: PTH109 A str is faster to hash than a Path
+    key = (file, cwd)
+    cached = _discovery_cache.get(key)
+    if cached:
+        if within_ttl(cached.checked):
+            return cached.path
+        if _unchanged(cached):
+            if _ttl is not None:
+                _discovery_cache.set(key, cached._replace(checked=monotonic()))
+            return cached.path
+    if isinstance(file, Path):
+        path = (Path(cwd) / file).resolve()
+        logger.debug("Using named config file: %s", path)
+        # A named file is not searched for, so does not depend on the state of any directory
+        cached = _CachedDiscovery(path, (), racy=False, checked=monotonic())
+    else:
+        cached = _search(file, formats, Path(cwd))
+    _discovery_cache.set(key, cached)
+    return cached.path
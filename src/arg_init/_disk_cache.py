@@ -0,0 +1,108 @@
+"""
+On disk cache of parsed config files, shared between processes.
+
+When enabled, the parsed data of each config file is pickled to a cache file, in
+the same way that Python caches compiled modules as .pyc files. By default cache
+files are written to a __pycache__ directory next to the config file, or, if a
+cache directory is set, to that directory.
+
+Each cache file records the path, modification time and size of the config file,
+and the loader used to parse it, and is only used if all of these match.
+
+Cache files are loaded using pickle, so the cache directory must only be writable
+by trusted users.
+"""
+
+import logging
+import os
+from pathlib import Path
+from typing import Any, NamedTuple
+
+logger = logging.getLogger(__name__)
+
+_VERSION = 1
+
+
+class _CacheKey(NamedTuple):
+    version: int
+    path: str
+    mtime_ns: int
+    size: int
+    loader: str
+
+
+_enabled = False
+_cache_dir: Path | None = None
+
+
+def set_config_disk_cache(enabled: bool, cache_dir: str | Path | None = None) -> None:  # noqa: FBT001
+    """
+    Set whether parsed config files are cached on disk.
+
+    Cache files are written to cache_dir, if set, else to a __pycache__ directory
+    next to each config file.
+    """
+    global _enabled, _cache_dir  # noqa: PLW0603
+    _enabled = enabled
+    _cache_dir = Path(cache_dir) if cache_dir is not None else None
+
+
+def disk_cache_enabled() -> bool:
+    return _enabled
+
+
+def _cache_path(path: Path) -> Path:
+    if _cache_dir is None:
+        return path.parent / "__pycache__" / f"{path.name}.arg_init.pickle"
+    from hashlib import sha256  # noqa: PLC0415
+
+    return _cache_dir / f"{sha256(str(path).encode()).hexdigest()[:32]}.pickle"
+
+
+def _make_key(path: Path, mtime_ns: int, size: int, loader: object) -> _CacheKey:
+    loader_name = f"{getattr(loader, '__module__', '')}.{getattr(loader, '__qualname__', '')}"
+    return _CacheKey(_VERSION, str(path), mtime_ns, size, loader_name)
+
+
+def read_cached(path: Path, mtime_ns: int, size: int, loader: object) -> tuple[bool, Any]:
+    """Return (True, data) if a current cache file exists for the config file, else (False, None)."""
+    import pickle  # noqa: PLC0415
+
+    cache_path = _cache_path(path)
+    try:
+        with cache_path.open("rb") as f:
+            key = pickle.load(f)  # noqa: S301
+            if key == _make_key(path, mtime_ns, size, loader):
+                logger.debug("Using disk cache: %s", cache_path)
+                return True, pickle.load(f)  # noqa: S301
+    except FileNotFoundError:
+        pass
+    except Exception:  # noqa: BLE001 An unreadable cache file is replaced
+        logger.debug("Unable to read disk cache: %s", cache_path)
+    return False, None
+
+
+def write_cached(path: Path, mtime_ns: int, size: int, loader: object, data: Any) -> None:  # noqa: ANN401
+    """
+    Write the parsed data of the config file to its cache file.
+
+    The cache file is replaced atomically, so a concurrent reader never sees a partial
+    file. Failure to write the cache, e.g. to a read only directory, is ignored.
+    """
+    import pickle  # noqa: PLC0415
+    from tempfile import mkstemp  # noqa: PLC0415
+
+    cache_path = _cache_path(path)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = mkstemp(dir=cache_path.parent, prefix=".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(_make_key(path, mtime_ns, size, loader), f, pickle.HIGHEST_PROTOCOL)
+                pickle.dump(data, f, pickle.HIGHEST_PROTOCOL)
+            Path(temp_name).replace(cache_path)
+        except BaseException:
+            Path(temp_name).unlink()
+            raise
+    except Exception:  # noqa: BLE001 The disk cache is optional
+        logger.debug("Unable to write disk cache: %s", cache_path)
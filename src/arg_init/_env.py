@@ -0,0 +1,94 @@
+"""
+Snapshots of environment variables.
+
+Every os.environ lookup encodes the key and decodes the value. An EnvSnapshot copies
+the variables having a given prefix into a plain dict once, and serves lookups from it.
+
+os.environ provides no notification when it is modified, so snapshots are invalidated
+explicitly using invalidate_env_snapshots(). Each invalidation increments a version
+counter and a snapshot is rebuilt on its next use if its version is out of date.
+
+A snapshot is rebuilt as a new dict, which replaces the old one together with its
+version in a single assignment, so snapshots are read by any number of threads
+without locking.
+"""
+
+import logging
+from os import environ
+from threading import Lock
+
+logger = logging.getLogger(__name__)
+
+
+class _EnvSnapshots:
+    """Registry of the snapshots for each env_prefix."""
+
+    def __init__(self) -> None:
+        self.version = 0
+        self._lock = Lock()
+        self._snapshots: dict[str | None, EnvSnapshot] = {}
+
+    def get(self, env_prefix: str | None) -> "EnvSnapshot":
+        snapshot = self._snapshots.get(env_prefix)
+        if snapshot is None:
+            # setdefault() ensures threads creating a snapshot at the same time share one
+            snapshot = self._snapshots.setdefault(env_prefix, EnvSnapshot(env_prefix, self))
+        return snapshot
+
+    def invalidate(self) -> int:
+        with self._lock:
+            self.version += 1
+            return self.version
+
+
+class EnvSnapshot:
+    """
+    A copy of all environment variables having the prefix: "<ENV_PREFIX>_".
+
+    Variables without the prefix, such as an alternate name set using ArgDefaults,
+    are read directly from the environment.
+    """
+
+    def __init__(self, env_prefix: str | None, registry: _EnvSnapshots) -> None:
+        self._prefix = f"{env_prefix}_".upper() if env_prefix else ""
+        self._registry = registry
+        self._state: tuple[int, dict[str, str]] = (-1, {})
+
+    @property
+    def version(self) -> int:
+        """Version of the environment the snapshot was built from."""
+        return self._state[0]
+
+    def get(self, name: str) -> str | None:
+        """Return the value of the environment variable, or None if not set."""
+        version, values = self._state
+        if version != self._registry.version:
+            values = self._build()
+        if name.startswith(self._prefix):
+            return values.get(name)
+        return environ.get(name)
+
+    def _build(self) -> dict[str, str]:
+        version = self._registry.version
+        prefix = self._prefix
+        values = {name: value for name, value in environ.items() if name.startswith(prefix)}
+        self._state = (version, values)
+        logger.debug("Built env snapshot for prefix '%s' (version %d)", prefix, version)
+        return values
+
+
+_snapshots = _EnvSnapshots()
+
+
+def get_env_snapshot(env_prefix: str | None) -> EnvSnapshot:
+    """Return the shared snapshot for env_prefix."""
+    return _snapshots.get(env_prefix)
+
+
+def invalidate_env_snapshots() -> int:
+    """
+    Mark all snapshots as out of date, so they are rebuilt on next use.
+
+    This must be called after modifying the environment. Returns the new version.
+    """
+    return _snapshots.invalidate()
@@ -7,3 +7,12 @@ class UnsupportedFileFormatError(Exception):
     def __init__(self, suffix: str, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
         msg = f"Unsupported file format: {suffix}"
         super().__init__(msg, *args, **kwargs)
+
+
+class ArgConversionError(ValueError):
+    def __init__(self, name: str, value: Any, source: str, error: Exception) -> None:  # noqa: ANN401
+        msg = f"Unable to convert {source} value {value!r} of argument '{name}': {error}"
+        super().__init__(msg)
+        self.name = name
+        self.value = value
+        self.source = source
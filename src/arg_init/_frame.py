@@ -0,0 +1,55 @@
+"""
+Capture the frame of the function whose arguments are being resolved.
+
+inspect.stack() builds a FrameInfo (including source context read via linecache)
+for every frame on the call stack. Only a single frame is ever required, so walk
+directly to it instead. The cost is independent of the depth of the call stack.
+"""
+
+import sys
+from types import FrameType, FunctionType
+
+
+def capture_frame(depth: int) -> FrameType:
+    """
+    Return the frame depth levels above the caller of this function.
+
+    A depth of 0 returns the frame of the caller.
+    """
+    return sys._getframe(depth + 1)  # noqa: SLF001
+
+
+def find_function(frame: FrameType) -> FunctionType | None:
+    """
+    Return the function executing in frame, or None if it can not be found.
+
+    A frame references only the code object of its function, so the function is
+    looked up by name: as a method of the class of the first argument, as a global,
+    or as a local of the calling frame, unwrapping any decorators applied using
+    functools.wraps. Otherwise, e.g. for a staticmethod or a closure returned by
+    another function, the functions referring to the code object are searched. This
+    is slow, so the result is cached per code object by the caller.
+    """
+    code = frame.f_code
+    name = code.co_name
+    candidates: list[object] = []
+    if code.co_argcount:
+        first = frame.f_locals.get(code.co_varnames[0])
+        cls = first if isinstance(first, type) else type(first)
+        candidates.extend(klass.__dict__.get(name) for klass in cls.__mro__)
+    candidates.append(frame.f_globals.get(name))
+    if frame.f_back:
+        candidates.append(frame.f_back.f_locals.get(name))
+    for candidate in candidates:
+        func = candidate
+        while func is not None:
+            func = getattr(func, "__func__", func)
+            if getattr(func, "__code__", None) is code:
+                return func  # type: ignore[return-value]
+            func = getattr(func, "__wrapped__", None)
+    import gc  # noqa: PLC0415
+
+    return next(
+        (ref for ref in gc.get_referrers(code) if isinstance(ref, FunctionType) and ref.__code__ is code),
+        None,
+    )
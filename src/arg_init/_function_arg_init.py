@@ -1,11 +1,9 @@
 """Class to initialise Argument Values for a Function."""
 
 import logging
-from inspect import FrameInfo, getargvalues
-from typing import Any
+from types import CodeType, FrameType
 
 from ._arg_init import ArgInit
-from ._enums import UseKWArgs
 
 logger = logging.getLogger(__name__)
 
@@ -13,20 +11,16 @@ logger = logging.getLogger(__name__)
 class FunctionArgInit(ArgInit):
     """Initialises arguments from a function."""
 
-    STACK_LEVEL_OFFSET = 1  # The calling frame is 2 layers up
+    __slots__ = ()
 
-    def _get_arguments(self, frame: Any, use_kwargs: UseKWArgs) -> dict[str, object]:  # noqa: ANN401
-        """
-        Return a dictionary containing key value pairs of all
-        named arguments and their values associated with the frame.
-        """
-        arginfo = getargvalues(frame)
-        args = {arg: arginfo.locals.get(arg) for arg in arginfo.args}
-        args.update(self._get_kwargs(arginfo, use_kwargs))
-        return args
+    STACK_LEVEL_OFFSET = 1  # The calling frame is 1 layer up
 
-    def _post_init(self, calling_stack: FrameInfo) -> None:
+    def _get_argument_names(self, code: CodeType) -> tuple[str, ...]:
+        """Return the names of all named arguments of the code object."""
+        return code.co_varnames[: code.co_argcount + code.co_kwonlyargcount]
+
+    def _post_init(self, frame: FrameType) -> None:
         pass
 
-    def _get_name(self, calling_stack: FrameInfo) -> str:
-        return calling_stack.function
+    def _get_name(self, frame: FrameType) -> str:
+        return frame.f_code.co_name
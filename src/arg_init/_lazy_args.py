@@ -0,0 +1,77 @@
+"""Mapping of arguments that are resolved when first accessed."""
+
+from collections.abc import Callable, Iterator, Mapping
+from typing import Any
+
+from ._arg import Arg
+from ._convert import Converter
+from ._plan import ResolutionPlan
+
+
+class _Pending(tuple[str, str, str, Any, Any, Mapping[Any, Any], Converter | None]):
+    """Everything required to resolve an argument, captured at initialisation."""
+
+    __slots__ = ()
+
+
+ArgFactory = Callable[[str, str, str, Any, Any, Mapping[Any, Any], Converter | None], Arg]
+
+
+class LazyArgs(Mapping[str, Arg]):
+    """
+    Resolved arguments, exposed as attributes or key/value pairs.
+
+    Each argument is resolved, including the lookup of its env and config values,
+    when it is first accessed. The resolved Arg is then stored for subsequent use.
+    """
+
+    __slots__ = ("_entries", "_make_arg")
+
+    def __init__(self, make_arg: ArgFactory) -> None:
+        self._make_arg = make_arg
+        self._entries: dict[str, Arg | _Pending] = {}
+
+    def add(self, plan: ResolutionPlan, arg_values: list[Any], config: Mapping[Any, Any]) -> None:
+        """Add unresolved arguments."""
+        for name, env_name, config_name, default_value, value, convert in zip(
+            plan.names,
+            plan.env_names,
+            plan.config_names,
+            plan.default_values,
+            arg_values,
+            plan.converters,
+            strict=True,
+        ):
+            self._entries[name] = _Pending((name, env_name, config_name, default_value, value, config, convert))
+
+    def resolve_all(self) -> None:
+        """Resolve all arguments not yet accessed."""
+        for name in self._entries:
+            self[name]
+
+    def __getitem__(self, name: str) -> Arg:
+        entry = self._entries[name]
+        if isinstance(entry, _Pending):
+            entry = self._entries[name] = self._make_arg(*entry)
+        return entry
+
+    def __getattr__(self, name: str) -> Arg:
+        if name in LazyArgs.__slots__ or name.startswith("__"):
+            raise AttributeError(name)
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        entries = [
+            f"{name}=<pending>" if isinstance(entry, _Pending) else f"{name}={entry!r}"
+            for name, entry in self._entries.items()
+        ]
+        return "<LazyArgs(" + ", ".join(entries) + ")>"
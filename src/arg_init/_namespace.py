@@ -0,0 +1,61 @@
+"""
+Compact container for resolved arguments.
+
+A class using __slots__ is generated for each distinct set of argument names, so
+each result is a fixed size object with no per instance __dict__. This is faster
+to access and smaller than a Box, at the cost of not supporting new keys.
+
+Each argument is stored in a slot of the same name, unless that would shadow an
+attribute of ArgsNamespace, e.g. the values() method, or be name mangled. Such an
+argument is stored in a slot with a different name, and is only accessible by key.
+"""
+
+from collections.abc import Iterator, Mapping
+from functools import lru_cache
+from typing import ClassVar
+
+from ._arg import Arg
+from ._plan import PLAN_CACHE_SIZE
+
+
+class ArgsNamespace(Mapping[str, Arg]):
+    """Resolved arguments, exposed as attributes or key/value pairs."""
+
+    __slots__ = ()
+    __arg_names__: ClassVar[tuple[str, ...]] = ()
+    __arg_slots__: ClassVar[dict[str, str]] = {}  # Argument name to slot name
+
+    def __getitem__(self, name: str) -> Arg:
+        arg: Arg = getattr(self, self.__arg_slots__[name])
+        return arg
+
+    def __setitem__(self, name: str, arg: Arg) -> None:
+        setattr(self, self.__arg_slots__[name], arg)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__arg_names__)
+
+    def __len__(self) -> int:
+        return len(self.__arg_names__)
+
+    def __repr__(self) -> str:
+        return "<ArgsNamespace(" + ", ".join(f"{name}={self[name]!r}" for name in self.__arg_names__) + ")>"
+
+
+@lru_cache(maxsize=PLAN_CACHE_SIZE)
+def namespace_class(names: tuple[str, ...]) -> type[ArgsNamespace]:
+    """Return the ArgsNamespace class for the argument names."""
+    slots = {name: _slot_name(name, names) for name in names}
+    return type(
+        "ArgsNamespace",
+        (ArgsNamespace,),
+        {"__slots__": tuple(slots.values()), "__arg_names__": names, "__arg_slots__": slots},
+    )
+
+
+def _slot_name(name: str, names: tuple[str, ...]) -> str:
+    """Return the name of the slot holding an argument."""
+    slot = name
+    while slot.startswith("__") or hasattr(ArgsNamespace, slot) or (slot != name and slot in names):
+        slot = f"arg_{slot}"
+    return slot
@@ -0,0 +1,203 @@
+"""
+Resolution plans.
+
+A resolution plan holds everything required to resolve the arguments of a call site
+that does not depend on the values passed in to a specific call: the argument names,
+the env and config names to look up, the default values and the converters built
+from the argument annotations.
+
+Plans are cached per (ArgInit class, code object, env_prefix, defaults, priorities),
+so after the first call from a call site only the argument, env and config values are
+looked up. The defaults are identified by the name, default value and alt name of each
+ArgDefaults, so a list created on each call, e.g. within the function, reuses the plan.
+Default values are compared by type as well as value, so 1, 1.0 and True are different
+defaults, and lists, tuples, sets and dicts are compared by their contents. If a default
+value is not hashable, and is not one of these, the defaults are identified by identity
+instead, and such a list must not be modified once it has been used.
+
+Building the key of a defaults list is O(len(defaults)), so once the same defaults
+object is seen to be reused, e.g. a module level list, its key and its index by
+argument name are cached by identity. Looking up the plan and the defaults for an
+argument is then O(1), however large the list. Lists created on each call are not
+cached by identity, so are not kept alive by the cache. A reused list must not be
+modified once it has been used.
+
+The annotations used to build the converters are cached per code object, so a plan
+built for new defaults or priorities does not look up the function again.
+"""
+
+from collections.abc import Iterable, Mapping
+from types import CodeType, FrameType
+from typing import Any, NamedTuple
+
+from ._aliases import Defaults
+from ._arg_defaults import ArgDefaults
+from ._cache import CacheInfo, LRUCache
+from ._convert import Converter, get_hints
+from ._frame import find_function
+from ._priority import Priority
+
+PLAN_CACHE_SIZE = 1024
+
+
+class ResolutionPlan(NamedTuple):
+    """Call site specific data required to resolve arguments."""
+
+    names: tuple[str, ...]
+    env_names: tuple[str, ...]
+    config_names: tuple[str, ...]
+    default_values: tuple[Any, ...]
+    converters: tuple[Converter | None, ...]
+
+
+class _ContentKey:
+    """The contents of a defaults list, hashed once, so the key of reused defaults is O(1) to look up."""
+
+    __slots__ = ("_hash", "items")
+
+    def __init__(self, items: tuple[tuple[str, tuple[Any, ...], str | None], ...]) -> None:
+        self.items = items
+        self._hash = hash(items)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        return self is other or (
+            isinstance(other, _ContentKey) and self._hash == other._hash and self.items == other.items
+        )
+
+
+DefaultsKey = _ContentKey | int | None
+PlanKey = tuple[type, CodeType, str | None, DefaultsKey, tuple[Any, ...]]
+
+
+class _CachedPlan(NamedTuple):
+    # The defaults the plan was built from, used to find defaults that are reused. If keyed
+    # by id(), the reference also ensures its id() is not reused while cached.
+    defaults: Defaults
+    defaults_key: DefaultsKey
+    plan: ResolutionPlan
+
+
+class _CachedDefaults(NamedTuple):
+    # A reference to defaults is held to ensure its id() is not reused while cached
+    defaults: Defaults
+    key: DefaultsKey
+    by_name: Mapping[str, ArgDefaults]
+
+
+_plan_cache: LRUCache[PlanKey, _CachedPlan] = LRUCache(PLAN_CACHE_SIZE)
+_defaults_cache: LRUCache[int, _CachedDefaults] = LRUCache(PLAN_CACHE_SIZE)
+_hints_cache: LRUCache[CodeType, dict[str, Any]] = LRUCache(PLAN_CACHE_SIZE)
+
+
+def lookup_plan(
+    cls: type,
+    code: CodeType,
+    env_prefix: str | None,
+    defaults: Defaults,
+    priorities: Iterable[Priority],
+) -> tuple[PlanKey, ResolutionPlan | None]:
+    """Return the key identifying the plan for a call site, and the cached plan, or None if no plan is cached."""
+    cached_defaults = _get_cached_defaults(defaults)
+    defaults_key = cached_defaults.key if cached_defaults else _defaults_key(defaults)
+    key = (cls, code, env_prefix, defaults_key, tuple(priorities))
+    cached = _plan_cache.get(key)
+    if cached is None:
+        return key, None
+    if cached.defaults is not defaults:
+        return key, None if isinstance(defaults_key, int) else cached.plan
+    if cached_defaults is None and defaults is not None:
+        # defaults is reused, so cache the key held by the plan cache, which is then compared by identity
+        _defaults_cache.set(id(defaults), _CachedDefaults(defaults, cached.defaults_key, _index(defaults)))
+    return key, cached.plan
+
+
+def _get_cached_defaults(defaults: Defaults) -> _CachedDefaults | None:
+    """Return the cached key and index of defaults, if it has been reused."""
+    if defaults is None:
+        return None
+    cached = _defaults_cache.get(id(defaults))
+    return cached if cached and cached.defaults is defaults else None
+
+
+def _defaults_key(defaults: Defaults) -> DefaultsKey:
+    """Return the contents of defaults, or its id() if a default value can not be made hashable."""
+    if defaults is None:
+        return None
+    items: Iterable[tuple[str, ArgDefaults]] = (
+        defaults.items()
+        if isinstance(defaults, Mapping)
+        else ((arg_defaults.name, arg_defaults) for arg_defaults in defaults)
+    )
+    try:
+        return _ContentKey(
+            tuple((name, _value_key(arg_defaults.default_value), arg_defaults.alt_name) for name, arg_defaults in items)
+        )
+    except TypeError:
+        return id(defaults)
+
+
+def _value_key(value: Any) -> tuple[Any, ...]:  # noqa: ANN401
+    """Return a hashable key equal only to the keys of values of the same types and contents."""
+    if isinstance(value, list | tuple):
+        return (type(value), *(_value_key(item) for item in value))
+    if isinstance(value, set | frozenset):
+        return (type(value), frozenset(_value_key(item) for item in value))
+    if isinstance(value, dict):
+        return (type(value), *((_value_key(key), _value_key(item)) for key, item in value.items()))
+    return (type(value), value)
+
+
+def cache_plan(key: PlanKey, defaults: Defaults, plan: ResolutionPlan) -> None:
+    """Add a plan to the cache."""
+    _plan_cache.set(key, _CachedPlan(defaults, key[3], plan))
+
+
+def index_defaults(defaults: Defaults) -> Mapping[str, ArgDefaults]:
+    """
+    Return a mapping of argument name to ArgDefaults.
+
+    If a list contains multiple ArgDefaults for an argument, the first is used.
+    """
+    cached = _get_cached_defaults(defaults)
+    return cached.by_name if cached else _index(defaults)
+
+
+def _index(defaults: Defaults) -> Mapping[str, ArgDefaults]:
+    if defaults is None:
+        return {}
+    if isinstance(defaults, Mapping):
+        return defaults
+    index: dict[str, ArgDefaults] = {}
+    for arg_defaults in defaults:
+        index.setdefault(arg_defaults.name, arg_defaults)
+    return index
+
+
+def get_frame_hints(frame: FrameType) -> dict[str, Any]:
+    """Return the annotations of the function executing in frame, or {} if it can not be found."""
+    code = frame.f_code
+    hints = _hints_cache.get(code)
+    if hints is None:
+        hints = get_hints(find_function(frame))
+        _hints_cache.set(code, hints)
+    return hints
+
+
+def clear_plan_cache() -> None:
+    """Remove all resolution plans, reused defaults and annotations from the cache."""
+    _plan_cache.clear()
+    _defaults_cache.clear()
+    _hints_cache.clear()
+
+
+def cached_plans() -> list[ResolutionPlan]:
+    """Return the resolution plans currently held in the cache."""
+    return [cached.plan for cached in _plan_cache.values()]
+
+
+def plan_cache_info() -> CacheInfo:
+    """Return hit/miss statistics for the resolution plan cache."""
+    return _plan_cache.info()
@@ -0,0 +1,117 @@
+"""
+Indexes of the top level sections of config files.
+
+Each indexer scans the raw bytes of a config file, without parsing it, and returns
+the byte spans of each top level section. A section can then be parsed on its own,
+by parsing only its spans.
+
+The indexers are conservative. If a file uses any construct that could cause a
+section to be misidentified, e.g. a TOML multi-line string or a YAML key that is
+not a plain scalar, None is returned and the file must be parsed as a whole.
+"""
+
+import re
+from collections.abc import Callable
+
+Spans = dict[str, list[tuple[int, int]]]
+
+_YAML_KEY = re.compile(rb"([A-Za-z_][\w.-]*)[ \t]*:(?:[ \t]|\r?$)")
+_YAML_CONTINUATION = (b" ", b"\t", b"#", b"\r", b"\n")
+
+_TOML_HEADER = re.compile(rb"[ \t]*\[\[?[ \t]*([A-Za-z0-9_-]+)[ \t]*[.\]]")
+
+_JSON_TOKEN = re.compile(rb'"(?:[^"\\]|\\.)*"|[{}\[\],:]')
+
+
+def _add_span(spans: Spans, name: str | None, start: int, end: int) -> None:
+    if name is not None:
+        spans.setdefault(name, []).append((start, end))
+
+
+def index_yaml(data: bytes) -> Spans | None:
+    """Each top level key is a line starting in the first column."""
+    spans: Spans = {}
+    name = None
+    start = offset = 0
+    for line in data.splitlines(keepends=True):
+        if not line.startswith(_YAML_CONTINUATION) and not (line.startswith(b"-") and not line.startswith(b"---")):
+            match = _YAML_KEY.match(line)
+            if match is None:
+                return None
+            _add_span(spans, name, start, offset)
+            name, start = match.group(1).decode(), offset
+            if name in spans:
+                return None
+        offset += len(line)
+    _add_span(spans, name, start, offset)
+    return spans
+
+
+def index_toml(data: bytes) -> Spans | None:
+    """
+    Each section is the tables having the section name as their first key.
+
+    Brackets must be balanced on each line that is not a table header, so a line
+    starting with "[" can only be a header. The root table must contain no keys.
+    """
+    if b'"""' in data or b"'''" in data:
+        return None
+    spans: Spans = {}
+    name = None
+    start = offset = 0
+    for line in data.splitlines(keepends=True):
+        match = _TOML_HEADER.match(line)
+        if match:
+            _add_span(spans, name, start, offset)
+            name, start = match.group(1).decode(), offset
+        elif line.lstrip().startswith(b"[") or line.count(b"[") != line.count(b"]"):
+            return None
+        elif name is None and line.strip() and not line.lstrip().startswith(b"#"):
+            # A key in the root table, e.g. an inline table or a dotted key, may define or add to a section
+            return None
+        offset += len(line)
+    _add_span(spans, name, start, offset)
+    return spans
+
+
+def index_json(data: bytes) -> Spans | None:
+    """Each section is a "key": value pair of the top level object."""
+    from json import loads  # noqa: PLC0415
+
+    if not data.lstrip().startswith(b"{"):
+        return None
+    spans: Spans = {}
+    depth = 0
+    name = None
+    start = 0
+    for token in _JSON_TOKEN.finditer(data):
+        value = token.group()
+        if value in {b"{", b"["}:
+            depth += 1
+        elif value in {b"}", b"]"}:
+            depth -= 1
+            if depth == 0:
+                _add_span(spans, name, start, token.start())
+                return spans
+        elif depth == 1:
+            if value == b",":
+                _add_span(spans, name, start, token.start())
+                name = None
+            elif value.startswith(b'"') and name is None:
+                name, start = loads(value), token.start()
+    return None
+
+
+def join_spans(chunks: list[bytes]) -> bytes:
+    return b"".join(chunks)
+
+
+def join_json_spans(chunks: list[bytes]) -> bytes:
+    return b"{" + b",".join(chunks) + b"}"
+
+
+INDEXERS: dict[str, tuple[Callable[[bytes], Spans | None], Callable[[list[bytes]], bytes]]] = {
+    "yaml": (index_yaml, join_spans),
+    "toml": (index_toml, join_spans),
+    "json": (index_json, join_json_spans),
+}
@@ -0,0 +1,66 @@
+"""
+Opt-in instrumentation of the time spent in each phase of argument resolution.
+
+When a hook is registered using set_timing_hook(), each ArgInit instance records
+the duration of each phase and passes the Timings to the hook when initialisation
+completes. When no hook is registered, no timing is performed.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class Timings:
+    """
+    Durations, in nanoseconds, of each phase of resolving the arguments of name.
+
+    Phases not performed, such as frame capture when using the decorators, are 0.
+    """
+
+    name: str = ""
+    frame_capture: int = 0
+    config_discovery: int = 0
+    config_parse: int = 0
+    env_lookup: int = 0
+    resolution: int = 0
+    attribute_setting: int = 0
+
+    @property
+    def total(self) -> int:
+        """Sum of the durations of all phases."""
+        return (
+            self.frame_capture
+            + self.config_discovery
+            + self.config_parse
+            + self.env_lookup
+            + self.resolution
+            + self.attribute_setting
+        )
+
+
+TimingHook = Callable[[Timings], None]
+
+_hook: TimingHook | None = None
+
+
+def set_timing_hook(hook: TimingHook | None) -> None:
+    """
+    Register a callable to receive the Timings of each ArgInit instance.
+
+    Set hook to None to disable timing.
+    """
+    global _hook  # noqa: PLW0603
+    _hook = hook
+
+
+def new_timings() -> Timings | None:
+    """Return a new Timings if a hook is registered, else None."""
+    return Timings() if _hook else None
+
+
+def report_timings(timings: Timings, name: str) -> None:
+    """Pass the completed timings to the hook."""
+    timings.name = name
+    if _hook:
+        _hook(timings)
@@ -0,0 +1,244 @@
+"""
+Background watcher that keeps config files parsed in memory.
+
+A ConfigWatcher parses each watched config file, and parses it again in a background
+thread whenever it changes. The parsed data is published as a snapshot, which is
+replaced atomically, so ArgInit reads the config of a watched file with a single
+dictionary lookup and no I/O.
+
+Changes are detected using inotify, accessed using ctypes, where available, and by
+polling the modification time, size and inode of each file otherwise.
+"""
+
+import logging
+import os
+import select
+import struct
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Self
+
+from ._config import find_config, read_config_file
+
+logger = logging.getLogger(__name__)
+
+# inotify constants, from <sys/inotify.h>
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_IN_MASK = _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE
+_EVENT = struct.Struct("iIII")
+
+# Snapshots of all watched files, keyed by the config_name passed to watch().
+# Replaced, never modified, so may be read without a lock.
+_snapshots: dict[str | Path, Mapping[Any, Any]] = {}
+_snapshots_lock = threading.Lock()
+
+
+def watched_config(config_name: str | Path) -> Mapping[Any, Any] | None:
+    """Return the current snapshot of a watched config file, or None if not watched."""
+    return _snapshots.get(config_name)
+
+
+def _publish(config_names: list[str | Path], data: Mapping[Any, Any] | None) -> None:
+    global _snapshots  # noqa: PLW0603
+    with _snapshots_lock:
+        snapshots = dict(_snapshots)
+        for config_name in config_names:
+            if data is None:
+                snapshots.pop(config_name, None)
+            else:
+                snapshots[config_name] = data
+        _snapshots = snapshots
+
+
+def _file_state(path: Path) -> tuple[int, int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+class _Inotify:
+    """Minimal inotify binding, watching the directory of each watched file."""
+
+    def __init__(self) -> None:
+        import ctypes  # noqa: PLC0415
+        import ctypes.util  # noqa: PLC0415
+
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.fd = self._libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs: dict[int, Path] = {}
+
+    def add_watch(self, directory: Path) -> None:
+        if directory in self._dirs.values():
+            return
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(directory), _IN_MASK)
+        if wd >= 0:
+            self._dirs[wd] = directory
+
+    def read_paths(self) -> set[Path]:
+        """Return the path of each file having an event."""
+        try:
+            buffer = os.read(self.fd, 65536)
+        except BlockingIOError:
+            return set()
+        paths = set()
+        offset = 0
+        while offset < len(buffer):
+            wd, _, _, length = _EVENT.unpack_from(buffer, offset)
+            name = buffer[offset + _EVENT.size : offset + _EVENT.size + length].rstrip(b"\0")
+            if wd in self._dirs and name:
+                paths.add(self._dirs[wd] / os.fsdecode(name))
+            offset += _EVENT.size + length
+        return paths
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class ConfigWatcher:
+    """
+    Watch config files, keeping the parsed data of each in memory.
+
+    A watched config file is found, using config_name, when watch() is called. ArgInit
+    then uses the snapshot for any config_name that is equal to one being watched.
+    If a modified file cannot be parsed, the previous snapshot is retained.
+
+    If use_inotify is True, inotify is used to detect changes, if available. Otherwise,
+    each watched file is checked every poll_interval seconds.
+    """
+
+    def __init__(self, poll_interval: float = 1.0, *, use_inotify: bool = True) -> None:
+        self._poll_interval = poll_interval
+        self._use_inotify = use_inotify
+        self._watched: dict[Path, list[str | Path]] = {}
+        self._states: dict[Path, tuple[int, int, int] | None] = {}
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._inotify: _Inotify | None = None
+        self._wake_r, self._wake_w = -1, -1
+
+    @property
+    def backend(self) -> str:
+        """The backend used to detect changes: "inotify" or "poll"."""
+        return "inotify" if self._inotify else "poll"
+
+    def watch(self, config_name: str | Path) -> Path:
+        """Parse the config file and start watching it for changes. Returns the path of the file."""
+        path = find_config(config_name)
+        if path is None or not path.exists():
+            raise FileNotFoundError(config_name)
+        with self._lock:
+            self._watched.setdefault(path, [])
+            if config_name not in self._watched[path]:
+                self._watched[path].append(config_name)
+            if self._inotify:
+                self._inotify.add_watch(path.parent)
+        self._reload(path)
+        return path
+
+    def unwatch(self, config_name: str | Path) -> None:
+        """Stop watching the config file, ArgInit will read the file as normal."""
+        with self._lock:
+            for path, config_names in list(self._watched.items()):
+                if config_name in config_names:
+                    config_names.remove(config_name)
+                    if not config_names:
+                        del self._watched[path]
+                        self._states.pop(path, None)
+        _publish([config_name], None)
+
+    def start(self) -> None:
+        """Start the background thread that detects changes."""
+        if self._thread:
+            return
+        if self._use_inotify:
+            try:
+                self._inotify = _Inotify()
+            except (OSError, AttributeError, TypeError):
+                logger.debug("inotify is not available, polling for changes")
+        self._stop.clear()
+        if self._inotify:
+            for path in self._watched:
+                self._inotify.add_watch(path.parent)
+            self._wake_r, self._wake_w = os.pipe()
+            target = self._run_inotify
+        else:
+            target = self._run_poll
+        self._thread = threading.Thread(target=target, name="arg_init-config-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread. Snapshots of watched files are retained until unwatched."""
+        if not self._thread:
+            return
+        self._stop.set()
+        if self._inotify:
+            os.write(self._wake_w, b"\0")
+        self._thread.join()
+        self._thread = None
+        if self._inotify:
+            self._inotify.close()
+            self._inotify = None
+            os.close(self._wake_r)
+            os.close(self._wake_w)
+
+    def close(self) -> None:
+        """Stop the background thread and unwatch all files."""
+        self.stop()
+        for config_names in list(self._watched.values()):
+            for config_name in list(config_names):
+                self.unwatch(config_name)
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def _reload(self, path: Path, *, force: bool = False) -> None:
+        """
+        Parse the file and publish a new snapshot, if it has changed.
+
+        force is set when inotify reports a change, which may not change the mtime
+        if it is made within the granularity of filesystem timestamps.
+        """
+        state = _file_state(path)
+        with self._lock:
+            config_names = list(self._watched.get(path, ()))
+            if not config_names or state is None or (state == self._states.get(path) and not force):
+                return
+            self._states[path] = state
+        try:
+            data = read_config_file(path, use_cache=False)
+        except Exception:
+            logger.exception("Unable to parse modified config file, retaining previous: %s", path)
+            return
+        logger.debug("Reloaded config file: %s", path)
+        _publish(config_names, data or {})
+
+    def _run_poll(self) -> None:
+        while not self._stop.wait(self._poll_interval):
+            with self._lock:
+                paths = list(self._watched)
+            for path in paths:
+                self._reload(path)
+
+    def _run_inotify(self) -> None:
+        inotify: _Inotify = self._inotify  # type: ignore[assignment]
+        while not self._stop.is_set():
+            ready, _, _ = select.select([inotify.fd, self._wake_r], [], [])
+            if inotify.fd in ready:
+                for path in inotify.read_paths():
+                    self._reload(path, force=True)
@@ -0,0 +1,25 @@
+"""
+Shared test fixtures.
+"""
+
+import pytest
+import yaml  # noqa: F401 pylint: disable=unused-import
+
+# yaml is imported by arg_init on first use. If that is within a test using the fake
+# filesystem, after another such test, pyfakefs breaks the C YAML loader, so it is
+# imported here instead.
+
+from arg_init import clear_config_cache, clear_plan_cache, invalidate_env_snapshots
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """
+    Each test uses a new fake filesystem, so entries cached by a previous test must not be reused.
+    """
+    clear_config_cache()
+    clear_plan_cache()
+    invalidate_env_snapshots()
+    yield
+    clear_config_cache()
+    clear_plan_cache()
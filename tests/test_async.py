@@ -0,0 +1,110 @@
+"""
+Test arguments are resolved from coroutines without blocking the event loop
+"""
+
+import asyncio
+import threading
+from pathlib import Path
+
+import pytest
+
+from arg_init import ClassArgInit, FunctionArgInit, arg_init, register_loader, unregister_loader
+
+
+class ThreadRecordingLoader:
+    """
+    Loader that records the thread each file is parsed in.
+    """
+
+    def __init__(self):
+        self.threads = []
+
+    def __call__(self, f):
+        self.threads.append(threading.current_thread())
+        return {
+            "target": {"arg1": "config1_value"},
+            "Target": {"arg1": "config1_value"},
+            "setup": {"arg1": "config1_value"},
+        }
+
+
+@pytest.fixture(name="loader")
+def fixture_loader(fs):  # pylint: disable=unused-argument
+    """
+    Register a thread recording loader for YAML files, and create a config file.
+    """
+    Path("config.yaml").write_text("")
+    loader = ThreadRecordingLoader()
+    register_loader("yaml", loader)
+    yield loader
+    unregister_loader("yaml")
+
+
+class TestCreateAsync:
+    """
+    Class to test ArgInit.create_async.
+    """
+
+    def test_function(self, loader):
+        """
+        Test the arguments of the awaiting coroutine are resolved, and the config file is parsed off the event loop.
+        """
+
+        async def target(arg1=None, arg2=None):  # pylint: disable=unused-argument
+            return (await FunctionArgInit.create_async(env_prefix="prefix")).args
+
+        args = asyncio.run(target(arg2="arg2_value"))
+        assert args.arg1.value == "config1_value"
+        assert args.arg2.value == "arg2_value"
+        assert loader.threads
+        assert threading.main_thread() not in loader.threads
+
+    def test_class(self, loader):  # pylint: disable=unused-argument
+        """
+        Test class attributes are set by an async method of the class.
+        """
+
+        class Target:
+            """Test Class"""
+
+            async def setup(self, arg1=None):  # pylint: disable=unused-argument
+                await ClassArgInit.create_async()
+
+        async def create():
+            target = Target()
+            await target.setup()
+            return target
+
+        assert asyncio.run(create())._arg1 == "config1_value"  # noqa: SLF001 pylint: disable=protected-access
+
+    def test_stacklevel(self, loader):  # pylint: disable=unused-argument
+        """
+        Test stacklevel selects the frame of a coroutine further up the call stack.
+        """
+
+        async def helper():
+            return (await FunctionArgInit.create_async(stacklevel=2)).args
+
+        async def target(arg1=None):  # pylint: disable=unused-argument
+            return await helper()
+
+        assert asyncio.run(target()).arg1.value == "config1_value"
+
+
+class TestAsyncDecorator:
+    """
+    Class to test decorating a coroutine function.
+    """
+
+    def test_coroutine_function(self, loader):
+        """
+        Test a decorated coroutine function is called with resolved arguments, resolved off the event loop.
+        """
+
+        @arg_init
+        async def target(arg1=None, arg2=None):
+            return arg1, arg2
+
+        assert asyncio.iscoroutinefunction(target)
+        assert asyncio.run(target(arg2="arg2_value")) == ("config1_value", "arg2_value")
+        assert threading.main_thread() not in loader.threads
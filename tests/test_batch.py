@@ -0,0 +1,178 @@
+"""
+Test resolving the arguments of many calls in a batch
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from arg_init import (
+    ARG_PRIORITY,
+    ArgDefaults,
+    Batch,
+    ClassArgInit,
+    FunctionArgInit,
+    arg_init,
+    construct_batch,
+    register_loader,
+    resolve_batch,
+    set_config_cache_size,
+    unregister_loader,
+)
+from arg_init._batch import current_batch
+from arg_init._config import CONFIG_CACHE_SIZE
+
+
+def target(arg1, arg2=None, arg3="signature3", *, arg4=None):  # pylint: disable=unused-argument
+    return FunctionArgInit(env_prefix="batch").args
+
+
+class Target:
+    """Class resolving its arguments using ClassArgInit."""
+
+    def __init__(self, arg1, arg2=None):  # pylint: disable=unused-argument
+        ClassArgInit(env_prefix="batch")
+
+
+class CountingLoader:
+    """
+    Loader returning fixed data, counting the number of files parsed.
+    """
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, f):
+        self.count += 1
+        return {
+            "target": {"arg2": "config2_value"},
+            "Target": {"arg2": "config2_value"},
+            "decorated": {"arg2": "config2_value"},
+        }
+
+
+@pytest.fixture(name="loader")
+def fixture_loader(fs):  # pylint: disable=unused-argument
+    """
+    Register a counting loader for YAML files, create a config file and disable the config cache.
+    """
+    Path("config.yaml").write_text("")
+    loader = CountingLoader()
+    register_loader("yaml", loader)
+    set_config_cache_size(0)
+    yield loader
+    set_config_cache_size(CONFIG_CACHE_SIZE)
+    unregister_loader("yaml")
+
+
+class TestResolveBatch:
+    """
+    Class to test resolve_batch.
+    """
+
+    def test_rows(self, loader):
+        """
+        Test tuple and dict rows are resolved as each call of the function would be, reading config once.
+        """
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setenv("BATCH_ARG4", "env4_value")
+            results = resolve_batch(target, [("a",), {"arg1": "b", "arg3": "c"}], env_prefix="batch")
+            expected = [target("a"), target("b", arg3="c")]
+        assert results == [{name: arg.value for name, arg in args.items()} for args in expected]
+        assert results[0] == {"arg1": "a", "arg2": "config2_value", "arg3": "signature3", "arg4": "env4_value"}
+        assert loader.count == 3
+
+    def test_arg_priority(self, loader):  # pylint: disable=unused-argument
+        """
+        Test argument values take priority over config, and config is used if an argument is None.
+        """
+        results = resolve_batch(target, [(1, 2), (1, None)], priorities=ARG_PRIORITY)
+        assert [result["arg2"] for result in results] == [2, "config2_value"]
+
+    def test_defaults(self, loader):  # pylint: disable=unused-argument
+        """
+        Test ArgDefaults default values are used when no other value is found.
+        """
+        defaults = [ArgDefaults(name="arg4", default_value="default4_value")]
+        assert resolve_batch(target, [(1,)], defaults=defaults)[0]["arg4"] == "default4_value"
+
+    def test_class(self, loader):  # pylint: disable=unused-argument
+        """
+        Test the __init__ arguments of a class are resolved, using the class name as the section.
+        """
+        assert resolve_batch(Target, [("a",)]) == [{"arg1": "a", "arg2": "config2_value"}]
+
+    @pytest.mark.parametrize(
+        "row, match",
+        [
+            ({"arg1": 1, "arg5": 5}, "unexpected arguments: arg5"),
+            ((1, 2, 3, 4), "takes 3 positional arguments but 4 were given"),
+            ({"arg2": 2}, "missing required arguments: arg1"),
+        ],
+    )
+    def test_invalid_row(self, fs, row, match):  # pylint: disable=unused-argument
+        """
+        Test a row that could not be used to call the function raises TypeError.
+        """
+        with pytest.raises(TypeError, match=match):
+            resolve_batch(target, [row])
+
+    def test_no_required_arguments(self, fs):  # pylint: disable=unused-argument
+        """
+        Test rows of a function without required arguments.
+        """
+
+        def optional(arg1=None):  # pylint: disable=unused-argument
+            pass
+
+        assert resolve_batch(optional, [(), (1,)]) == [{"arg1": None}, {"arg1": 1}]
+
+
+class TestConstructBatch:
+    """
+    Class to test construct_batch and Batch.
+    """
+
+    def test_construct_batch(self, loader):
+        """
+        Test instances are constructed, reading the config file once.
+        """
+        instances = construct_batch(Target, [("a",), {"arg1": "b"}])
+        assert [(instance._arg1, instance._arg2) for instance in instances] == [  # noqa: SLF001 pylint: disable=protected-access
+            ("a", "config2_value"),
+            ("b", "config2_value"),
+        ]
+        assert loader.count == 1
+        assert current_batch() is None
+
+    def test_env_read_once(self, loader):  # pylint: disable=unused-argument
+        """
+        Test environment variables are read once per batch.
+        """
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setenv("BATCH_ARG1", "env1_value")
+            with Batch():
+                first = Target(None)
+                os.environ["BATCH_ARG1"] = "modified"
+                second = Target(None)
+            assert first._arg1 == second._arg1 == "env1_value"  # noqa: SLF001 pylint: disable=protected-access
+            assert Target(None)._arg1 == "modified"  # noqa: SLF001 pylint: disable=protected-access
+
+    def test_nested(self, loader):
+        """
+        Test a batch may be entered again while entered, and decorated functions use the batch.
+        """
+
+        @arg_init
+        def decorated(arg2=None):
+            return arg2
+
+        batch = Batch()
+        with batch:
+            with batch:
+                assert decorated() == "config2_value"
+            assert current_batch() is batch
+            assert decorated() == "config2_value"
+        assert current_batch() is None
+        assert loader.count == 1
@@ -93,3 +93,22 @@ class TestClassArgInit:
                 assert hasattr(self, "_arg1") is False
 
         Test()
+
+    def test_stacklevel(self, fs):  # pylint: disable=unused-argument
+        """
+        Test stacklevel selects the __init__ frame when ClassArgInit is called from a helper
+        """
+
+        class Test:
+            """Test Class"""
+
+            def __init__(self, arg1):  # pylint: disable=unused-argument
+                self._init_args()
+                assert self._arg1 == arg1_value  # pylint: disable=no-member
+
+            @staticmethod
+            def _init_args():
+                ClassArgInit(stacklevel=2)
+
+        arg1_value = "arg1_value"
+        Test(arg1_value)
@@ -0,0 +1,148 @@
+"""
+Test resolvers compiled for a resolution plan
+"""
+
+import pytest
+
+from arg_init import (
+    ARG_PRIORITY,
+    CONFIG_PRIORITY,
+    ENV_PRIORITY,
+    ArgDefaults,
+    Batch,
+    Priority,
+    arg_init,
+    class_arg_init,
+    set_timing_hook,
+)
+from arg_init._compile import compile_resolver
+from arg_init._function_arg_init import FunctionArgInit
+
+DEFAULTS = [ArgDefaults(name="arg3", default_value="default3"), ArgDefaults(name="arg4", default_value="4")]
+PRIORITIES = [
+    CONFIG_PRIORITY,
+    ENV_PRIORITY,
+    ARG_PRIORITY,
+    (Priority.DEFAULT, Priority.ENV, Priority.ARG),
+    (Priority.ENV,),
+    (),
+]
+
+
+def target(arg1=None, arg2="signature2", arg3=None, arg4: int | None = None, arg5: int | None = None):
+    return arg1, arg2, arg3, arg4, arg5
+
+
+@pytest.fixture(name="sources")
+def fixture_sources(fs, monkeypatch):
+    """
+    Create a config file and env variables providing some of the argument values.
+    """
+    fs.create_file(
+        "config.yaml",
+        contents="target:\n  arg1: config1\n  arg5: '5'\nTarget:\n  arg1: config1\ndecorated:\n  arg1: config1\n",
+    )
+    monkeypatch.setenv("COMPILE_ARG2", "env2")
+    monkeypatch.setenv("COMPILE_ARG4", "44")
+    return fs
+
+
+class TestCompiledResolver:
+    """
+    Class to test compiled resolvers resolve the same values as the generic path.
+    """
+
+    @pytest.mark.parametrize("priorities", PRIORITIES)
+    @pytest.mark.parametrize("args", [(), ("arg1", None, "arg3"), (None, None, None, 4, 5)])
+    def test_same_as_generic(self, sources, priorities, args):  # pylint: disable=unused-argument
+        """
+        Test the values resolved by each priority sequence match those of the generic path.
+        """
+        options = {"priorities": priorities, "env_prefix": "compile", "defaults": DEFAULTS}
+        generic = arg_init(**options)(target)
+        compiled = arg_init(compiled=True, **options)(target)
+        assert compiled(*args) == generic(*args)
+
+    def test_class(self, sources):  # pylint: disable=unused-argument
+        """
+        Test a compiled class decorator sets the resolved attributes.
+        """
+
+        @class_arg_init(env_prefix="compile", compiled=True)
+        class Target:
+            """Test Class"""
+
+            def __init__(self, arg1=None, arg4: int | None = None):
+                self.values = (arg1, arg4)
+
+        target_instance = Target()
+        assert target_instance.values == ("config1", 44)
+        assert target_instance._arg4 == 44  # noqa: SLF001 pylint: disable=protected-access
+
+    def test_kwargs(self, sources):  # pylint: disable=unused-argument
+        """
+        Test keyword arguments, resolved using use_kwargs, are resolved by the generic path.
+        """
+
+        @arg_init(env_prefix="compile", use_kwargs=True, compiled=True)
+        def decorated(arg1=None, **kwargs):
+            return arg1, kwargs
+
+        @class_arg_init(env_prefix="compile", use_kwargs=True, compiled=True)
+        class Target:
+            """Test Class"""
+
+            def __init__(self, arg1=None, **kwargs):
+                self.values = (arg1, kwargs)
+
+        assert decorated() == ("config1", {})
+        assert decorated(arg2=None) == ("config1", {"arg2": "env2"})
+        assert Target().values == ("config1", {})
+        assert Target(arg2=None).values == ("config1", {"arg2": "env2"})
+
+    def test_env_snapshot_and_batch(self, sources, monkeypatch):  # pylint: disable=unused-argument
+        """
+        Test env values are read from the env snapshot, or the current Batch.
+        """
+
+        @arg_init(env_prefix="compile", env_snapshot=True, compiled=True)
+        def decorated(arg2=None):
+            return arg2
+
+        assert decorated() == "env2"
+        with Batch():
+            assert decorated() == "env2"
+            monkeypatch.setenv("COMPILE_ARG2", "modified")
+            assert decorated() == "env2"
+
+    def test_timed(self, sources):  # pylint: disable=unused-argument
+        """
+        Test the time spent resolving is reported when timing is enabled.
+        """
+        timings = []
+        set_timing_hook(timings.append)
+        try:
+            assert arg_init(compiled=True)(target)()[0] == "config1"
+        finally:
+            set_timing_hook(None)
+        assert timings[0].name == "target"
+        assert timings[0].resolution > 0
+
+    def test_source(self, caplog):
+        """
+        Test the generated source is logged, and is a chain of if/elif statements for each argument.
+        """
+        plan = FunctionArgInit._build_plan(("arg1", "arg2"), "compile", DEFAULTS[:1])  # noqa: SLF001
+        with caplog.at_level("DEBUG", logger="arg_init._compile"):
+            resolver = compile_resolver(plan, CONFIG_PRIORITY, "resolve_target")
+        assert resolver.__name__ == "resolve_target"
+        assert "elif (_v1 := env_get('COMPILE_ARG2')) is not None:" in caplog.text
+        assert "for " not in caplog.text
+        assert resolver([None, "arg2"], {"arg1": "config1"}, {}.get) == ("config1", "arg2")
+
+    def test_no_arguments(self):
+        """
+        Test a resolver for a function without arguments returns an empty tuple.
+        """
+        plan = FunctionArgInit._build_plan((), None, None)  # noqa: SLF001
+        assert compile_resolver(plan, CONFIG_PRIORITY)([], {}, {}.get) == ()
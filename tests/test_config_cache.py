@@ -0,0 +1,165 @@
+"""
+Test parsed config files are cached
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from arg_init import (
+    ClassArgInit,
+    FunctionArgInit,
+    clear_config_cache,
+    config_cache_info,
+    invalidate_config_cache,
+    resolve_batch,
+    set_config_cache_size,
+)
+from arg_init import _config
+from arg_init._config import CONFIG_CACHE_SIZE, read_config
+
+
+@pytest.fixture
+def cache_size():
+    """Restore the default cache size after a test modifies it."""
+    yield
+    set_config_cache_size(CONFIG_CACHE_SIZE)
+
+
+class TestConfigCache:
+    """
+    Class to test the parsed config cache.
+    """
+
+    def test_config_parsed_once(self, fs):
+        """
+        Test a config file is parsed once for multiple ArgInit instances
+        """
+
+        def test(arg1=None):  # pylint: disable=unused-argument
+            return FunctionArgInit().args
+
+        fs.create_file("config.yaml", contents="test:\n  arg1: config1_value")
+        for _ in range(3):
+            assert test().arg1 == "config1_value"
+        info = config_cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+
+    def test_hit_not_replaced_without_ttl(self, fs, monkeypatch):
+        """
+        Test a revalidated entry is not replaced, taking the cache lock, when no TTL is set
+        """
+
+        def test(arg1=None):  # pylint: disable=unused-argument
+            return FunctionArgInit().args
+
+        fs.create_file("config.yaml", contents="test:\n  arg1: config1_value")
+        assert test().arg1 == "config1_value"
+        monkeypatch.setattr(_config._config_cache, "set", None)  # noqa: SLF001 pylint: disable=protected-access
+        assert test().arg1 == "config1_value"
+
+    def test_modified_config_is_reparsed(self, fs):
+        """
+        Test a modified config file is detected and re-parsed
+        """
+
+        def test(arg1=None):  # pylint: disable=unused-argument
+            return FunctionArgInit().args
+
+        config = fs.create_file("config.yaml", contents="test:\n  arg1: config1_value")
+        assert test().arg1 == "config1_value"
+        config.set_contents("test:\n  arg1: config2_value")
+        os.utime("config.yaml", ns=(0, 1))
+        assert test().arg1 == "config2_value"
+
+    def test_invalidate(self, fs):
+        """
+        Test an invalidated config file is re-parsed
+        """
+
+        fs.create_file("config.yaml", contents="test:\n  arg1: config1_value")
+        read_config("config")
+        invalidate_config_cache("config.yaml")
+        read_config("config")
+        assert config_cache_info().misses == 2
+
+    def test_clear(self, fs):
+        """
+        Test clearing the cache removes all entries
+        """
+
+        fs.create_file("config.yaml", contents="test:\n  arg1: config1_value")
+        read_config("config")
+        assert config_cache_info().currsize == 1
+        clear_config_cache()
+        assert config_cache_info().currsize == 0
+
+    def test_least_recently_used_evicted(self, fs, cache_size):  # pylint: disable=unused-argument
+        """
+        Test the least recently used entry is evicted when the cache is full
+        """
+
+        set_config_cache_size(2)
+        for name in ("a", "b", "c"):
+            fs.create_file(f"{name}.yaml", contents="test:\n  arg1: 1")
+        read_config("a")
+        read_config("b")
+        read_config("a")
+        read_config("c")
+        read_config("a")
+        assert config_cache_info().hits == 2
+        read_config("b")
+        assert config_cache_info().hits == 2
+
+    def test_cache_disabled(self, fs, cache_size):  # pylint: disable=unused-argument
+        """
+        Test config files are parsed on every read when the cache is disabled
+        """
+
+        set_config_cache_size(0)
+        fs.create_file("config.yaml", contents="test:\n  arg1: config1_value")
+        assert read_config("config") == read_config("config")
+        assert config_cache_info().currsize == 0
+
+    def test_use_cache_false(self, fs):
+        """
+        Test use_cache=False bypasses the cache
+        """
+
+        fs.create_file("config.yaml", contents="test:\n  arg1: config1_value")
+        read_config(Path("config.yaml"), use_cache=False)
+        assert config_cache_info().currsize == 0
+
+    def test_values_not_shared(self, fs):
+        """
+        Test a mutable config value modified by one instance is not seen by other instances
+        """
+
+        class A:
+            """Test Class"""
+
+            def __init__(self, items=None, options=None):  # pylint: disable=unused-argument
+                ClassArgInit()
+
+        fs.create_file("config.yaml", contents="A:\n  items: [1, 2]\n  options: {a: [1]}\n")
+        a = A()
+        a._items.append(99)  # noqa: SLF001 pylint: disable=protected-access
+        a._options["a"].append(99)  # noqa: SLF001 pylint: disable=protected-access
+        b = A()
+        assert b._items == [1, 2]  # noqa: SLF001 pylint: disable=protected-access
+        assert b._options == {"a": [1]}  # noqa: SLF001 pylint: disable=protected-access
+
+    def test_batch_rows_not_shared(self, fs):
+        """
+        Test each row resolved by resolve_batch has its own copy of a mutable config value
+        """
+
+        def target(items=None):  # pylint: disable=unused-argument
+            pass
+
+        fs.create_file("config.yaml", contents="target:\n  items: [1, 2]\n")
+        first, second = resolve_batch(target, [(), ()])
+        first["items"].append(99)
+        assert second["items"] == [1, 2]
@@ -0,0 +1,169 @@
+"""
+Test config_name may be a directory of config files
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from arg_init import ClassArgInit, FunctionArgInit, register_loader, set_config_cache_size, unregister_loader
+from arg_init import _config
+from arg_init._config import CONFIG_CACHE_SIZE, ConfigDirectory, read_config
+
+CONF_D = Path("conf.d")
+
+
+def target(arg1=None, arg2=None):  # pylint: disable=unused-argument
+    return FunctionArgInit(config_name=CONF_D).args
+
+
+def touch_dir(mtime_ns):
+    """
+    Set the mtime of the directory, as adding or removing a file would.
+    """
+    os.utime(CONF_D, ns=(0, mtime_ns))
+
+
+@pytest.fixture(name="conf_d")
+def fixture_conf_d(fs):
+    """
+    Create a conf.d directory holding a file for each component, and files that are ignored.
+    """
+    fs.create_file(CONF_D / "10-target.yaml", contents="target:\n  arg1: yaml1\n  arg2: yaml2\n")
+    fs.create_file(CONF_D / "20-target.json", contents='{"target": {"arg2": "json2"}}')
+    fs.create_file(CONF_D / "30-class.toml", contents="[Target]\narg1 = 'toml1'\n")
+    fs.create_file(CONF_D / ".hidden.yaml", contents="hidden:\n  arg1: 1\n")
+    fs.create_file(CONF_D / "README.md", contents="# Components\n")
+    fs.create_dir(CONF_D / "subdir.yaml")
+    touch_dir(1)
+    return fs
+
+
+@pytest.fixture(name="scanned")
+def fixture_scanned(monkeypatch):
+    """
+    Record the name of each file scanned for sections.
+    """
+    scanned = []
+    scan_sections = _config._scan_sections  # noqa: SLF001
+
+    def record(path):
+        scanned.append(path.name)
+        return scan_sections(path)
+
+    monkeypatch.setattr(_config, "_scan_sections", record)
+    return scanned
+
+
+class TestConfigDirectory:
+    """
+    Class to test reading a directory of config files.
+    """
+
+    def test_sections_merged(self, conf_d):  # pylint: disable=unused-argument
+        """
+        Test a section defined by several files is merged, later files taking priority.
+        """
+        args = target()
+        assert args.arg1 == "yaml1"
+        assert args.arg2 == "json2"
+
+    def test_class(self, conf_d):  # pylint: disable=unused-argument
+        """
+        Test the section of a class is read from the file defining it.
+        """
+
+        class Target:
+            """Test Class"""
+
+            def __init__(self, arg1=None):  # pylint: disable=unused-argument
+                ClassArgInit(config_name=CONF_D)
+
+        assert Target()._arg1 == "toml1"  # noqa: SLF001 pylint: disable=protected-access
+
+    def test_index(self, conf_d):  # pylint: disable=unused-argument
+        """
+        Test only config files with a supported format are indexed.
+        """
+        config = read_config(CONF_D)
+        assert isinstance(config, ConfigDirectory)
+        assert list(config) == ["target", "Target"]
+        assert len(config) == 2
+        assert "hidden" not in config
+
+    def test_only_used_file_parsed(self, conf_d):  # pylint: disable=unused-argument
+        """
+        Test a file is only parsed when one of its sections is used.
+        """
+        parsed = []
+        register_loader("toml", lambda f: parsed.append(f.name) or {"Target": {"arg1": "toml1"}})
+        try:
+            config = read_config(CONF_D)
+            assert config["target"] == {"arg1": "yaml1", "arg2": "json2"}
+            assert parsed == []
+            assert config["Target"] == {"arg1": "toml1"}
+            assert [Path(name).name for name in parsed] == ["30-class.toml"]
+        finally:
+            unregister_loader("toml")
+
+    def test_index_refreshed(self, conf_d, scanned):
+        """
+        Test the index is rebuilt when the directory changes, scanning only new or modified files.
+        """
+        assert "other" not in read_config(CONF_D)
+        assert sorted(scanned) == ["10-target.yaml", "20-target.json", "30-class.toml"]
+        conf_d.create_file(CONF_D / "40-other.yaml", contents="other:\n  arg1: 1\n")
+        assert "other" not in read_config(CONF_D)
+        touch_dir(2)
+        assert read_config(CONF_D)["other"] == {"arg1": 1}
+        assert scanned[3:] == ["40-other.yaml"]
+
+    def test_section_removed(self, conf_d):  # pylint: disable=unused-argument
+        """
+        Test a section removed from a file, since the directory was indexed, is empty.
+        """
+        config = read_config(CONF_D)
+        Path(CONF_D / "30-class.toml").write_text("[Other]\n")
+        os.utime(CONF_D / "30-class.toml", ns=(0, 1))
+        assert config["Target"] == {}
+
+    def test_layered_file_modified(self, conf_d):
+        """
+        Test a file in the directory modified in place, without the directory changing, is used when layered.
+        """
+
+        def layered(arg1=None, arg2=None):  # pylint: disable=unused-argument
+            return FunctionArgInit(config_name=[CONF_D, "local"]).args
+
+        conf_d.create_file("local.yaml", contents="layered:\n  arg2: local2\n")
+        Path(CONF_D / "10-target.yaml").write_text("layered:\n  arg1: yaml1\n")
+        touch_dir(2)
+        assert layered().arg1 == "yaml1"
+        Path(CONF_D / "10-target.yaml").write_text("layered:\n  arg1: modified\n")
+        os.utime(CONF_D / "10-target.yaml", ns=(0, 3))
+        touch_dir(2)
+        args = layered()
+        assert args.arg1 == "modified"
+        assert args.arg2 == "local2"
+
+    def test_unindexed_format(self, conf_d):
+        """
+        Test sections of a format without an indexer are found by parsing the file.
+        """
+        register_loader("ini", lambda f: {"target": {"arg1": "ini1"}})
+        try:
+            conf_d.create_file(CONF_D / "40-target.ini", contents="")
+            assert target().arg1 == "ini1"
+        finally:
+            unregister_loader("ini")
+
+    def test_cache_disabled(self, conf_d):  # pylint: disable=unused-argument
+        """
+        Test the directory is indexed on every read when the config cache is disabled.
+        """
+        set_config_cache_size(0)
+        try:
+            assert target().arg2 == "json2"
+        finally:
+            set_config_cache_size(CONFIG_CACHE_SIZE)
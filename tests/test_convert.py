@@ -0,0 +1,334 @@
+"""
+Test env and config values are converted to the type of the argument annotation
+"""
+
+import functools
+from enum import Enum
+from pathlib import Path
+from typing import Annotated, Optional, Union
+
+import pytest
+
+from arg_init import (
+    ArgConversionError,
+    ArgDefaults,
+    ClassArgInit,
+    FunctionArgInit,
+    arg_init,
+    class_arg_init,
+    resolve_batch,
+)
+from arg_init import _plan
+from arg_init._convert import get_converter, get_hints
+
+
+class Colour(Enum):
+    """Enum used as an annotation."""
+
+    RED = 1
+    GREEN = 2
+
+
+class Mode(Enum):
+    """Enum with string values."""
+
+    FAST = "fast"
+
+
+def target(  # noqa: PLR0913 pylint: disable=unused-argument
+    count: int = 0,
+    ratio: float | None = None,
+    enabled: bool = False,
+    numbers: list[int] | None = None,
+    colour: Colour | None = None,
+    name=None,
+):
+    return FunctionArgInit().args
+
+
+def wraps(func):
+    """
+    Decorator using functools.wraps.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+@wraps
+def wrapped(count: int = 0):  # pylint: disable=unused-argument
+    return FunctionArgInit().args
+
+
+class TestConvert:
+    """
+    Class to test converting values using argument annotations.
+    """
+
+    def test_env_values(self, fs, monkeypatch):  # pylint: disable=unused-argument
+        """
+        Test env values are converted to the annotated type, and unannotated arguments are not.
+        """
+        monkeypatch.setenv("COUNT", "3")
+        monkeypatch.setenv("RATIO", "0.5")
+        monkeypatch.setenv("ENABLED", "yes")
+        monkeypatch.setenv("NUMBERS", "1, 2,3")
+        monkeypatch.setenv("COLOUR", "GREEN")
+        monkeypatch.setenv("NAME", "4")
+        args = target()
+        assert args.count.value == 3
+        assert args.ratio.value == 0.5
+        assert args.enabled.value is True
+        assert args.numbers.value == [1, 2, 3]
+        assert args.colour.value is Colour.GREEN
+        assert args.name.value == "4"
+        assert args.count.values.env == "3"
+
+    def test_config_values(self, fs):
+        """
+        Test config values are converted, and values of the expected type are unchanged.
+        """
+        fs.create_file(
+            "config.yaml",
+            contents="target:\n  count: '5'\n  ratio: 2\n  enabled: 0\n  numbers: ['1', 2]\n  colour: 1\n",
+        )
+        args = target()
+        assert args.count.value == 5
+        assert args.ratio.value == 2.0
+        assert args.enabled.value is False
+        assert args.numbers.value == [1, 2]
+        assert args.colour.value is Colour.RED
+
+    def test_path(self, tmp_path, monkeypatch):
+        """
+        Test Path values. The real filesystem is used, as pyfakefs does not replace Path annotations.
+        """
+
+        def path_target(path: Path | None = None):  # pylint: disable=unused-argument
+            return FunctionArgInit().args
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("PATH", "/tmp/file")
+        assert path_target().path.value == Path("/tmp/file")
+
+    def test_arg_and_default_not_converted(self, fs):  # pylint: disable=unused-argument
+        """
+        Test argument values and default values are used as passed.
+        """
+
+        def default_target(count: int = 0, ratio: float = 0):  # pylint: disable=unused-argument
+            return FunctionArgInit(defaults=[ArgDefaults(name="ratio", default_value="1.5")]).args
+
+        args = default_target("1", None)
+        assert args.count.value == "1"
+        assert args.ratio.value == "1.5"
+
+    @pytest.mark.parametrize(
+        "value, match",
+        [
+            ("three", "Unable to convert env value 'three' of argument 'count'"),
+            ("1.5", "invalid literal for int"),
+        ],
+    )
+    def test_invalid_value(self, fs, monkeypatch, value, match):  # pylint: disable=unused-argument
+        """
+        Test ArgConversionError, a ValueError, is raised if a value can not be converted.
+        """
+        monkeypatch.setenv("COUNT", value)
+        with pytest.raises(ArgConversionError, match=match) as exc_info:
+            target()
+        assert isinstance(exc_info.value, ValueError)
+        assert (exc_info.value.name, exc_info.value.value, exc_info.value.source) == ("count", value, "env")
+
+    def test_class(self, fs, monkeypatch):  # pylint: disable=unused-argument
+        """
+        Test the annotations of __init__ are used, including when inherited by a subclass.
+        """
+
+        class Target:
+            """Test Class"""
+
+            def __init__(self, count: int = 0):  # pylint: disable=unused-argument
+                ClassArgInit()
+
+        class Derived(Target):
+            """Test subclass."""
+
+        monkeypatch.setenv("COUNT", "7")
+        assert Target()._count == 7  # noqa: SLF001 pylint: disable=protected-access
+        assert Derived()._count == 7  # noqa: SLF001 pylint: disable=protected-access
+
+    def test_decorators(self, fs, monkeypatch):  # pylint: disable=unused-argument
+        """
+        Test the decorators convert values.
+        """
+
+        @arg_init
+        def decorated(count: int = 0):
+            return count
+
+        @class_arg_init
+        class Decorated:
+            """Test Class"""
+
+            def __init__(self, count: int = 0):
+                self.count = count
+
+        monkeypatch.setenv("COUNT", "8")
+        assert decorated() == 8
+        assert Decorated().count == 8
+
+    def test_resolve_batch(self, fs, monkeypatch):  # pylint: disable=unused-argument
+        """
+        Test env values are converted once for a batch.
+        """
+        monkeypatch.setenv("COUNT", "9")
+        assert [row["count"] for row in resolve_batch(target, [(), (None,)])] == [9, 9]
+
+    def test_lazy(self, fs, monkeypatch):  # pylint: disable=unused-argument
+        """
+        Test values are converted when a lazy argument is resolved.
+        """
+
+        def lazy_target(count: int = 0):  # pylint: disable=unused-argument
+            return FunctionArgInit(lazy=True).args
+
+        monkeypatch.setenv("COUNT", "10")
+        assert lazy_target().count.value == 10
+
+    def test_wrapped_and_nested(self, fs, monkeypatch):  # pylint: disable=unused-argument
+        """
+        Test annotations are found for a decorated function, a function defined in the calling scope, and
+        functions that can not be found by name: a closure returned by another function and a staticmethod.
+        """
+
+        def make():
+            def inner(count: int = 0):  # pylint: disable=unused-argument
+                return FunctionArgInit().args
+
+            return inner
+
+        def nested(count: int = 0):  # pylint: disable=unused-argument
+            return FunctionArgInit().args
+
+        class Target:
+            """Test Class"""
+
+            @staticmethod
+            def static(count: int = 0):  # pylint: disable=unused-argument
+                return FunctionArgInit().args
+
+        monkeypatch.setenv("COUNT", "11")
+        assert wrapped().count.value == 11
+        assert nested().count.value == 11
+        assert make()().count.value == 11
+        assert Target.static().count.value == 11
+
+    def test_hints_cached(self, fs, monkeypatch):  # pylint: disable=unused-argument
+        """
+        Test the function is looked up once per code object, not once per plan.
+        """
+        calls = []
+        monkeypatch.setattr(_plan, "find_function", lambda frame: calls.append(frame) or None)
+
+        def defaults_target(count: int = 0, defaults=None):  # pylint: disable=unused-argument
+            return FunctionArgInit(defaults=defaults).args
+
+        defaults_target()
+        defaults_target(defaults=[ArgDefaults(name="count", default_value=1)])
+        assert len(calls) == 1
+
+    def test_unresolved_annotation(self, fs, monkeypatch):  # pylint: disable=unused-argument
+        """
+        Test arguments with string annotations that can not be evaluated are not converted.
+        """
+
+        def unresolved(count: "int" = 0, other: "Undefined" = None):  # noqa: F821 pylint: disable=unused-argument
+            return FunctionArgInit().args
+
+        monkeypatch.setenv("COUNT", "12")
+        monkeypatch.setenv("OTHER", "13")
+        args = unresolved()
+        assert args.count.value == "12"
+        assert args.other.value == "13"
+        assert get_hints(None) == {}
+
+
+class TestConverters:
+    """
+    Class to test the converter built for each annotation.
+    """
+
+    @pytest.mark.parametrize(
+        "annotation, value, expected",
+        [
+            (bool, "Off", False),
+            (bool, True, True),
+            (bool, 1, True),
+            (int, 2.0, 2),
+            (str, 1, "1"),
+            (complex, "1+2j", 1 + 2j),
+            (Optional[int], "1", 1),  # noqa: UP045
+            (Union[int, float], "1.5", 1.5),  # noqa: UP007
+            (int | str, "a", "a"),
+            (int | list[int], "[1, 2]", [1, 2]),
+            (Annotated[int, "metadata"], "1", 1),
+            (Annotated[int, ["unhashable"]], "1", 1),
+            (Mode, "fast", Mode.FAST),
+            (Colour, "2", Colour.GREEN),
+            (Colour, Colour.RED, Colour.RED),
+            (list, "a,b", ["a", "b"]),
+            (list, "", []),
+            (list[str], '["a", "b"]', ["a", "b"]),
+            (tuple, "a", ("a",)),
+            (tuple[int, ...], "1,2", (1, 2)),
+            (tuple[int, str], [1, 2], (1, "2")),
+            (tuple[int, object], "1,a", (1, "a")),
+            (set[int], "1,1", {1}),
+            (frozenset, ["a"], frozenset({"a"})),
+            (dict, '{"a": 1}', {"a": 1}),
+            (dict[str, int], {"a": "1"}, {"a": 1}),
+            (dict[str, object], {"a": "1"}, {"a": "1"}),
+        ],
+    )
+    def test_convert(self, annotation, value, expected):
+        """
+        Test each supported annotation converts values.
+        """
+        assert get_converter(annotation)(value) == expected
+
+    @pytest.mark.parametrize(
+        "annotation, value",
+        [
+            (bool, "maybe"),
+            (bool, 2),
+            (int, 1.5),
+            (int | float, "a"),
+            (Colour, 3),
+            (Colour, "BLUE"),
+            (tuple[int, int], "1"),
+            (dict, "[1]"),
+        ],
+    )
+    def test_invalid(self, annotation, value):
+        """
+        Test invalid values raise an exception.
+        """
+        with pytest.raises((ValueError, TypeError, KeyError)):
+            get_converter(annotation)(value)
+
+    @pytest.mark.parametrize("annotation", [object, "int", object | None, object | type])
+    def test_unsupported(self, annotation):
+        """
+        Test no converter is built for unsupported annotations, or unions only of unsupported types.
+        """
+        assert get_converter(annotation) is None
+
+    def test_cached(self):
+        """
+        Test a converter is built once for an annotation.
+        """
+        assert get_converter(list[int]) is get_converter(list[int])
@@ -0,0 +1,231 @@
+"""
+Test the arg_init decorator
+"""
+
+import inspect
+
+import pytest
+
+from arg_init import ArgDefaults, ARG_PRIORITY, arg_init, class_arg_init
+
+
+class TestFunctionDecorator:
+    """
+    Class to test arguments of decorated functions are resolved.
+    """
+
+    def test_bare_decorator(self, fs):  # pylint: disable=unused-argument
+        """
+        Test arguments are resolved when the decorator is used without arguments
+        """
+
+        @arg_init
+        def test(arg1=None):
+            return arg1
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setenv("ARG1", "env1_value")
+            assert test() == "env1_value"
+
+    def test_options(self, fs):
+        """
+        Test decorator options are applied
+        """
+
+        @arg_init(
+            env_prefix="prefix",
+            priorities=ARG_PRIORITY,
+            defaults=[ArgDefaults(name="arg3", default_value="default")],
+            config_name="named_file",
+        )
+        def test(arg1, arg2=None, arg3=None):
+            return arg1, arg2, arg3
+
+        fs.create_file("named_file.yaml", contents="test:\n  arg2: config2_value")
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setenv("PREFIX_ARG1", "env1_value")
+            assert test("arg1_value") == ("arg1_value", "config2_value", "default")
+            assert test(None) == ("env1_value", "config2_value", "default")
+
+    def test_function_name_used_for_config(self, fs):
+        """
+        Test the decorated function name is used to select the config section
+        """
+
+        @arg_init
+        def test(arg1=None):
+            return arg1
+
+        fs.create_file("config.toml", contents="[test]\narg1='config1_value'")
+        assert test() == "config1_value"
+
+    def test_variadic_arguments(self, fs):  # pylint: disable=unused-argument
+        """
+        Test positional only, var positional and keyword only arguments
+        """
+
+        @arg_init(defaults=[ArgDefaults(name="arg3", default_value="default")])
+        def test(arg1, /, *args, arg3=None, **kwargs):
+            return arg1, args, arg3, kwargs
+
+        assert test(1, 2, 3, kwarg1=4) == (1, (2, 3), "default", {"kwarg1": 4})
+
+    def test_use_kwargs(self, fs):  # pylint: disable=unused-argument
+        """
+        Test kwargs are resolved if enabled
+        """
+
+        @arg_init(use_kwargs=True)
+        def test(**kwargs):
+            return kwargs
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setenv("KWARG1", "env1_value")
+            assert test(kwarg1=None) == {"kwarg1": "env1_value"}
+
+    def test_no_frame_inspection(self, fs):  # pylint: disable=unused-argument
+        """
+        Test the call stack is not inspected when a decorated function is called
+        """
+
+        @arg_init
+        def test(arg1=None):
+            return arg1
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr("arg_init._arg_init.capture_frame", None)
+            assert test("arg1_value") == "arg1_value"
+
+
+class TestClassDecorator:
+    """
+    Class to test arguments of classes decorated with class_arg_init are resolved.
+    """
+
+    def test_attrs_set(self, fs):  # pylint: disable=unused-argument
+        """
+        Test protected attributes are set before the original __init__ is called
+        """
+
+        @class_arg_init
+        class Test:
+            """Test Class"""
+
+            def __init__(self, arg1, arg2=None):
+                self.seen = (arg1, arg2, self._arg1, self._arg2)  # pylint: disable=no-member
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setenv("ARG2", "env2_value")
+            test = Test("arg1_value")
+        assert test.seen == ("arg1_value", "env2_value", "arg1_value", "env2_value")
+
+    def test_class_name_used_for_config(self, fs):
+        """
+        Test the class name is used to select the config section
+        """
+
+        @class_arg_init(protect_attrs=False)
+        class Test:
+            """Test Class"""
+
+            def __init__(self, arg1=None):
+                pass
+
+        fs.create_file("config.yaml", contents="Test:\n  arg1: config1_value")
+        assert Test().arg1 == "config1_value"  # pylint: disable=no-member
+
+    def test_set_attrs_false(self, fs):  # pylint: disable=unused-argument
+        """
+        Test attributes are not set if set_attrs is False
+        """
+
+        @class_arg_init(set_attrs=False, defaults=[ArgDefaults(name="arg1", default_value="default")])
+        class Test:
+            """Test Class"""
+
+            def __init__(self, arg1=None):
+                self.arg1 = arg1
+
+        test = Test()
+        assert test.arg1 == "default"
+        assert not hasattr(test, "_arg1")
+
+    def test_slots(self, fs):  # pylint: disable=unused-argument
+        """
+        Test attributes are set for a class using __slots__
+        """
+
+        @class_arg_init
+        class Test:
+            """Test Class"""
+
+            __slots__ = ("_arg1",)
+
+            def __init__(self, arg1):
+                pass
+
+        assert Test("arg1_value")._arg1 == "arg1_value"  # pylint: disable=protected-access
+
+    def test_signature_preserved(self, fs):  # pylint: disable=unused-argument
+        """
+        Test the generated __init__ supports the full range of parameter kinds
+        """
+
+        @class_arg_init(use_kwargs=True)
+        class Test:
+            """Test Class"""
+
+            def __init__(self, arg1, arg2=2, /, arg3=3, *args, arg4, arg5=5, **kwargs):
+                self.seen = (arg1, arg2, arg3, args, arg4, arg5, kwargs)
+
+        test = Test(1, 7, 8, 9, arg4=4, kwarg1=6)
+        assert test.seen == (1, 7, 8, (9,), 4, 5, {"kwarg1": 6})
+        assert test._kwarg1 == 6  # pylint: disable=protected-access
+        assert str(inspect.signature(Test.__init__)) == "(self, arg1, arg2=2, /, arg3=3, *args, arg4, arg5=5, **kwargs)"
+
+    def test_keyword_only(self, fs):  # pylint: disable=unused-argument
+        """
+        Test keyword only arguments without var positional arguments
+        """
+
+        @class_arg_init
+        class Test:
+            """Test Class"""
+
+            def __init__(self, *, arg1):
+                pass
+
+        assert Test(arg1=1)._arg1 == 1  # pylint: disable=protected-access
+
+    def test_exception_raised_if_class_attr_exists(self):
+        """
+        Test exception raised if an attribute to be set is defined by the class
+        """
+
+        with pytest.raises(AttributeError):
+
+            @class_arg_init
+            class Test:  # pylint: disable=unused-variable
+                """Test Class"""
+
+                _arg1 = None
+
+                def __init__(self, arg1=None):
+                    pass
+
+    def test_exception_raised_if_kwarg_attr_exists(self, fs):  # pylint: disable=unused-argument
+        """
+        Test exception raised if an attribute to be set for a kwarg already exists
+        """
+
+        @class_arg_init(use_kwargs=True)
+        class Test:
+            """Test Class"""
+
+            _kwarg1 = None
+
+            def __init__(self, **kwargs):
+                pass
+
+        with pytest.raises(AttributeError):
+            Test(kwarg1=1)
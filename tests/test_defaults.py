@@ -0,0 +1,58 @@
+"""
+Test the forms of defaults accepted
+"""
+
+from arg_init import ArgDefaults, FunctionArgInit
+from arg_init._plan import index_defaults
+
+
+class TestDefaults:
+    """
+    Class to test defaults may be a list or a mapping of ArgDefaults.
+    """
+
+    def test_mapping(self, fs):  # pylint: disable=unused-argument
+        """
+        Test defaults can be a mapping of argument name to ArgDefaults
+        """
+
+        def test(arg1=None, arg2=None):  # pylint: disable=unused-argument
+            defaults = {"arg2": ArgDefaults(name="arg2", default_value="default")}
+            return FunctionArgInit(defaults=defaults).args
+
+        args = test()
+        assert args.arg1 == None
+        assert args.arg2 == "default"
+
+    def test_list_index_cached(self, fs):  # pylint: disable=unused-argument
+        """
+        Test a list of ArgDefaults is indexed once it is reused, and a list used once is not cached
+        """
+
+        def test(defaults, arg1=None, arg2=None):  # pylint: disable=unused-argument
+            return FunctionArgInit(defaults=defaults).args
+
+        defaults = [ArgDefaults(name="arg1"), ArgDefaults(name="arg2")]
+        index = index_defaults(defaults)
+        assert index == {"arg1": defaults[0], "arg2": defaults[1]}
+        assert index_defaults(defaults) is not index
+        test(defaults)
+        test(defaults)
+        index = index_defaults(defaults)
+        assert index_defaults(defaults) is index
+        assert index_defaults(list(defaults)) is not index
+        assert index_defaults(None) == {}
+
+    def test_first_duplicate_used(self, fs):  # pylint: disable=unused-argument
+        """
+        Test the first ArgDefaults in a list is used if a name is duplicated
+        """
+
+        def test(arg1=None):  # pylint: disable=unused-argument
+            defaults = [
+                ArgDefaults(name="arg1", default_value="default1"),
+                ArgDefaults(name="arg1", default_value="default2"),
+            ]
+            return FunctionArgInit(defaults=defaults).args
+
+        assert test().arg1 == "default1"
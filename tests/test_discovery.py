@@ -0,0 +1,210 @@
+"""
+Test config file discovery on the search path
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from arg_init import (
+    FunctionArgInit,
+    SearchLocation,
+    config_cache_info,
+    config_search_path,
+    set_config_search_path,
+    set_config_ttl,
+)
+from arg_init import _discovery
+
+
+def target(arg1=None):  # pylint: disable=unused-argument
+    """
+    Function resolving its arguments using the config file named "config".
+    """
+    return FunctionArgInit(config_name="config").args
+
+
+@pytest.fixture(autouse=True)
+def restore_settings():
+    """
+    Restore the default search path and TTL after each test.
+    """
+    yield
+    set_config_search_path([SearchLocation.CWD])
+    set_config_ttl(None)
+
+
+@pytest.fixture(name="not_racy")
+def fixture_not_racy(monkeypatch):
+    """
+    Trust the mtime of a directory, even if it has just been modified.
+    """
+    monkeypatch.setattr(_discovery, "_RACY_NS", 0)
+
+
+def touch_dir(path="."):
+    """
+    Set a new mtime for the directory, as if a file had been added.
+    """
+    mtime_ns = Path(path).stat().st_mtime_ns + 1_000_000_000
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class TestDiscoveryCache:
+    """
+    Class to test the results of config file searches are cached and revalidated.
+    """
+
+    def test_missing_config_cached(self, fs, not_racy):  # pylint: disable=unused-argument
+        """
+        Test a search that finds no config file is not repeated while the directory is unchanged
+        """
+        target()
+        target()
+        assert _discovery._discovery_cache.info().hits == 1  # pylint: disable=protected-access
+
+    def test_config_added_after_search(self, fs, not_racy):  # pylint: disable=unused-argument
+        """
+        Test a config file added after a search is found, when the directory mtime changes
+        """
+        assert target().arg1.value is None
+        fs.create_file("config.yaml", contents="target:\n  arg1: config1_value\n")
+        touch_dir()
+        assert target().arg1 == "config1_value"
+
+    def test_config_added_to_sub_directory(self, fs, not_racy):  # pylint: disable=unused-argument
+        """
+        Test a config file added after a search, to the sub-directory named by the config name, is found
+        """
+
+        def sub_target(arg1=None):  # pylint: disable=unused-argument
+            return FunctionArgInit(config_name="sub/config").args
+
+        fs.create_dir("sub")
+        assert sub_target().arg1.value is None
+        fs.create_file("sub/config.yaml", contents="sub_target:\n  arg1: config1_value\n")
+        touch_dir("sub")
+        assert sub_target().arg1 == "config1_value"
+
+    def test_racy_directory_searched(self, fs):
+        """
+        Test a directory modified just before a search is searched again on next use
+        """
+        fs.create_dir("unused")
+        assert target().arg1.value is None
+        fs.create_file("config.yaml", contents="target:\n  arg1: config1_value\n")
+        assert target().arg1 == "config1_value"
+
+    def test_change_of_cwd(self, fs, not_racy):  # pylint: disable=unused-argument
+        """
+        Test results are cached per current working directory
+        """
+        fs.create_file("/a/config.yaml", contents="target:\n  arg1: config1_value\n")
+        fs.create_dir("/b")
+        os.chdir("/a")
+        assert target().arg1 == "config1_value"
+        os.chdir("/b")
+        assert target().arg1.value is None
+
+    def test_ttl(self, fs, not_racy):  # pylint: disable=unused-argument
+        """
+        Test cached results are used, without checking the filesystem, until the TTL expires
+        """
+        set_config_ttl(60)
+        assert target().arg1.value is None
+        fs.create_file("config.yaml", contents="target:\n  arg1: config1_value\n")
+        touch_dir()
+        assert target().arg1.value is None
+        set_config_ttl(0)
+        assert target().arg1 == "config1_value"
+
+    def test_ttl_expired_unchanged(self, fs, not_racy):  # pylint: disable=unused-argument
+        """
+        Test a result is used after the TTL expires if the directory is unchanged
+        """
+        fs.create_file("config.yaml", contents="target:\n  arg1: config1_value\n")
+        set_config_ttl(0)
+        assert target().arg1 == "config1_value"
+        assert target().arg1 == "config1_value"
+        assert _discovery._discovery_cache.info().hits == 1  # pylint: disable=protected-access
+
+    def test_parsed_config_within_ttl(self, fs):
+        """
+        Test a parsed config file is used without checking the file within the TTL
+        """
+        config = fs.create_file("config.yaml", contents="target:\n  arg1: config1_value\n")
+        set_config_ttl(60)
+        assert target().arg1 == "config1_value"
+        config.set_contents("test:\n  arg1: config2_value\n")
+        assert target().arg1 == "config1_value"
+        assert config_cache_info().hits == 1
+
+    def test_named_file_cached(self, fs):
+        """
+        Test a named config file is resolved once
+        """
+
+        def test_named(arg1=None):  # pylint: disable=unused-argument
+            return FunctionArgInit(config_name=Path("named.yaml")).args
+
+        fs.create_file("named.yaml", contents="test_named:\n  arg1: config1_value\n")
+        assert test_named().arg1 == "config1_value"
+        assert test_named().arg1 == "config1_value"
+        assert _discovery._discovery_cache.info().hits == 1  # pylint: disable=protected-access
+
+
+class TestSearchPath:
+    """
+    Class to test config files are searched for in each location on the search path.
+    """
+
+    def test_default(self):
+        """
+        Test only the current working directory is searched by default
+        """
+        assert config_search_path() == (SearchLocation.CWD,)
+
+    def test_parents(self, fs):
+        """
+        Test config files are found in parent directories, nearest first
+        """
+        fs.create_file("/a/config.yaml", contents="target:\n  arg1: config1_value\n")
+        fs.create_file("/a/b/config.yaml", contents="target:\n  arg1: config2_value\n")
+        fs.create_dir("/a/b/c")
+        os.chdir("/a/b/c")
+        set_config_search_path([SearchLocation.CWD, SearchLocation.PARENTS])
+        assert target().arg1 == "config2_value"
+
+    def test_xdg(self, fs):
+        """
+        Test config files are found in XDG_CONFIG_HOME
+        """
+        fs.create_file("/xdg/config.yaml", contents="target:\n  arg1: config1_value\n")
+        set_config_search_path([SearchLocation.CWD, SearchLocation.XDG])
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setenv("XDG_CONFIG_HOME", "/xdg")
+            assert target().arg1 == "config1_value"
+
+    def test_xdg_default(self, fs):
+        """
+        Test config files are found in ~/.config if XDG_CONFIG_HOME is not set
+        """
+        fs.create_file("/home/user/.config/config.yaml", contents="target:\n  arg1: config1_value\n")
+        set_config_search_path([SearchLocation.XDG])
+        with pytest.MonkeyPatch.context() as mp:
+            mp.delenv("XDG_CONFIG_HOME", raising=False)
+            mp.setenv("HOME", "/home/user")
+            assert target().arg1 == "config1_value"
+
+    def test_explicit_dirs(self, fs):
+        """
+        Test config files are found in explicit directories, relative to the current working directory
+        """
+        fs.create_file("/a/settings/config.toml", contents="[target]\narg1 = 'config1_value'\n")
+        fs.create_file("/etc/app/config.yaml", contents="target:\n  arg1: config2_value\n")
+        os.chdir("/a")
+        set_config_search_path(["settings", "/etc/app"])
+        assert target().arg1 == "config1_value"
+        set_config_search_path(["/missing", Path("/etc/app")])
+        assert target().arg1 == "config2_value"
@@ -0,0 +1,146 @@
+"""
+Test parsed config files are cached on disk
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from arg_init import FunctionArgInit, clear_config_cache, register_loader, set_config_disk_cache, unregister_loader
+
+
+class CountingLoader:
+    """
+    Loader returning fixed data, counting the number of files parsed.
+    """
+
+    def __init__(self, data):
+        self.data = data
+        self.count = 0
+
+    def __call__(self, f):
+        self.count += 1
+        return self.data
+
+
+@pytest.fixture(name="loader")
+def fixture_loader():
+    """
+    Register a counting loader for YAML files.
+    """
+    loader = CountingLoader({"target": {"arg1": "config1_value"}})
+    register_loader("yaml", loader)
+    yield loader
+    unregister_loader("yaml")
+
+
+@pytest.fixture(name="disk_cache")
+def fixture_disk_cache():
+    """
+    Enable the disk cache for the duration of a test.
+    """
+    set_config_disk_cache(True)
+    yield
+    set_config_disk_cache(False)
+
+
+def target(arg1=None):  # pylint: disable=unused-argument
+    """
+    Resolve arguments from a new process, i.e. with an empty in memory cache.
+    """
+    clear_config_cache()
+    return FunctionArgInit().args
+
+
+class TestDiskCache:
+    """
+    Class to test parsed config files are read from the disk cache.
+    """
+
+    def test_disabled_by_default(self, fs, loader):  # pylint: disable=unused-argument
+        """
+        Test no cache file is written by default
+        """
+        fs.create_file("config.yaml")
+        target()
+        target()
+        assert loader.count == 2
+        assert not Path("__pycache__").exists()
+
+    def test_parsed_once(self, fs, loader, disk_cache):  # pylint: disable=unused-argument
+        """
+        Test a config file is parsed once, and read from the cache file next to it thereafter
+        """
+        fs.create_file("config.yaml")
+        assert target().arg1 == "config1_value"
+        assert target().arg1 == "config1_value"
+        assert loader.count == 1
+        assert Path("__pycache__/config.yaml.arg_init.pickle").exists()
+
+    def test_cache_dir(self, fs, loader):  # pylint: disable=unused-argument
+        """
+        Test cache files are written to the cache directory, if set
+        """
+        fs.create_file("config.yaml")
+        set_config_disk_cache(True, "/cache")
+        try:
+            target()
+            target()
+        finally:
+            set_config_disk_cache(False)
+        assert loader.count == 1
+        assert len(os.listdir("/cache")) == 1
+
+    def test_modified_config(self, fs, loader, disk_cache):  # pylint: disable=unused-argument
+        """
+        Test a modified config file is parsed again
+        """
+        fs.create_file("config.yaml")
+        target()
+        os.utime("config.yaml", ns=(0, 1))
+        target()
+        assert loader.count == 2
+
+    def test_loader_changed(self, fs, disk_cache):  # pylint: disable=unused-argument
+        """
+        Test a cache file written using a different loader is not used
+        """
+        fs.create_file("config.yaml", contents="target:\n  arg1: config1_value\n")
+        assert target().arg1 == "config1_value"
+        register_loader("yaml", CountingLoader({"target": {"arg1": "config2_value"}}))
+        try:
+            assert target().arg1 == "config2_value"
+        finally:
+            unregister_loader("yaml")
+
+    def test_corrupt_cache_file(self, fs, loader, disk_cache):  # pylint: disable=unused-argument
+        """
+        Test a corrupt cache file is ignored and replaced
+        """
+        fs.create_file("config.yaml")
+        fs.create_file("__pycache__/config.yaml.arg_init.pickle", contents="corrupt")
+        assert target().arg1 == "config1_value"
+        assert target().arg1 == "config1_value"
+        assert loader.count == 1
+
+    def test_unwritable_cache_dir(self, fs, loader):  # pylint: disable=unused-argument
+        """
+        Test failure to write a cache file is ignored
+        """
+        fs.create_file("config.yaml")
+        fs.create_file("/cache")
+        set_config_disk_cache(True, "/cache")
+        try:
+            assert target().arg1 == "config1_value"
+        finally:
+            set_config_disk_cache(False)
+
+    def test_unpicklable_data(self, fs, loader, disk_cache):  # pylint: disable=unused-argument
+        """
+        Test data that cannot be pickled is not cached, and no partial file is left
+        """
+        loader.data = {"target": {"arg1": lambda: None}}
+        fs.create_file("config.yaml")
+        target()
+        assert os.listdir("__pycache__") == []
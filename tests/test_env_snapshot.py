@@ -0,0 +1,67 @@
+"""
+Test environment snapshots
+"""
+
+import pytest
+
+from arg_init import ArgDefaults, ClassArgInit, FunctionArgInit, get_env_snapshot, invalidate_env_snapshots
+
+
+class TestEnvSnapshot:
+    """
+    Class to test env values can be resolved from a snapshot of the environment.
+    """
+
+    def test_env_resolved_from_snapshot(self, fs):  # pylint: disable=unused-argument
+        """
+        Test env values are resolved from a snapshot
+        """
+
+        def test(arg1=None):  # pylint: disable=unused-argument
+            return FunctionArgInit(env_prefix="prefix", env_snapshot=True).args
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setenv("PREFIX_ARG1", "env1_value")
+            assert test().arg1 == "env1_value"
+
+    def test_snapshot_updated_after_invalidation(self, fs):  # pylint: disable=unused-argument
+        """
+        Test a snapshot is only rebuilt after it is invalidated
+        """
+
+        def test(arg1=None):  # pylint: disable=unused-argument
+            return FunctionArgInit(env_prefix="prefix", env_snapshot=True).args
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setenv("PREFIX_ARG1", "env1_value")
+            assert test().arg1 == "env1_value"
+            mp.setenv("PREFIX_ARG1", "env2_value")
+            assert test().arg1 == "env1_value"
+            invalidate_env_snapshots()
+            assert test().arg1 == "env2_value"
+
+    def test_version(self):
+        """
+        Test the snapshot version matches the version returned on invalidation
+        """
+
+        snapshot = get_env_snapshot("prefix")
+        version = invalidate_env_snapshots()
+        snapshot.get("PREFIX_ARG1")
+        assert snapshot.version == version
+
+    def test_alt_name_outside_prefix(self, fs):  # pylint: disable=unused-argument
+        """
+        Test a name without the prefix is read from the environment
+        """
+
+        class Test:
+            """Test Class"""
+
+            def __init__(self, arg1=None):  # pylint: disable=unused-argument
+                defaults = [ArgDefaults(name="arg1", alt_name="ENV1")]
+                ClassArgInit(env_prefix="prefix", defaults=defaults, env_snapshot=True)
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setenv("ENV1", "env1_value")
+            assert Test()._arg1 == "env1_value"  # pylint: disable=protected-access
@@ -83,6 +83,19 @@ class TestFileConfigs:
         fs.create_file("config.toml", contents=contents)
         test()
 
+    @pytest.mark.parametrize("file, contents", [("config.yaml", "- test\n"), ("config.json", '{"test": [1]}')])
+    def test_not_a_mapping(self, fs, file, contents):
+        """
+        Test a file, or section, that is not a mapping is treated as missing.
+        """
+
+        def test(arg1=None):  # pylint: disable=unused-argument
+            args = FunctionArgInit().args
+            assert args["arg1"] == None
+
+        fs.create_file(file, contents=contents)
+        test()
+
     def test_named_file_as_string(self, fs):
         """
         Test toml file can be used to initialise arguments
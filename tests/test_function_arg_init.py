@@ -3,6 +3,7 @@ Test FunctionArgInit
 """
 
 from collections import namedtuple
+import sys
 
 from arg_init import FunctionArgInit
 
@@ -27,3 +28,49 @@ class TestFunctionArgInit:
 
         arg1_value = "arg1_value"
         test(arg1_value)
+
+    def test_stacklevel(self, fs):  # pylint: disable=unused-argument
+        """
+        Test stacklevel selects the frame of the function calling a wrapper
+        """
+
+        def resolve_args():
+            return FunctionArgInit(stacklevel=2).args
+
+        def test(arg1):  # pylint: disable=unused-argument
+            """Test Class"""
+            args = resolve_args()
+            assert args.arg1 == arg1_value
+
+        arg1_value = "arg1_value"
+        test(arg1_value)
+
+    def test_explicit_frame(self, fs):  # pylint: disable=unused-argument
+        """
+        Test an explicitly supplied frame is used in preference to the calling frame
+        """
+
+        def resolve_args(frame):
+            return FunctionArgInit(frame=frame).args
+
+        def test(arg1):  # pylint: disable=unused-argument
+            """Test Class"""
+            args = resolve_args(sys._getframe())  # pylint: disable=protected-access
+            assert args.arg1 == arg1_value
+            assert "frame" not in args
+
+        arg1_value = "arg1_value"
+        test(arg1_value)
+
+    def test_config_section_uses_function_name(self, fs):
+        """
+        Test the calling function name is used to select the config section
+        """
+
+        def test(arg1=None):  # pylint: disable=unused-argument
+            args = FunctionArgInit().args
+            assert args.arg1 == config1_value
+
+        config1_value = "config1_value"
+        fs.create_file("config.yaml", contents=f"test:\n  arg1: {config1_value}")
+        test()
@@ -0,0 +1,143 @@
+"""
+Test config_name may be a list of config files that are merged
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from arg_init import ClassArgInit, FunctionArgInit, set_config_cache_size, set_section_loading, set_timing_hook
+from arg_init._config import CONFIG_CACHE_SIZE, SectionedConfig, read_config, read_layered_config
+
+CONFIG_NAMES = ["base", "site", "local"]
+
+
+def target(arg1=None, arg2=None, arg3=None):  # pylint: disable=unused-argument
+    return FunctionArgInit(config_name=CONFIG_NAMES).args
+
+
+@pytest.fixture(name="layers")
+def fixture_layers(fs):
+    """
+    Create a base config file, and a site config file overriding some of its values.
+    """
+    fs.create_file("base.yaml", contents="target:\n  arg1: base1\n  arg2: base2\n  arg3: [1, 2]\nother:\n  arg1: 1\n")
+    fs.create_file("site.toml", contents='[target]\narg2 = "site2"\narg3 = [3]\n')
+    return fs
+
+
+@pytest.fixture(name="cache_size")
+def fixture_cache_size():
+    """
+    Restore the default cache size after a test modifies it.
+    """
+    yield
+    set_config_cache_size(CONFIG_CACHE_SIZE)
+
+
+class TestLayeredConfig:
+    """
+    Class to test merging layered config files.
+    """
+
+    def test_layers_merged(self, layers):  # pylint: disable=unused-argument
+        """
+        Test later files override the values of earlier files, and missing files are skipped.
+        """
+        args = target()
+        assert args.arg1 == "base1"
+        assert args.arg2 == "site2"
+        assert args.arg3 == [3]
+
+    def test_nested_mappings_merged(self, fs):  # pylint: disable=unused-argument
+        """
+        Test nested mappings are merged, and other values replaced.
+        """
+        fs.create_file("base.json", contents='{"a": {"b": {"c": 1, "d": 2}, "e": 3}, "f": {"g": 4}}')
+        fs.create_file("local.json", contents='{"a": {"b": {"d": 5}}, "f": 6}')
+        assert read_layered_config(CONFIG_NAMES) == {"a": {"b": {"c": 1, "d": 5}, "e": 3}, "f": 6}
+
+    def test_only_used_section_merged(self, layers):  # pylint: disable=unused-argument
+        """
+        Test only the sections used are merged, and, with section loading, parsed.
+        """
+        set_section_loading(True)
+        try:
+            assert target().arg2 == "site2"
+            base = read_config("base")
+        finally:
+            set_section_loading(False)
+        assert isinstance(base, SectionedConfig)
+        assert list(base._sections) == ["target"]  # noqa: SLF001 pylint: disable=protected-access
+        merged = read_layered_config(CONFIG_NAMES)
+        assert merged["target"] is merged["target"]
+        assert list(merged) == ["target", "other"]
+        assert len(merged) == 2
+        assert "other" in merged
+        assert "missing" not in merged
+        with pytest.raises(KeyError):
+            merged["missing"]  # pylint: disable=pointless-statement
+
+    def test_not_a_mapping(self, layers):
+        """
+        Test a file that is not a mapping is skipped.
+        """
+        layers.create_file("local.json", contents="[1]")
+        assert target().arg2 == "site2"
+
+    def test_no_files(self, fs):  # pylint: disable=unused-argument
+        """
+        Test None is returned, and defaults used, if no file is found.
+        """
+        assert read_layered_config(CONFIG_NAMES) is None
+        assert target().arg1.value is None
+
+    def test_merge_cached(self, layers):
+        """
+        Test the merged data is reused until a file is modified.
+        """
+        merged = read_layered_config(CONFIG_NAMES)
+        assert read_layered_config(CONFIG_NAMES) is merged
+        layers.create_file("local.yaml", contents="target:\n  arg1: local1\n")
+        os.utime(".", ns=(0, 1))
+        assert read_layered_config(CONFIG_NAMES)["target"]["arg1"] == "local1"
+        Path("local.yaml").write_text("target:\n  arg1: local2\n")
+        os.utime("local.yaml", ns=(0, 2))
+        assert target().arg1 == "local2"
+
+    def test_cache_disabled(self, layers, cache_size):  # pylint: disable=unused-argument
+        """
+        Test files are read and merged on every use when the config cache is disabled.
+        """
+        set_config_cache_size(0)
+        assert read_layered_config(CONFIG_NAMES) is not read_layered_config(CONFIG_NAMES)
+
+    def test_class_tuple_and_paths(self, layers):  # pylint: disable=unused-argument
+        """
+        Test a tuple of config names and paths may be used with ClassArgInit.
+        """
+
+        class Target:
+            """Test Class"""
+
+            def __init__(self, arg1=None, arg2=None):  # pylint: disable=unused-argument
+                ClassArgInit(config_name=(Path("base.yaml"), "site"))
+
+        Path("base.yaml").write_text("Target:\n  arg1: base1\n  arg2: base2\n")
+        Path("site.toml").write_text('[Target]\narg2 = "site2"\n')
+        target_instance = Target()
+        assert target_instance._arg1 == "base1"  # noqa: SLF001 pylint: disable=protected-access
+        assert target_instance._arg2 == "site2"  # noqa: SLF001 pylint: disable=protected-access
+
+    def test_timed(self, layers):  # pylint: disable=unused-argument
+        """
+        Test each file is timed when timing is enabled.
+        """
+        timings = []
+        set_timing_hook(timings.append)
+        try:
+            assert target().arg2 == "site2"
+        finally:
+            set_timing_hook(None)
+        assert timings[0].config_parse > 0
@@ -0,0 +1,86 @@
+"""
+Test lazy argument resolution
+"""
+
+import pytest
+
+from arg_init import ClassArgInit, FunctionArgInit, LazyArgs
+
+
+class TestLazyArgs:
+    """
+    Class to test arguments are resolved on first access when lazy=True.
+    """
+
+    def test_resolved_on_access(self, fs):  # pylint: disable=unused-argument
+        """
+        Test an argument is resolved when first accessed, and memoized
+        """
+
+        def test(arg1=None):  # pylint: disable=unused-argument
+            return FunctionArgInit(lazy=True).args
+
+        args = test()
+        assert isinstance(args, LazyArgs)
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setenv("ARG1", "env1_value")
+            assert args.arg1 == "env1_value"
+            mp.setenv("ARG1", "env2_value")
+            assert args["arg1"] == "env1_value"
+
+    def test_resolve_all(self, fs):  # pylint: disable=unused-argument
+        """
+        Test resolve_all resolves all pending arguments
+        """
+
+        def test(arg1, arg2=None):  # pylint: disable=unused-argument
+            return FunctionArgInit(lazy=True).args
+
+        args = test("arg1_value")
+        assert repr(args) == "<LazyArgs(arg1=<pending>, arg2=<pending>)>"
+        args.resolve_all()
+        assert "pending" not in repr(args)
+        assert dict(args) == {"arg1": "arg1_value", "arg2": None}
+        assert len(args) == 2
+
+    def test_config_resolved(self, fs):
+        """
+        Test config values are resolved lazily
+        """
+
+        def test(arg1=None):  # pylint: disable=unused-argument
+            return FunctionArgInit(lazy=True).args
+
+        fs.create_file("config.yaml", contents="test:\n  arg1: config1_value")
+        assert test().arg1 == "config1_value"
+
+    def test_missing_argument(self, fs):  # pylint: disable=unused-argument
+        """
+        Test accessing an unknown argument raises KeyError or AttributeError
+        """
+
+        def test(arg1=None):  # pylint: disable=unused-argument
+            return FunctionArgInit(lazy=True).args
+
+        args = test()
+        with pytest.raises(KeyError):
+            args["arg2"]  # pylint: disable=pointless-statement
+        with pytest.raises(AttributeError):
+            args.arg2  # pylint: disable=pointless-statement
+        with pytest.raises(AttributeError):
+            args.__missing__  # pylint: disable=pointless-statement
+
+    def test_class_attrs_set(self, fs):  # pylint: disable=unused-argument
+        """
+        Test all arguments are resolved to set class attributes
+        """
+
+        class Test:
+            """Test Class"""
+
+            def __init__(self, arg1, **kwargs):  # pylint: disable=unused-argument
+                ClassArgInit(lazy=True, use_kwargs=True)
+
+        test = Test("arg1_value", kwarg1="kwarg1_value")
+        assert test._arg1 == "arg1_value"  # pylint: disable=protected-access
+        assert test._kwarg1 == "kwarg1_value"  # pylint: disable=protected-access
@@ -0,0 +1,92 @@
+"""
+Test slow to import modules are only imported when required
+"""
+
+import subprocess
+import sys
+from dataclasses import asdict, replace
+
+import pytest
+
+from arg_init import ArgDefaults
+from arg_init._values import Values
+
+LAZY_MODULES = ("box", "yaml", "tomllib", "json", "tempfile", "hashlib")
+
+
+def imported_modules(code):
+    """
+    Return the lazily imported modules that have been imported after running code in a new interpreter.
+    """
+    check = f"import sys; {code}; print(*[name for name in {LAZY_MODULES!r} if name in sys.modules])"
+    result = subprocess.run([sys.executable, "-c", check], capture_output=True, text=True, check=True)
+    return result.stdout.split()
+
+
+class TestLazyImports:
+    """
+    Class to test parsers, box and the disk cache dependencies are not imported by "import arg_init".
+    """
+
+    def test_import(self):
+        """
+        Test none of the lazily imported modules are imported by "import arg_init"
+        """
+        assert imported_modules("import arg_init") == []
+
+    @pytest.mark.parametrize(
+        "code, expected",
+        [
+            (
+                "from arg_init import FunctionArgInit; (lambda arg1=None: FunctionArgInit(result_type='namespace'))()",
+                [],
+            ),
+            ("from arg_init import arg_init", []),
+            (
+                "from arg_init._config import _get_loader; from pathlib import Path; _get_loader(Path('a.toml'))",
+                ["tomllib"],
+            ),
+        ],
+    )
+    def test_imported_on_use(self, code, expected):
+        """
+        Test modules are only imported when required
+        """
+        assert imported_modules(code) == expected
+
+    def test_unknown_attribute(self):
+        """
+        Test an AttributeError is raised for an unknown attribute of the package
+        """
+        with pytest.raises(AttributeError):
+            _ = __import__("arg_init").unknown
+
+
+class TestEquality:
+    """
+    Class to test equality of ArgDefaults and Values.
+    """
+
+    def test_arg_defaults(self):
+        """
+        Test ArgDefaults are equal if all attributes are equal
+        """
+        assert ArgDefaults(name="arg1", default_value=1) == ArgDefaults(name="arg1", default_value=1)
+        assert ArgDefaults(name="arg1", default_value=1) != ArgDefaults(name="arg1", default_value=2)
+        assert ArgDefaults(name="arg1") != "arg1"
+
+    def test_arg_defaults_dataclass(self):
+        """
+        Test ArgDefaults is a dataclass, so it can be copied and converted using dataclasses functions
+        """
+        arg_defaults = ArgDefaults(name="arg1", default_value=1)
+        assert replace(arg_defaults, default_value=2) == ArgDefaults(name="arg1", default_value=2)
+        assert asdict(arg_defaults) == {"name": "arg1", "default_value": 1, "alt_name": None}
+        assert not hasattr(arg_defaults, "__dict__")
+
+    def test_values(self):
+        """
+        Test Values are not equal to other types
+        """
+        assert Values(arg=1) == Values(arg=1)
+        assert Values(arg=1) != 1
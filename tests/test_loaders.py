@@ -0,0 +1,109 @@
+"""
+Test the config loader registry and parser backends
+"""
+
+import math
+import sys
+from io import BytesIO
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+import yaml
+
+from arg_init import FunctionArgInit, register_loader, unregister_loader
+from arg_init import _config
+
+
+def load(config_format, contents):
+    """
+    Parse contents using the loader for config_format.
+    """
+    return _config._get_loader(Path(f"config.{config_format}"))(BytesIO(contents))  # pylint: disable=protected-access
+
+
+@pytest.fixture(name="default_loaders")
+def fixture_default_loaders(monkeypatch):
+    """
+    Discard all loaders created by previous tests, so each is recreated on use.
+    """
+    monkeypatch.setattr(_config, "_loaders", {})
+
+
+class TestLoaderRegistry:
+    """
+    Class to test loaders can be registered for new and built in formats.
+    """
+
+    def test_register_new_format(self, fs):
+        """
+        Test a config file with a registered format is found and used
+        """
+
+        def test(arg1=None):  # pylint: disable=unused-argument
+            return FunctionArgInit().args
+
+        fs.create_file("config.cfg", contents="arg1=config1_value")
+        register_loader("cfg", lambda f: {"test": dict([f.read().decode().split("=")])})
+        try:
+            assert test().arg1 == "config1_value"
+        finally:
+            unregister_loader("cfg")
+        assert "cfg" not in _config.FORMATS
+
+    def test_override_built_in_format(self, fs):
+        """
+        Test a registered loader replaces the default loader for a built in format, until unregistered
+        """
+
+        def test(arg1=None):  # pylint: disable=unused-argument
+            return FunctionArgInit().args
+
+        fs.create_file("config.yaml", contents="test:\n  arg1: config1_value\n")
+        register_loader("yaml", lambda f: {"test": {"arg1": "override"}})
+        try:
+            assert test().arg1 == "override"
+        finally:
+            unregister_loader("yaml")
+        assert test().arg1 == "config1_value"
+        assert "yaml" in _config.FORMATS
+
+
+class TestLoaderBackends:
+    """
+    Class to test the fastest parser installed is used, with a fallback to the standard parsers.
+    """
+
+    def test_yaml_without_libyaml(self, monkeypatch, default_loaders):  # pylint: disable=unused-argument
+        """
+        Test the pure python yaml loader is used if libyaml is not available
+        """
+        monkeypatch.delattr(yaml, "CSafeLoader", raising=False)
+        assert load("yaml", b"test:\n  arg1: 1\n") == {"test": {"arg1": 1}}
+
+    def test_json_without_orjson(self, monkeypatch, default_loaders):  # pylint: disable=unused-argument
+        """
+        Test the standard json loader is used if orjson is not installed
+        """
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        assert load("json", b'{"test": {"arg1": 1}}') == {"test": {"arg1": 1}}
+
+    def test_json_rejected_by_orjson(self, default_loaders):  # pylint: disable=unused-argument
+        """
+        Test files that are only accepted by the standard json loader can be read
+        """
+        assert math.isnan(load("json", b'{"test": {"arg1": NaN}}')["test"]["arg1"])
+
+    def test_toml_with_rtoml(self, monkeypatch, default_loaders):  # pylint: disable=unused-argument
+        """
+        Test rtoml is used if installed
+        """
+        monkeypatch.setitem(sys.modules, "rtoml", SimpleNamespace(loads=lambda text: {"rtoml": text}))
+        assert load("toml", b"arg1 = 1") == {"rtoml": "arg1 = 1"}
+
+    def test_toml_without_rtoml(self, monkeypatch, default_loaders):  # pylint: disable=unused-argument
+        """
+        Test tomllib is used if rtoml is not installed
+        """
+        monkeypatch.setitem(sys.modules, "rtoml", None)
+        assert load("toml", b"[test]\narg1 = 1") == {"test": {"arg1": 1}}
@@ -0,0 +1,44 @@
+"""
+Test the LRU cache used by the arg_init caches
+"""
+
+from arg_init._cache import LRUCache
+
+
+class TestLRUCache:
+    """
+    Class to test LRUCache.
+    """
+
+    def test_get_and_set(self):
+        """
+        Test entries can be retrieved and hits and misses are counted
+        """
+
+        cache = LRUCache(2)
+        assert cache.get("a") is None
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        assert cache.info() == (1, 1, 2, 1)
+
+    def test_zero_maxsize_stores_nothing(self):
+        """
+        Test a cache with a maxsize of 0 is disabled
+        """
+
+        cache = LRUCache(0)
+        cache.set("a", 1)
+        assert cache.get("a") is None
+
+    def test_reducing_maxsize_evicts(self):
+        """
+        Test reducing maxsize evicts the least recently used entries
+        """
+
+        cache = LRUCache(3)
+        for key in ("a", "b", "c"):
+            cache.set(key, key)
+        cache.get("a")
+        cache.maxsize = 1
+        assert cache.get("a") == "a"
+        assert cache.get("b") is None
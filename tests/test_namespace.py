@@ -0,0 +1,120 @@
+"""
+Test the namespace result type
+"""
+
+import pytest
+
+from arg_init import ArgsNamespace, ClassArgInit, FunctionArgInit, class_arg_init
+
+
+class TestNamespace:
+    """
+    Class to test resolved arguments can be returned as an ArgsNamespace.
+    """
+
+    def test_access(self, fs):  # pylint: disable=unused-argument
+        """
+        Test arguments can be accessed as attributes or key/value pairs
+        """
+
+        def test(arg1, arg2=None):  # pylint: disable=unused-argument
+            return FunctionArgInit(result_type="namespace").args
+
+        args = test("arg1_value")
+        assert isinstance(args, ArgsNamespace)
+        assert args.arg1 == "arg1_value"
+        assert args["arg1"] == "arg1_value"
+        assert args["arg2"] == None
+        assert list(args) == ["arg1", "arg2"]
+        assert len(args) == 2
+        assert "arg1" in args
+        assert repr(args).startswith("<ArgsNamespace(arg1=<Arg(name=arg1")
+
+    def test_no_dict(self, fs):  # pylint: disable=unused-argument
+        """
+        Test the namespace has no per instance __dict__
+        """
+
+        def test(arg1):  # pylint: disable=unused-argument
+            return FunctionArgInit(result_type="namespace").args
+
+        args = test("arg1_value")
+        assert not hasattr(args, "__dict__")
+        with pytest.raises(AttributeError):
+            args.arg2 = None  # pylint: disable=attribute-defined-outside-init
+
+    def test_class_shared_per_call_site(self, fs):  # pylint: disable=unused-argument
+        """
+        Test one namespace class is generated for a call site
+        """
+
+        def test(arg1):  # pylint: disable=unused-argument
+            return FunctionArgInit(result_type="namespace").args
+
+        assert type(test(1)) is type(test(2))
+
+    def test_unknown_key(self, fs):  # pylint: disable=unused-argument
+        """
+        Test a KeyError is raised for a name that is not an argument
+        """
+
+        def test(arg1):  # pylint: disable=unused-argument
+            return FunctionArgInit(result_type="namespace").args
+
+        args = test(1)
+        with pytest.raises(KeyError):
+            args["keys"]  # pylint: disable=pointless-statement
+        with pytest.raises(KeyError):
+            args["keys"] = None
+
+    def test_mapping_method_names(self, fs):  # pylint: disable=unused-argument
+        """
+        Test arguments named after Mapping methods do not shadow the methods, and are accessed by key
+        """
+
+        def test(values, keys=None, arg_values=None):  # pylint: disable=unused-argument
+            return FunctionArgInit(result_type="namespace").args
+
+        args = test("values_value", arg_values="arg_values_value")
+        assert args["values"] == "values_value"
+        assert args["arg_values"] == "arg_values_value"
+        assert [arg.value for arg in args.values()] == ["values_value", None, "arg_values_value"]
+        assert list(args.keys()) == ["values", "keys", "arg_values"]
+        assert args.get("keys") == None
+
+        @class_arg_init
+        class Test:
+            """Test Class"""
+
+            def __init__(self, values=None, items=None):
+                self.values = (values, items)
+
+        assert Test("values_value").values == ("values_value", None)
+        assert Test(items=1)._items == 1  # noqa: SLF001 pylint: disable=protected-access
+
+    def test_class_with_kwargs(self, fs):  # pylint: disable=unused-argument
+        """
+        Test kwargs are included and class attributes are set
+        """
+
+        class Test:
+            """Test Class"""
+
+            def __init__(self, arg1, **kwargs):  # pylint: disable=unused-argument
+                self.args = ClassArgInit(result_type="namespace", use_kwargs=True).args
+
+        test = Test("arg1_value", kwarg1="kwarg1_value")
+        assert test._arg1 == "arg1_value"  # pylint: disable=protected-access
+        assert test._kwarg1 == "kwarg1_value"  # pylint: disable=protected-access
+        assert test.args.kwarg1 == "kwarg1_value"
+
+    def test_unsupported_result_type(self, fs):  # pylint: disable=unused-argument
+        """
+        Test an unsupported result type raises an exception
+        """
+
+        def test(arg1):  # pylint: disable=unused-argument
+            return FunctionArgInit(result_type="tuple").args
+
+        with pytest.raises(ValueError):
+            test(1)
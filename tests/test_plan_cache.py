@@ -0,0 +1,161 @@
+"""
+Test resolution plans are cached per call site
+"""
+
+import pytest
+
+from arg_init import (
+    ArgDefaults,
+    ClassArgInit,
+    FunctionArgInit,
+    cached_plans,
+    clear_plan_cache,
+    plan_cache_info,
+)
+from arg_init import _plan
+
+
+class TestPlanCache:
+    """
+    Class to test the resolution plan cache.
+    """
+
+    def test_plan_reused(self, fs):  # pylint: disable=unused-argument
+        """
+        Test a plan is built on the first call and reused on subsequent calls
+        """
+
+        def test(arg1, arg2=None):  # pylint: disable=unused-argument
+            return FunctionArgInit(env_prefix="prefix").args
+
+        for value in ("a", "b", "c"):
+            args = test(value)
+            assert args.arg1 == value
+        info = plan_cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+        assert cached_plans() == [
+            (("arg1", "arg2"), ("PREFIX_ARG1", "PREFIX_ARG2"), ("arg1", "arg2"), (None, None), (None, None))
+        ]
+
+    def test_env_looked_up_per_call(self, fs):  # pylint: disable=unused-argument
+        """
+        Test env values are not cached in the plan
+        """
+
+        def test(arg1=None):  # pylint: disable=unused-argument
+            return FunctionArgInit().args
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setenv("ARG1", "env1_value")
+            assert test().arg1 == "env1_value"
+            mp.setenv("ARG1", "env2_value")
+            assert test().arg1 == "env2_value"
+
+    def test_defaults_identity(self, fs):  # pylint: disable=unused-argument
+        """
+        Test a different defaults list results in a different plan
+        """
+
+        def test(defaults, arg1=None):  # pylint: disable=unused-argument
+            return FunctionArgInit(defaults=defaults).args
+
+        assert test([ArgDefaults(name="arg1", default_value="default1")]).arg1 == "default1"
+        assert test([ArgDefaults(name="arg1", default_value="default2")]).arg1 == "default2"
+        assert plan_cache_info().misses == 2
+
+    def test_defaults_by_value(self, fs):  # pylint: disable=unused-argument
+        """
+        Test defaults created on each call, in a list or mapping, reuse the plan
+        """
+
+        def test(arg1=None):  # pylint: disable=unused-argument
+            return FunctionArgInit(defaults=[ArgDefaults(name="arg1", default_value="default1")]).args
+
+        def mapping(arg1=None):  # pylint: disable=unused-argument
+            return FunctionArgInit(defaults={"arg1": ArgDefaults(name="arg1", alt_name="alt1")}).args
+
+        for _ in range(3):
+            assert test().arg1 == "default1"
+            assert mapping().arg1.env_name == "ALT1"
+        assert plan_cache_info().misses == 2
+        assert plan_cache_info().currsize == 2
+
+    def test_defaults_by_type(self, fs):  # pylint: disable=unused-argument
+        """
+        Test default values that are equal, but of different types, use different plans
+        """
+
+        def test(defaults, arg1=None):  # pylint: disable=unused-argument
+            return FunctionArgInit(defaults=defaults).args
+
+        for value in (1, True, 1.0, [1], [True], (1,)):
+            result = test([ArgDefaults(name="arg1", default_value=value)]).arg1.value
+            assert (type(result), result) == (type(value), value)
+        assert plan_cache_info().misses == 6
+
+    def test_unhashable_defaults(self, fs):  # pylint: disable=unused-argument
+        """
+        Test defaults with a list, set or dict default value are identified by contents, and with other
+        unhashable default values by identity
+        """
+
+        def test(defaults, arg1=None):  # pylint: disable=unused-argument
+            return FunctionArgInit(defaults=defaults).args
+
+        for _ in range(2):
+            assert test([ArgDefaults(name="arg1", default_value=[1, {"a": {2}}])]).arg1 == [1, {"a": {2}}]
+        assert test([ArgDefaults(name="arg1", default_value=[2])]).arg1 == [2]
+        assert plan_cache_info().misses == 2
+        defaults = [ArgDefaults(name="arg1", default_value=bytearray(b"1"))]
+        assert test(defaults).arg1 == b"1"
+        assert test(defaults).arg1 == b"1"
+        assert test([ArgDefaults(name="arg1", default_value=bytearray(b"1"))]).arg1 == b"1"
+        assert plan_cache_info().misses == 4
+
+    def test_reused_defaults_by_identity(self, fs, monkeypatch):  # pylint: disable=unused-argument
+        """
+        Test the key of a reused defaults list is built once, and defaults created per call are not held
+        """
+        keys = []
+        defaults_key = _plan._defaults_key  # noqa: SLF001 pylint: disable=protected-access
+        monkeypatch.setattr(_plan, "_defaults_key", lambda defaults: keys.append(defaults) or defaults_key(defaults))
+
+        def test(defaults, arg1=None):  # pylint: disable=unused-argument
+            return FunctionArgInit(defaults=defaults).args
+
+        defaults = [ArgDefaults(name=f"arg{index}", default_value=index) for index in range(1000)]
+        for _ in range(5):
+            assert test(defaults).arg1 == 1
+        assert len(keys) == 2
+        for _ in range(3):
+            assert test([ArgDefaults(name="arg1", default_value=2)]).arg1 == 2
+        assert len(keys) == 5
+        assert len(_plan._defaults_cache.values()) == 1  # noqa: SLF001 pylint: disable=protected-access
+        assert plan_cache_info().misses == 2
+
+    def test_class_plan_skips_self(self, fs):  # pylint: disable=unused-argument
+        """
+        Test the plan for a class method excludes the class instance
+        """
+
+        class Test:
+            """Test Class"""
+
+            def __init__(self, arg1=None):  # pylint: disable=unused-argument
+                ClassArgInit()
+
+        Test()
+        assert cached_plans()[0].names == ("arg1",)
+
+    def test_clear(self, fs):  # pylint: disable=unused-argument
+        """
+        Test clearing the cache removes all plans
+        """
+
+        def test(arg1=None):  # pylint: disable=unused-argument
+            return FunctionArgInit().args
+
+        test()
+        clear_plan_cache()
+        assert not cached_plans()
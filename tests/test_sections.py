@@ -0,0 +1,212 @@
+"""
+Test section-selective loading of config files
+"""
+
+import os
+
+import pytest
+
+from arg_init import FunctionArgInit, register_loader, set_config_ttl, set_section_loading, unregister_loader
+from arg_init._config import SectionedConfig, read_config
+from arg_init._sections import index_json, index_toml, index_yaml
+
+YAML = b"""\
+# Comment
+first:
+  arg1: first1
+  list:
+  - 1
+second:
+  arg1: second1
+"""
+
+TOML = b"""\
+# Comment
+
+[first]
+arg1 = "first1"
+
+[second]
+arg1 = "second1"
+
+[first.nested]
+arg2 = "nested"
+"""
+
+JSON = b'{"first": {"arg1": "first1", "list": [1, "]"]}, "second": {"arg1": "second1"}}'
+
+
+@pytest.fixture(name="section_loading")
+def fixture_section_loading():
+    """
+    Enable section loading for the duration of a test.
+    """
+    set_section_loading(True)
+    yield
+    set_section_loading(False)
+
+
+def sections(data, spans):
+    """
+    Return the bytes of each section.
+    """
+    return {name: b"".join(data[start:end] for start, end in section) for name, section in spans.items()}
+
+
+class TestIndexers:
+    """
+    Class to test the spans of each section are found, or None is returned if a file cannot be indexed.
+    """
+
+    def test_yaml(self):
+        """
+        Test each top level key of a YAML file is a section
+        """
+        result = sections(YAML, index_yaml(YAML))
+        assert result == {
+            "first": b"first:\n  arg1: first1\n  list:\n  - 1\n",
+            "second": b"second:\n  arg1: second1\n",
+        }
+
+    def test_toml(self):
+        """
+        Test all tables with the same first key are a section
+        """
+        result = sections(TOML, index_toml(TOML))
+        assert result["first"] == b'[first]\narg1 = "first1"\n\n[first.nested]\narg2 = "nested"\n'
+        assert list(result) == ["first", "second"]
+
+    def test_json(self):
+        """
+        Test each key of the top level object of a JSON file is a section
+        """
+        result = sections(JSON, index_json(JSON))
+        assert result == {
+            "first": b'"first": {"arg1": "first1", "list": [1, "]"]}',
+            "second": b'"second": {"arg1": "second1"}',
+        }
+
+    @pytest.mark.parametrize(
+        "indexer, data",
+        [
+            (index_yaml, b"---\nfirst:\n  arg1: 1\n"),
+            (index_yaml, b'"first":\n  arg1: 1\n'),
+            (index_yaml, b"first:\n  arg1: 1\nfirst:\n  arg1: 2\n"),
+            (index_toml, b'[first]\narg1 = """\n[second]\n"""\n'),
+            (index_toml, b'["first"]\narg1 = 1\n'),
+            (index_toml, b"[first]\narg1 = [\n  [1],\n]\n"),
+            (index_toml, b"[first]\narg1 = [\n  1,\n]\n"),
+            (index_toml, b'first.arg1 = "first1"\n'),
+            (index_toml, b"first = { arg1 = 1 }\n"),
+            (index_toml, b'title = "not a section"\n[first]\narg1 = 1\n'),
+            (index_json, b'["first"]'),
+            (index_json, b'{"first": 1'),
+        ],
+    )
+    def test_not_indexed(self, indexer, data):
+        """
+        Test None is returned for files that could not be reliably indexed
+        """
+        assert indexer(data) is None
+
+
+class TestSectionLoading:
+    """
+    Class to test only the sections used are parsed.
+    """
+
+    @pytest.mark.parametrize("config_format, data", [("yaml", YAML), ("toml", TOML), ("json", JSON)])
+    def test_only_used_section_parsed(self, fs, section_loading, config_format, data):  # pylint: disable=unused-argument
+        """
+        Test a section is resolved, and only that section is parsed
+        """
+
+        def second(arg1=None):  # pylint: disable=unused-argument
+            return FunctionArgInit().args
+
+        fs.create_file(f"config.{config_format}", contents=data)
+        assert second().arg1 == "second1"
+        config = read_config("config")
+        assert isinstance(config, SectionedConfig)
+        assert list(config._sections) == ["second"]  # pylint: disable=protected-access
+        assert config["second"] is config["second"]
+        assert "first" in config
+        assert len(config) == 2
+
+    def test_cross_section_alias(self, fs, section_loading):  # pylint: disable=unused-argument
+        """
+        Test a section that cannot be parsed alone is read by parsing the whole file
+        """
+        fs.create_file("config.yaml", contents="first: &value\n  arg1: first1\nsecond: *value\n")
+        config = read_config("config")
+        assert config["second"] == {"arg1": "first1"}
+        assert "first" in config
+        assert list(config) == ["first", "second"]
+        assert len(config) == 2
+        assert config["first"] == {"arg1": "first1"}
+
+    def test_toml_root_keys(self, fs, section_loading):  # pylint: disable=unused-argument
+        """
+        Test a TOML file with keys in the root table, e.g. an inline table, is parsed as a whole
+        """
+
+        def second(arg1=None):  # pylint: disable=unused-argument
+            return FunctionArgInit().args
+
+        fs.create_file("config.toml", contents='second = { arg1 = 7 }\n\n[first]\narg1 = "first1"\n')
+        assert second().arg1 == 7
+        assert not isinstance(read_config("config"), SectionedConfig)
+
+    def test_modified_after_indexing(self, fs, section_loading):  # pylint: disable=unused-argument
+        """
+        Test the whole file is parsed if it is modified after it was indexed
+        """
+        file = fs.create_file("config.yaml", contents="first:\n  arg1: first1\n")
+        config = read_config("config")
+        file.set_contents("first:\n  arg1: modified\n")
+        os.utime("config.yaml", ns=(0, 1))
+        assert config["first"] == {"arg1": "modified"}
+
+    def test_section_removed_after_indexing(self, fs, section_loading):  # pylint: disable=unused-argument
+        """
+        Test a section removed after the file was indexed, while the cached file is used, is treated as missing
+        """
+
+        def first(arg1=None):  # pylint: disable=unused-argument
+            return FunctionArgInit().args
+
+        def second(arg1=None):  # pylint: disable=unused-argument
+            return FunctionArgInit().args
+
+        file = fs.create_file("config.yaml", contents="first:\n  arg1: first1\nsecond:\n  arg1: second1\n")
+        set_config_ttl(60)
+        try:
+            assert first().arg1.value == "first1"
+            file.set_contents("first:\n  arg1: modified\n")
+            os.utime("config.yaml", ns=(0, 1))
+            assert second().arg1.value is None
+            config = read_config("config")
+        finally:
+            set_config_ttl(None)
+        assert "second" not in config
+        assert list(config) == ["first"]
+        with pytest.raises(KeyError):
+            config["second"]  # pylint: disable=pointless-statement
+
+    def test_not_indexed(self, fs, section_loading):  # pylint: disable=unused-argument
+        """
+        Test a file that cannot be indexed is parsed as a whole
+        """
+        fs.create_file("config.yaml", contents="---\nfirst:\n  arg1: first1\n")
+        assert read_config("config") == {"first": {"arg1": "first1"}}
+
+    def test_registered_format(self, fs, section_loading):  # pylint: disable=unused-argument
+        """
+        Test a format without an indexer is parsed as a whole
+        """
+        fs.create_file("config.cfg", contents="")
+        register_loader("cfg", lambda f: {"first": {}})
+        try:
+            assert read_config("config") == {"first": {}}
+        finally:
+            unregister_loader("cfg")
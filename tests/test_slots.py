@@ -0,0 +1,47 @@
+"""
+Test compact representations of resolved arguments
+"""
+
+from arg_init import ArgDefaults, ClassArgInit, FunctionArgInit
+from arg_init._arg import Arg
+from arg_init._values import Values
+
+
+class TestSlots:
+    """
+    Class to test objects held for each resolved argument have no __dict__.
+    """
+
+    def test_no_instance_dict(self, fs):  # pylint: disable=unused-argument
+        """
+        Test Arg, Values, ArgDefaults and ArgInit instances have no __dict__
+        """
+
+        def test(arg1):  # pylint: disable=unused-argument
+            return FunctionArgInit()
+
+        arg_init = test("arg1_value")
+        for obj in (arg_init, arg_init.args.arg1, arg_init.args.arg1.values, ArgDefaults(name="arg1")):
+            assert not hasattr(obj, "__dict__")
+
+    def test_class_arg_init_no_instance_dict(self, fs):  # pylint: disable=unused-argument
+        """
+        Test ClassArgInit instances have no __dict__
+        """
+
+        class Test:
+            """Test Class"""
+
+            def __init__(self, arg1=None):  # pylint: disable=unused-argument
+                self.arg_init = ClassArgInit()
+
+        assert not hasattr(Test().arg_init, "__dict__")
+
+    def test_arg_from_values(self):
+        """
+        Test an Arg can be created from a Values object
+        """
+
+        values = Values(arg=None, env="env1_value", config=None, default="default")
+        arg = Arg("arg1", "ARG1", "arg1", values)
+        assert arg.values == values
@@ -0,0 +1,209 @@
+"""
+Test arguments are resolved correctly by concurrent threads
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from arg_init import ClassArgInit, invalidate_env_snapshots, register_loader, unregister_loader
+from arg_init import _config
+from arg_init._cache import LRUCache
+from arg_init._config import read_config
+from arg_init._env import get_env_snapshot
+
+THREADS = 8
+CONSTRUCTIONS = 200
+
+
+class Worker:
+    """Class resolving its arguments from config, env and args."""
+
+    def __init__(self, index, arg1=None, arg2=None, arg3=None):  # pylint: disable=unused-argument
+        ClassArgInit(env_prefix="threads", env_snapshot=True)
+
+
+class SlowLoader:
+    """
+    Loader that takes long enough for other threads to find the file not cached, counting the files parsed.
+    """
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, f):
+        self.count += 1
+        time.sleep(0.05)
+        return {"Worker": {"arg1": f.read().decode().strip()}}
+
+
+@pytest.fixture(name="loader")
+def fixture_loader(tmp_path, monkeypatch):
+    """
+    Register a slow loader for YAML files, in a temporary working directory.
+    """
+    monkeypatch.chdir(tmp_path)
+    loader = SlowLoader()
+    register_loader("yaml", loader)
+    yield loader
+    unregister_loader("yaml")
+
+
+class TestThreads:
+    """
+    Class to test resolving arguments from many threads.
+    """
+
+    def test_concurrent_construction(self, tmp_path, monkeypatch):
+        """
+        Test objects constructed concurrently each resolve the correct values.
+        """
+        monkeypatch.chdir(tmp_path)
+        Path("config.yaml").write_text("Worker:\n  arg1: config1_value\n")
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setenv("THREADS_ARG2", "env2_value")
+            invalidate_env_snapshots()
+            with ThreadPoolExecutor(THREADS) as executor:
+                workers = list(executor.map(lambda index: Worker(index, arg3=index), range(CONSTRUCTIONS)))
+        for index, worker in enumerate(workers):
+            assert worker._arg1 == "config1_value"  # noqa: SLF001 pylint: disable=protected-access
+            assert worker._arg2 == "env2_value"  # noqa: SLF001 pylint: disable=protected-access
+            assert worker._arg3 == index  # noqa: SLF001 pylint: disable=protected-access
+
+    def test_config_parsed_once(self, loader):
+        """
+        Test a config file read by many threads at the same time is parsed once.
+        """
+        Path("config.yaml").write_text("config1_value")
+        barrier = threading.Barrier(THREADS)
+
+        def read():
+            barrier.wait()
+            return read_config("config")
+
+        with ThreadPoolExecutor(THREADS) as executor:
+            results = list(executor.map(lambda _: read(), range(THREADS)))
+        assert loader.count == 1
+        assert all(result is results[0] for result in results)
+
+    def test_waiting_thread_uses_result(self, loader, monkeypatch):
+        """
+        Test a thread that waits for another to parse the file uses its result.
+        """
+        path = Path("config.yaml")
+        path.write_text("config1_value")
+        path = path.resolve()
+
+        class ParsingLock:
+            """A lock held by another thread, which parses the file while it is waited for."""
+
+            def acquire(self, blocking=True):  # pylint: disable=unused-argument
+                return False
+
+            def __enter__(self):
+                monkeypatch.setattr(_config, "_parse_lock", lambda path: threading.Lock())
+                read_config(path)
+
+            def __exit__(self, *args):
+                pass
+
+        lock = ParsingLock()
+        monkeypatch.setattr(_config, "_parse_lock", lambda path: lock)
+        assert read_config(path) == {"Worker": {"arg1": "config1_value"}}
+        assert loader.count == 1
+
+    def test_waiting_thread_parses_modified_file(self, loader, monkeypatch):
+        """
+        Test a thread that waits for another to parse the file parses it, if the file has been modified.
+        """
+        path = Path("config.yaml")
+        path.write_text("config1_value")
+        path = path.resolve()
+
+        class ParsingLock:
+            """A lock held by another thread, which fails to parse the file while it is waited for."""
+
+            def __init__(self):
+                self.acquired = False
+
+            def acquire(self, blocking=True):
+                self.acquired = blocking
+                return False
+
+            def release(self):
+                pass
+
+            def __enter__(self):
+                pass
+
+            def __exit__(self, *args):
+                pass
+
+        lock = ParsingLock()
+        monkeypatch.setattr(_config, "_parse_lock", lambda path: lock)
+        assert read_config(path) == {"Worker": {"arg1": "config1_value"}}
+        assert lock.acquired
+        assert loader.count == 1
+
+    def test_parse_locks_bounded(self, loader):
+        """
+        Test the parse locks do not grow with the number of files read, and files read concurrently are each parsed.
+        """
+        paths = [Path(f"config{index}.yaml") for index in range(4 * _config.PARSE_LOCK_COUNT)]
+        for path in paths:
+            path.write_text(path.stem)
+        with ThreadPoolExecutor(THREADS) as executor:
+            results = list(executor.map(read_config, paths))
+        assert [result["Worker"]["arg1"] for result in results] == [path.stem for path in paths]
+        assert loader.count == len(paths)
+        assert len(_config._parse_locks) == _config.PARSE_LOCK_COUNT  # noqa: SLF001 pylint: disable=protected-access
+
+    def test_lru_cache(self):
+        """
+        Test a cache used by many threads remains bounded and consistent.
+        """
+        cache = LRUCache(16)
+
+        def use(thread):
+            for i in range(2000):
+                key = (thread + i) % 64
+                value = cache.get(key)
+                assert value is None or value == key
+                cache.set(key, key)
+                if i % 100 == 0:
+                    cache.pop(key)
+
+        with ThreadPoolExecutor(THREADS) as executor:
+            list(executor.map(use, range(THREADS)))
+        assert len(cache.values()) <= 16
+        assert all(cache.get(value) == value for value in cache.values())
+
+    def test_env_snapshot(self):
+        """
+        Test threads reading a snapshot while it is invalidated see the environment before or after a change.
+        """
+        snapshot = get_env_snapshot("threads")
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setenv("THREADS_ARG1", "0")
+            invalidate_env_snapshots()
+            stop = threading.Event()
+
+            def read():
+                values = set()
+                while not stop.is_set():
+                    values.add(snapshot.get("THREADS_ARG1"))
+                return values
+
+            with ThreadPoolExecutor(THREADS) as executor:
+                futures = [executor.submit(read) for _ in range(THREADS - 1)]
+                for i in range(1, 100):
+                    os.environ["THREADS_ARG1"] = str(i)
+                    invalidate_env_snapshots()
+                stop.set()
+                values = set().union(*(future.result() for future in futures))
+        assert values <= {str(i) for i in range(100)}
+        assert get_env_snapshot("threads") is snapshot
@@ -0,0 +1,137 @@
+"""
+Test per phase timing hooks and debug logging
+"""
+
+import logging
+
+import pytest
+
+from arg_init import ClassArgInit, FunctionArgInit, Timings, arg_init, set_timing_hook
+
+
+@pytest.fixture(name="timings")
+def fixture_timings():
+    """
+    Register a hook collecting all reported timings.
+    """
+    reported = []
+    set_timing_hook(reported.append)
+    yield reported
+    set_timing_hook(None)
+
+
+class TestTiming:
+    """
+    Class to test the durations of each phase are reported to the hook.
+    """
+
+    def test_function_timings(self, fs, timings):  # pylint: disable=unused-argument
+        """
+        Test all phases performed by FunctionArgInit are timed
+        """
+
+        def test(arg1=None):  # pylint: disable=unused-argument
+            return FunctionArgInit().args
+
+        fs.create_file("config.yaml", contents="test:\n  arg1: config1_value\n")
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setenv("ARG1", "env1_value")
+            assert test().arg1 == "config1_value"
+        assert len(timings) == 1
+        result = timings[0]
+        assert result.name == "test"
+        assert result.frame_capture > 0
+        assert result.config_discovery > 0
+        assert result.config_parse > 0
+        assert result.env_lookup > 0
+        assert result.resolution > 0
+        assert result.total >= result.resolution
+
+    def test_class_timings(self, fs, timings):  # pylint: disable=unused-argument
+        """
+        Test attribute setting is timed for ClassArgInit
+        """
+
+        class Test:
+            """Test Class"""
+
+            def __init__(self, arg1=None):  # pylint: disable=unused-argument
+                ClassArgInit()
+
+        Test(arg1="arg1_value")
+        assert timings[0].name == "Test"
+        assert timings[0].attribute_setting > 0
+
+    def test_decorator_timings(self, fs, timings):  # pylint: disable=unused-argument
+        """
+        Test the decorators report timings, with no frame capture
+        """
+
+        @arg_init
+        def test(arg1=None):
+            return arg1
+
+        assert test(arg1="arg1_value") == "arg1_value"
+        assert timings[0].name == "test"
+        assert timings[0].frame_capture == 0
+        assert timings[0].resolution > 0
+
+    def test_no_config_file(self, fs, timings):  # pylint: disable=unused-argument
+        """
+        Test no parse time is recorded if no config file is found
+        """
+
+        def test(arg1=None):  # pylint: disable=unused-argument
+            return FunctionArgInit().args
+
+        test()
+        assert timings[0].config_discovery > 0
+        assert timings[0].config_parse == 0
+
+    def test_hook_removed(self, fs):  # pylint: disable=unused-argument
+        """
+        Test nothing is reported once the hook is removed
+        """
+        reported = []
+
+        def test(arg1=None):  # pylint: disable=unused-argument
+            return FunctionArgInit().args
+
+        set_timing_hook(reported.append)
+        set_timing_hook(None)
+        test()
+        assert not reported
+
+    def test_total(self):
+        """
+        Test total is the sum of all phases, and all phases are shown by repr
+        """
+        timings = Timings(
+            "test",
+            frame_capture=1,
+            config_discovery=2,
+            config_parse=3,
+            env_lookup=4,
+            resolution=5,
+            attribute_setting=6,
+        )
+        assert timings.total == 21
+        assert "resolution=5" in repr(timings)
+
+
+class TestDebugLogging:
+    """
+    Class to test resolution is logged when debug logging is enabled.
+    """
+
+    def test_resolution_logged(self, fs, caplog):  # pylint: disable=unused-argument
+        """
+        Test the resolved value and its source are logged
+        """
+
+        def test(arg1=None):  # pylint: disable=unused-argument
+            return FunctionArgInit().args
+
+        with caplog.at_level(logging.DEBUG, logger="arg_init._arg"):
+            test(arg1="arg1_value")
+        assert "Resolved arg1 = arg1_value from Priority.ARG" in caplog.text
@@ -0,0 +1,227 @@
+"""
+Test config files are watched and reloaded when modified
+"""
+
+import ctypes
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from arg_init import ConfigWatcher, FunctionArgInit
+from arg_init import _watcher
+from arg_init._watcher import _Inotify, watched_config
+
+
+def target(arg1=None):  # pylint: disable=unused-argument
+    return FunctionArgInit().args
+
+
+def wait_for(predicate, timeout=5.0):
+    """
+    Wait for the watcher thread to make predicate true.
+    """
+    end = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < end, "Timed out waiting for the watcher"
+        time.sleep(0.01)
+
+
+def write_config(path, value):
+    """
+    Replace the config file, changing its mtime and size.
+    """
+    path.write_text(f"target:\n  arg1: {value}\n")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture(name="config")
+def fixture_config(tmp_path, monkeypatch):
+    """
+    Create a config file in a temporary working directory.
+    """
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / "config.yaml"
+    write_config(path, "initial")
+    return path
+
+
+class TestWatcher:
+    """
+    Class to test ConfigWatcher.
+    """
+
+    def test_watch_publishes_snapshot(self, config):
+        """
+        Test the config file is parsed when watched, and used by ArgInit.
+        """
+        with ConfigWatcher(use_inotify=False) as watcher:
+            assert watcher.watch("config") == config
+            assert watched_config("config") == {"target": {"arg1": "initial"}}
+            config.unlink()
+            assert target().arg1 == "initial"
+
+    def test_unwatched_config_is_read(self, config):
+        """
+        Test a config file is read as normal once unwatched.
+        """
+        watcher = ConfigWatcher(use_inotify=False)
+        watcher.watch("config")
+        watcher.unwatch("config")
+        assert watched_config("config") is None
+        write_config(config, "modified")
+        assert target().arg1 == "modified"
+
+    def test_missing_config_raises(self, config):
+        """
+        Test watching a config file that does not exist raises FileNotFoundError.
+        """
+        watcher = ConfigWatcher(use_inotify=False)
+        with pytest.raises(FileNotFoundError):
+            watcher.watch("missing")
+        with pytest.raises(FileNotFoundError):
+            watcher.watch(config.with_name("missing.yaml"))
+
+    def test_poll_reloads_modified_config(self, config):
+        """
+        Test the polling backend publishes a new snapshot when the file is modified.
+        """
+        with ConfigWatcher(poll_interval=0.01, use_inotify=False) as watcher:
+            watcher.watch("config")
+            assert watcher.backend == "poll"
+            write_config(config, "modified")
+            wait_for(lambda: target().arg1 == "modified")
+
+    def test_inotify_reloads_modified_config(self, config):
+        """
+        Test the inotify backend publishes a new snapshot when the file is modified.
+        """
+        with ConfigWatcher() as watcher:
+            watcher.watch("config")
+            assert watcher.backend == "inotify"
+            (config.parent / "other.yaml").write_text("target: {}\n")
+            config.write_text("target:\n  arg1: modified\n")
+            wait_for(lambda: target().arg1 == "modified")
+
+    def test_parse_error_retains_snapshot(self, config, caplog):
+        """
+        Test the previous snapshot is retained if a modified file cannot be parsed.
+        """
+        watcher = ConfigWatcher(use_inotify=False)
+        watcher.watch("config")
+        config.write_text("target: [unbalanced\n")
+        watcher._reload(config, force=True)  # noqa: SLF001
+        assert target().arg1 == "initial"
+        assert "Unable to parse modified config file" in caplog.text
+        watcher.close()
+
+    def test_deleted_config_retains_snapshot(self, config):
+        """
+        Test the previous snapshot is retained if the file is deleted.
+        """
+        watcher = ConfigWatcher(use_inotify=False)
+        watcher.watch("config")
+        config.unlink()
+        watcher._reload(config)  # noqa: SLF001
+        assert watched_config("config") == {"target": {"arg1": "initial"}}
+        watcher.close()
+
+    def test_unchanged_config_not_reloaded(self, config):
+        """
+        Test an unchanged file is not parsed again, unless forced.
+        """
+        watcher = ConfigWatcher(use_inotify=False)
+        watcher.watch("config")
+        snapshot = watched_config("config")
+        watcher._reload(config)  # noqa: SLF001
+        assert watched_config("config") is snapshot
+        watcher._reload(config, force=True)  # noqa: SLF001
+        assert watched_config("config") is not snapshot
+        watcher.close()
+
+    def test_names_of_same_file(self, config):
+        """
+        Test a file watched using several config names is published for each.
+        """
+        watcher = ConfigWatcher(use_inotify=False)
+        watcher.watch("config")
+        watcher.watch("config")
+        watcher.watch(config)
+        write_config(config, "modified")
+        watcher._reload(config)  # noqa: SLF001
+        assert watched_config("config") == watched_config(config) == {"target": {"arg1": "modified"}}
+        watcher.unwatch("config")
+        assert watched_config(config) is not None
+        watcher.close()
+        assert watched_config(config) is None
+        watcher._reload(config, force=True)  # noqa: SLF001
+        assert watched_config(config) is None
+
+    def test_start_stop_idempotent(self, config):
+        """
+        Test start and stop may be called repeatedly, and files watched before start are watched.
+        """
+        watcher = ConfigWatcher()
+        watcher.watch("config")
+        watcher.stop()
+        watcher.start()
+        watcher.start()
+        assert watcher.backend == "inotify"
+        config.write_text("target:\n  arg1: modified\n")
+        wait_for(lambda: target().arg1 == "modified")
+        watcher.stop()
+        watcher.stop()
+        assert watcher.backend == "poll"
+        watcher.close()
+
+    def test_inotify_unavailable(self, config, monkeypatch):
+        """
+        Test polling is used if inotify is not available.
+        """
+
+        def unavailable():
+            raise OSError
+
+        monkeypatch.setattr(_watcher, "_Inotify", unavailable)
+        with ConfigWatcher(poll_interval=0.01) as watcher:
+            watcher.watch("config")
+            assert watcher.backend == "poll"
+            write_config(config, "modified")
+            wait_for(lambda: target().arg1 == "modified")
+
+
+class TestInotify:
+    """
+    Class to test the inotify binding.
+    """
+
+    def test_init_failure(self, monkeypatch):
+        """
+        Test an error from inotify_init1 raises OSError.
+        """
+
+        class Libc:
+            @staticmethod
+            def inotify_init1(flags):  # pylint: disable=unused-argument
+                return -1
+
+        monkeypatch.setattr(ctypes, "CDLL", lambda *args, **kwargs: Libc())
+        with pytest.raises(OSError, match="inotify_init1 failed"):
+            _Inotify()
+
+    def test_watches(self, tmp_path):
+        """
+        Test each directory is watched once, missing directories are ignored, and events are read.
+        """
+        inotify = _Inotify()
+        try:
+            inotify.add_watch(tmp_path)
+            inotify.add_watch(tmp_path)
+            inotify.add_watch(tmp_path / "missing")
+            assert inotify.read_paths() == set()
+            Path(tmp_path / "config.yaml").write_text("")
+            assert inotify.read_paths() == {tmp_path / "config.yaml"}
+        finally:
+            inotify.close()